@@ -0,0 +1,127 @@
+"""Frame-time benchmark for the game view renderers.
+
+Draws a synthetic frame shaped like draw_scene (scrolling grid, a HUD with
+changing text, targets, shot markers, a crosshair and a trail) through each
+backend's canvas-style view and reports per-frame times, including the
+backend's own present/repaint step.
+
+    python benchmarks/render_bench.py [--backend tk|pygame|both] [--frames N] [--targets N]
+
+Without a display the Tk backend is skipped and pygame uses SDL's dummy
+video driver.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.renderers import PYGAME, TK, PygameRenderer, TkRenderer  # noqa: E402
+
+
+def draw_frame(view, frame, width, height, targets):
+    """One synthetic frame; the camera pans so the grid and targets move every frame"""
+    pan_x = (frame * 3) % 90
+    pan_y = math.sin(frame / 30) * 20
+    for x in range(-90, width + 90, 90):
+        view.create_line(x - pan_x, 0, x - pan_x, height, fill="#353535", width=1, tags="grid")
+    for y in range(-90, height + 90, 90):
+        view.create_line(0, y + pan_y, width, y + pan_y, fill="#353535", width=1, tags="grid")
+
+    view.create_text(width // 2, 20, text=f"Hits: {frame // 7} | Misses: {frame // 23}",
+                     fill="#00ff00", font=("Arial", 20, "bold"), tags="hud")
+    view.create_text(width // 2, 50, text="Rolling 30s: 87% | 312 ms", fill="#aaaaaa",
+                     font=("Arial", 12), tags="hud")
+
+    for i in range(targets):
+        x = (i * 137 + frame * 2) % width
+        y = (i * 211) % (height - 100) + 50
+        if i % 2:
+            view.create_rectangle(x - 18, y - 18, x + 18, y + 18, fill="#8844ff", outline="#ffffff",
+                                  width=2, tags="target")
+        else:
+            view.create_oval(x - 18, y - 18, x + 18, y + 18, fill="#4488ff", outline="#ffffff",
+                             width=2, tags="target")
+        view.create_oval(x - 3, y - 3, x + 3, y + 3, fill="#ff4444", outline="", tags="marker")
+
+    cx, cy = width // 2, height // 2
+    view.create_line(cx - 10, cy, cx + 10, cy, fill="#00ff00", width=2, tags="crosshair")
+    view.create_line(cx, cy - 10, cx, cy + 10, fill="#00ff00", width=2, tags="crosshair")
+
+
+def run(renderer, frames, width, height, targets, pump=None):
+    """Per-frame times in ms for `frames` frames after a short warm-up"""
+    trail = renderer.view.create_line(0, 0, 0, 0, fill="#00ff88", width=3, tags=('trail', 'persistent'))
+    times = []
+    for frame in range(frames + 30):
+        start = time.perf_counter()
+        renderer.begin_frame()
+        draw_frame(renderer.view, frame, width, height, targets)
+        points = []
+        for k in range(20):
+            points += [width // 2 - k * 6, height // 2 + math.sin((frame + k) / 5) * 30]
+        renderer.view.coords(trail, points)
+        renderer.present()
+        if pump is not None:
+            pump()
+        if frame >= 30:
+            times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def report(name, times):
+    ordered = sorted(times)
+    count = len(ordered)
+
+    def pick(q):
+        return ordered[min(count - 1, int(count * q))]
+
+    print(f"{name:<8} avg {sum(ordered) / count:7.2f}  p50 {pick(0.50):7.2f}  "
+          f"p95 {pick(0.95):7.2f}  p99 {pick(0.99):7.2f}  max {ordered[-1]:7.2f}  ms "
+          f"({count} frames)")
+
+
+def bench_tk(args):
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"tk       skipped: {e}")
+        return
+    canvas = tk.Canvas(root, width=args.width, height=args.height, bg="#2a2a2a", highlightthickness=0)
+    canvas.pack()
+    root.update()
+    # update() is what makes Tk actually repaint the frame, so it is timed too
+    report(TK, run(TkRenderer(canvas), args.frames, args.width, args.height, args.targets, root.update))
+    root.destroy()
+
+
+def bench_pygame(args):
+    if not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    renderer = PygameRenderer(background="#2a2a2a")
+    renderer.attach(args.width, args.height)
+    times = run(renderer, args.frames, args.width, args.height, args.targets, renderer.poll_input)
+    report(PYGAME, times)
+    print(f"{'':<8} {renderer.sprite_misses} shape sprites rendered, {len(renderer.texts)} cached texts")
+    renderer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=[TK, PYGAME, "both"], default="both")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--targets", type=int, default=20)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+    if args.backend in (TK, "both"):
+        bench_tk(args)
+    if args.backend in (PYGAME, "both"):
+        bench_pygame(args)
+
+
+if __name__ == "__main__":
+    main()
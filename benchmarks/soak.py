@@ -0,0 +1,244 @@
+"""Long-session soak test for the game loop.
+
+Runs the real AimExercise frame loop and shot handling against a simulated
+clock and a scripted player for hours of game time. It tracks memory
+(tracemalloc and RSS), allocation hot spots and per-frame cost over time,
+and exits non-zero when memory or frame time grows past the budgets:
+
+    python benchmarks/soak.py [--hours 2] [--fps 60] [--shots-per-second 5]
+                              [--max-memory-growth-mb 16] [--max-frame-growth 1.25]
+
+The first reporting interval is warm-up and is used as the baseline for the
+budgets. Tk needs a display (use xvfb-run on a headless machine). Everything
+the session persists goes to a temporary AIM_WARMUP_HOME.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class SimClock:
+    """Game clock advanced by the harness instead of the wall"""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedMouse:
+    """Mouse position source for the frame loop, moved by the scripted player.
+
+    Reads as the last lock position plus this frame's movement, so camera
+    deltas are right whether or not the loop re-centres (it only does that
+    while the window has focus).
+    """
+
+    def __init__(self, exercise):
+        self.exercise = exercise
+        self.dx = 0
+        self.dy = 0
+
+    @property
+    def position(self):
+        return self.exercise.last_mouse_x + self.dx, self.exercise.last_mouse_y + self.dy
+
+    @position.setter
+    def position(self, value):
+        pass
+
+
+class ScriptedPlayer:
+    """Flicks toward the nearest target with some noise and fires at a fixed rate"""
+
+    def __init__(self, exercise, mouse, shots_per_second, seed=1):
+        self.exercise = exercise
+        self.mouse = mouse
+        self.shot_interval = 1.0 / shots_per_second
+        self.next_shot = 0.0
+        self.rng = random.Random(seed)
+
+    def step(self, now):
+        """Set this frame's mouse movement; returns True if the player fires this frame"""
+        exercise = self.exercise
+        target, _, _ = exercise.find_closest_target()
+        if target is None:
+            self.mouse.dx = self.mouse.dy = 0
+        else:
+            rng = self.rng
+            fraction = rng.uniform(0.15, 0.45)
+            dyaw = (target.yaw - exercise.yaw) * fraction + rng.gauss(0, 0.05)
+            dpitch = (target.pitch - exercise.pitch) * fraction + rng.gauss(0, 0.05)
+            self.mouse.dx = round(dyaw * exercise.h_counts_per_degree)
+            self.mouse.dy = round(-dpitch * exercise.v_counts_per_degree)
+        if now >= self.next_shot:
+            self.next_shot = now + self.shot_interval
+            return True
+        return False
+
+
+def rss_bytes():
+    """Current resident set size, or None where it can't be read cheaply"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def hot_spots(before, after, limit):
+    """Lines that allocated the most since `before`, as printable rows"""
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        tracemalloc.Filter(False, "<unknown>")
+    ]
+    diffs = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'lineno')
+    return [f"{stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocks  {stat.traceback}"
+            for stat in diffs[:limit]]
+
+
+def run(args):
+    import tkinter as tk
+    from src.aim_exercises import AimExercise
+    from src.stats_tracker import StatsTracker
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise SystemExit(f"soak: Tk needs a display ({e}); try xvfb-run")
+    root.withdraw()
+    width, height = 1920, 1080
+    stats = StatsTracker()
+    exercise = AimExercise(root, stats, width, height)
+    clock = SimClock()
+    exercise.clock = clock
+    mouse = ScriptedMouse(exercise)
+    exercise.mouse = mouse
+    exercise.set_mode(args.mode)
+    player = ScriptedPlayer(exercise, mouse, args.shots_per_second, args.seed)
+
+    tracemalloc.start(args.traceback_depth)
+    exercise.start_exercise()
+    exercise.cancel_frame()
+
+    dt = 1.0 / args.fps
+    frames_per_interval = max(1, int(args.interval * 60 * args.fps))
+    total_frames = int(args.hours * 3600 * args.fps)
+    intervals = []
+    frame_times = []
+    baseline_snapshot = None
+    print(f"{'sim min':>8} {'traced MiB':>11} {'peak MiB':>9} {'RSS MiB':>8} "
+          f"{'frame avg':>10} {'p95':>7} {'p99':>7} {'shots':>7} {'path':>6}")
+    wall_start = time.perf_counter()
+    for frame in range(1, total_frames + 1):
+        clock.now += dt
+        fire = player.step(clock.now)
+        start = time.perf_counter()
+        exercise.lock_mouse_loop()
+        exercise.cancel_frame()  # The harness drives frames; drop the loop's own reschedule
+        if fire:
+            exercise.on_shoot(None)
+        frame_times.append((time.perf_counter() - start) * 1000)
+        if frame % 600 == 0:
+            root.update()  # Let Tk process its queue as it would between frames
+
+        if frame % frames_per_interval == 0:
+            ordered = sorted(frame_times)
+            frame_times = []
+            traced, peak = tracemalloc.get_traced_memory()
+            rss = rss_bytes()
+            row = {
+                'minutes': frame * dt / 60,
+                'traced': traced,
+                'peak': peak,
+                'rss': rss,
+                'avg': sum(ordered) / len(ordered),
+                'p95': percentile(ordered, 0.95),
+                'p99': percentile(ordered, 0.99),
+                'shots': stats.hits + stats.misses,
+                'path': len(exercise.path_points)
+            }
+            intervals.append(row)
+            rss_text = f"{rss / 2**20:8.1f}" if rss is not None else f"{'n/a':>8}"
+            print(f"{row['minutes']:8.1f} {traced / 2**20:11.2f} {peak / 2**20:9.2f} {rss_text} "
+                  f"{row['avg']:10.3f} {row['p95']:7.3f} {row['p99']:7.3f} {row['shots']:7d} "
+                  f"{row['path']:6d}", flush=True)
+            if len(intervals) == 1:
+                baseline_snapshot = tracemalloc.take_snapshot()
+
+    final_snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    exercise.stop_exercise()
+    exercise.cleanup()
+    root.destroy()
+    print(f"\n{total_frames} frames ({args.hours:g} simulated hours) in "
+          f"{time.perf_counter() - wall_start:.0f} s wall time")
+
+    if len(intervals) < 2:
+        print("Too short for a regression check: need at least two intervals")
+        return 0
+    if baseline_snapshot is not None:
+        print("\nTop allocation growth since warm-up:")
+        for line in hot_spots(baseline_snapshot, final_snapshot, args.top):
+            print(f"  {line}")
+
+    baseline, last = intervals[0], intervals[-1]
+    failures = []
+    growth_mb = (last['traced'] - baseline['traced']) / 2**20
+    if growth_mb > args.max_memory_growth_mb:
+        failures.append(f"traced memory grew {growth_mb:.2f} MiB "
+                        f"(budget {args.max_memory_growth_mb:g} MiB)")
+    # Small absolute slack so sub-millisecond noise can't fail the run
+    frame_budget = baseline['p95'] * args.max_frame_growth + 0.25
+    if last['p95'] > frame_budget:
+        failures.append(f"p95 frame time grew {baseline['p95']:.3f} -> {last['p95']:.3f} ms "
+                        f"(budget {frame_budget:.3f} ms)")
+    print()
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        return 1
+    print(f"PASS: memory {growth_mb:+.2f} MiB, p95 frame {baseline['p95']:.3f} -> {last['p95']:.3f} ms")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=2.0, help="simulated session length")
+    parser.add_argument("--fps", type=int, default=60, help="simulated frames per second")
+    parser.add_argument("--shots-per-second", type=float, default=5.0)
+    parser.add_argument("--mode", default="random", help="game mode to soak")
+    parser.add_argument("--interval", type=float, default=10.0, help="simulated minutes per report row")
+    parser.add_argument("--max-memory-growth-mb", type=float, default=16.0)
+    parser.add_argument("--max-frame-growth", type=float, default=1.25,
+                        help="allowed p95 frame time ratio, last interval vs warm-up")
+    parser.add_argument("--traceback-depth", type=int, default=1)
+    parser.add_argument("--top", type=int, default=10, help="allocation hot spots to list")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # Keep the session's files out of the real data directory, and stay quiet
+    os.environ['AIM_WARMUP_HOME'] = tempfile.mkdtemp(prefix="aim-warmup-soak-")
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    sys.exit(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,72 @@
-import tkinter as tk
-from src.hotkey_manager import HotkeyManager
-from src.aim_exercises import AimExercise
-from src.stats_tracker import StatsTracker
+import argparse
+import threading
+from src.profiler import startup_timer
+
+# NumPy backs the target store, trail, projection and tuner models but takes
+# ~100 ms to import; the app modules import it lazily, so load it on a side
+# thread while tkinter and the Tk root come up
+threading.Thread(target=__import__, args=('numpy',), name="preload-numpy", daemon=True).start()
+
+with startup_timer.phase("import tkinter"):
+    import tkinter as tk
+with startup_timer.phase("import app modules"):
+    from src.aim_exercises import AimExercise
+    from src.stats_tracker import StatsTracker
 
 class AimWarmupApp:
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("Aim Warmup")
+    def __init__(self, latency_udp_port=None, profile_startup=False, startup_budget_ms=None,
+                 audio_buffer=512, hotkey_bindings=None, projection='linear',
+                 archive_paths=False, log_shots=False, renderer='tk',
+                 metrics_port=None, checkpoint_interval=10.0, resume=False,
+                 experiment_metric='accuracy', experiment_sens=None, profile='default'):
+        with startup_timer.phase("create Tk root"):
+            self.root = tk.Tk()
+            self.root.title("Aim Warmup")
         
-        # Fullscreen windowed mode
-        self.root.attributes('-fullscreen', True)
-        self.root.configure(bg="#1a1a1a")
+            # Fullscreen windowed mode
+            self.root.attributes('-fullscreen', True)
+            self.root.configure(bg="#1a1a1a")
         
         # Get screen dimensions
         self.screen_width = self.root.winfo_screenwidth()
         self.screen_height = self.root.winfo_screenheight()
         
         # Initialize components
-        self.stats = StatsTracker()
-        self.aim_exercise = AimExercise(
-            self.root, 
-            self.stats, 
-            self.screen_width, 
-            self.screen_height,
-            h_dpi=1000,
-            h_cm_per_360=31.058,
-            v_dpi=1000,
-            v_cm_per_360=31.058
-        )
-        
-        # Setup hotkey (Ctrl+Shift+A to toggle)
-        self.hotkey_manager = HotkeyManager(self.toggle_window)
+        with startup_timer.phase("create AimExercise"):
+            self.stats = StatsTracker()
+            self.aim_exercise = AimExercise(
+                self.root,
+                self.stats,
+                self.screen_width,
+                self.screen_height,
+                h_dpi=1000,
+                h_cm_per_360=31.058,
+                v_dpi=1000,
+                v_cm_per_360=31.058,
+                audio_buffer=audio_buffer,
+                projection=projection,
+                archive_paths=archive_paths,
+                log_shots=log_shots,
+                renderer=renderer,
+                metrics_port=metrics_port,
+                checkpoint_interval=checkpoint_interval,
+                resume=resume,
+                experiment_metric=experiment_metric,
+                experiment_sens=experiment_sens,
+                profile=profile
+            )
+        
+        # Let an external photodiode/stand-in report frame presentation times
+        if latency_udp_port is not None:
+            self.aim_exercise.latency.listen_udp(latency_udp_port, self.aim_exercise.services)
+        
+        # Hotkey (Ctrl+Shift+A to toggle) is set up once the UI is on screen,
+        # so the pynput import stays off the cold-start path
+        self.hotkey_manager = None
+        self.hotkey_bindings = hotkey_bindings
+        self.profile_startup = profile_startup
+        self.startup_budget_ms = startup_budget_ms
+        self.root.after_idle(self.on_first_idle)
         
         # Start visible for testing
         self.is_visible = True
@@ -43,27 +79,208 @@ class AimWarmupApp:
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
+    def on_first_idle(self):
+        """Finish deferred start-up work once the first frame of UI is up"""
+        if self.profile_startup:
+            for line in startup_timer.report_lines(self.startup_budget_ms):
+                print(line)
+        
+        with startup_timer.phase("start hotkey listener"):
+            from src.hotkey_manager import HotkeyManager
+            self.hotkey_manager = HotkeyManager(
+                {'toggle_window': self.toggle_window},
+                self.hotkey_bindings,
+                waker=self.wake_for_hotkey
+            ).start()
+        
+        # Hotkeys are matched on the listener thread but always run here on the
+        # Tk thread: every game frame drains them, and otherwise the listener
+        # posts a <<Hotkey>> event per match, so nothing polls while hidden
+        self.root.bind('<<Hotkey>>', lambda event: self.hotkey_manager.dispatch_pending())
+        self.aim_exercise.frame_callbacks.append(self.hotkey_manager.dispatch_pending)
+        self.aim_exercise.latency_reporters.append(self.hotkey_manager.latency_lines)
+        
+        if self.profile_startup:
+            label, _, duration = startup_timer.phases[-1]
+            print(f"  (deferred) {label}: {duration * 1000:.1f} ms")
+            self.report_sound_load()
+        
+    def wake_for_hotkey(self):
+        """Have the Tk thread run a matched hotkey; called from the listener thread"""
+        try:
+            self.root.event_generate('<<Hotkey>>', when='tail')
+        except (RuntimeError, tk.TclError):
+            pass  # Window already closed
+        
+    def report_sound_load(self):
+        """Print how long background sound loading took once it finishes"""
+        sound_bank = self.aim_exercise.sound_bank
+        if not sound_bank.ready.is_set():
+            self.root.after(50, self.report_sound_load)
+            return
+        source = f"{sound_bank.cache_hits}/{len(sound_bank.sounds)} from WAV cache" if sound_bank.enabled else "disabled"
+        print(f"  (background) sound bank ready: {sound_bank.load_seconds * 1000:.1f} ms ({source})")
+        
     def toggle_window(self):
         """Toggle window visibility"""
         if self.is_visible:
             self.root.withdraw()  # Hide
             self.is_visible = False
+            self.aim_exercise.suspend('hidden')
         else:
             self.root.deiconify()  # Show
             self.root.lift()
             self.root.focus_force()
             self.is_visible = True
-            
+            self.aim_exercise.resume('hidden')
+        
     def on_close(self):
         """Clean up and close"""
         self.aim_exercise.cleanup()
-        self.hotkey_manager.stop()
+        if self.hotkey_manager is not None:
+            self.hotkey_manager.stop()
         self.root.destroy()
         
     def run(self):
         """Start the application"""
         self.root.mainloop()
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Aim Warmup")
+    parser.add_argument(
+        "--latency-udp-port",
+        type=int,
+        default=None,
+        help="listen on this localhost UDP port for frame presentation reports (latency mode, F5)"
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print a start-up timing breakdown once the UI is idle"
+    )
+    parser.add_argument(
+        "--startup-budget-ms",
+        type=float,
+        default=None,
+        help="cold-start budget to check the --profile-startup total against"
+    )
+    parser.add_argument(
+        "--audio-buffer",
+        type=int,
+        default=512,
+        help="mixer buffer size in samples; smaller lowers click-to-audio latency (try 256 or 128)"
+    )
+    parser.add_argument(
+        "--hotkey",
+        action="append",
+        metavar="ACTION=COMBO",
+        help="bind a global hotkey, e.g. toggle_window=ctrl+shift+a (repeat to add bindings)"
+    )
+    parser.add_argument(
+        "--projection",
+        choices=["linear", "rectilinear"],
+        default="linear",
+        help="world-to-screen mapping; rectilinear matches game engines at high FOV"
+    )
+    parser.add_argument(
+        "--archive-paths",
+        action="store_true",
+        help="save compressed approach paths of every shot to the data directory for re-analysis"
+    )
+    parser.add_argument(
+        "--log-shots",
+        action="store_true",
+        help="append every shot and expired target to shots.jsonl in the data directory"
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=["tk", "pygame"],
+        default="tk",
+        help="game view backend: the Tk canvas, or pygame software rendering with dirty-rect updates"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="serve live stats on http://127.0.0.1:PORT (Prometheus /metrics, /metrics.json, SSE /events)"
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=10.0,
+        metavar="SECONDS",
+        help="how often to checkpoint the running session for crash-resume (0 disables)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="resume the session saved in the last checkpoint on startup"
+    )
+    parser.add_argument(
+        "--experiment-metric",
+        choices=["accuracy", "precision", "reaction"],
+        default="accuracy",
+        help="what the sensitivity A/B experiment (E) compares the candidates on"
+    )
+    parser.add_argument(
+        "--experiment-sens",
+        nargs="+",
+        metavar="X[:Y]",
+        help="candidate sensitivities for the A/B experiment (default: live setting and +/-0.5)"
+    )
+    parser.add_argument(
+        "--profile",
+        default="default",
+        metavar="NAME",
+        help="player profile whose auto-tuner history warm-starts the forecast (saved in the data directory)"
+    )
+    return parser.parse_args()
+
+def parse_experiment_sens(specs):
+    """Turn X[:Y] arguments into (x, y) candidate pairs (None = derive from the live setting)"""
+    if not specs:
+        return None
+    candidates = []
+    for spec in specs:
+        x, _, y = spec.partition(':')
+        try:
+            candidates.append((float(x), float(y or x)))
+        except ValueError:
+            raise SystemExit(f"Invalid --experiment-sens '{spec}', expected X or X:Y")
+    if len(candidates) < 2:
+        raise SystemExit("--experiment-sens needs at least two candidates")
+    return candidates
+
+def parse_hotkey_bindings(specs):
+    """Turn repeated ACTION=COMBO arguments into a bindings dict (None = defaults)"""
+    if not specs:
+        return None
+    bindings = {}
+    for spec in specs:
+        action, sep, combo = spec.partition('=')
+        if not sep or not combo:
+            raise SystemExit(f"Invalid --hotkey '{spec}', expected ACTION=COMBO")
+        bindings.setdefault(action.strip(), []).append(combo.strip())
+    return bindings
+
 if __name__ == "__main__":
-    app = AimWarmupApp()
+    args = parse_args()
+    app = AimWarmupApp(
+        latency_udp_port=args.latency_udp_port,
+        profile_startup=args.profile_startup,
+        startup_budget_ms=args.startup_budget_ms,
+        audio_buffer=args.audio_buffer,
+        hotkey_bindings=parse_hotkey_bindings(args.hotkey),
+        projection=args.projection,
+        archive_paths=args.archive_paths,
+        log_shots=args.log_shots,
+        renderer=args.renderer,
+        metrics_port=args.metrics_port,
+        checkpoint_interval=args.checkpoint_interval,
+        resume=args.resume,
+        experiment_metric=args.experiment_metric,
+        experiment_sens=parse_experiment_sens(args.experiment_sens),
+        profile=args.profile
+    )
     app.run()
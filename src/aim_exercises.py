@@ -1,25 +1,42 @@
 import tkinter as tk
+import os
 import random
 import time
 import math
 from collections import deque
-from pynput.mouse import Controller as MouseController
-
-# Try to import pygame for sound effects
-try:
-    import pygame
-    pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=512)
-    SOUND_ENABLED = True
-except ImportError:
-    SOUND_ENABLED = False
-    print("pygame not found - sounds disabled. Install with: pip install pygame")
+from src import shot_analysis
+from src import checkpoint
+from src.click_timing import CameraHistory, ClickTimer
+from src.crosshair import CrosshairCache, load_custom_crosshairs
+from src.events import EXPIRE, HIT, MISS, EventBus, JsonlShotLog, ShotEvent
+from src.heatmap import ShotHeatmap
+from src.latency import LatencyMonitor
+from src.metrics_server import MetricsServer
+from src.modes import MODES
+from src.path_codec import PathArchive
+from src.profiler import FrameProfiler, startup_timer
+from src.projection import LINEAR, Projection
+from src.renderers import TK, create_renderer
+from src.sens_bandit import SensBandit, profile_path
+from src.sens_experiment import ACCURACY, SensExperiment
+from src.services import ServiceLoop
+from src.sounds import SoundBank
+from src.stats_tracker import RunningMean
+from src.storage import data_dir
+from src.targets import ALIVE, FROZEN, TargetStore
+from src.tracking import TrackingMetrics
+from src.trail import TrailBuffer, TrailRenderer
 
 class AimExercise:
     def __init__(self, root, stats_tracker, screen_width, screen_height, 
                  h_dpi=1000, h_cm_per_360=31.058,
-                 v_dpi=1000, v_cm_per_360=31.058):
+                 v_dpi=1000, v_cm_per_360=31.058, audio_buffer=512,
+                 projection=LINEAR, archive_paths=False, log_shots=False,
+                 renderer=TK, metrics_port=None, checkpoint_interval=10.0, resume=False,
+                 experiment_metric=ACCURACY, experiment_sens=None, profile='default'):
         self.root = root
         self.stats = stats_tracker
+        self.clock = time.time  # Game clock; the soak test swaps in simulated time
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.target_size = 35  # Base target size (at spawn)
@@ -49,12 +66,24 @@ class AimExercise:
         self.yaw = 0.0
         self.pitch = 0.0
         
-        # Multiple targets - list of {yaw, pitch, spawn_time}
-        self.targets = []
-        self.num_targets = 3  # Number of simultaneous targets
+        # Multiple targets - struct-of-arrays store of yaw/pitch/spawn/size/state
+        self.targets = TargetStore()
         
-        # Game mode (only random targets mode exists)
+        # Game mode (see src.modes.MODES); the spawn policy is built per session
         self.game_mode = 'random'
+        self.mode = MODES[self.game_mode]
+        self.num_targets = self.mode['targets']  # Number of simultaneous targets
+        self.spawn_policy = None
+        self.spawn_backlog = 0  # Targets the spawn policy had no room for (a full grid)
+        import numpy as np
+        self.rng = np.random.default_rng()
+        self.score = 0
+        
+        # Tracking modes: target motion (built per session) and continuous error metrics
+        self.motion = None
+        self.tracking = TrackingMetrics()
+        self.last_motion_time = 0.0
+        self.motion_max_dt = 0.05  # Cap one kinematics step so hitches don't teleport targets
         
         # Streak tracking
         self.current_streak = 0
@@ -94,6 +123,20 @@ class AimExercise:
         # Forecast "perfect settings" (continuous, always displayed)
         self.forecast_x = self.default_x_sens
         self.forecast_y = self.default_y_sens
+        # Per-profile model of the best sens learned over earlier sessions;
+        # each session starts from one Thompson draw of it (None = no history)
+        self.sens_model_path = profile_path(profile)
+        self.sens_model = SensBandit.load(self.sens_model_path)
+        self.sens_prior = None
+
+        # --- Sequential A/B test of candidate sensitivities, toggled with the E key ---
+        # Candidates are (x, y) pairs; None = the live setting and one
+        # experiment_step either side of it
+        self.experiment = None
+        self.experiment_metric = experiment_metric
+        self.experiment_sens = experiment_sens
+        self.experiment_step = 0.5
+        self.experiment_baseline = None  # Setting to restore if a test is abandoned
 
         # Session timer (counts up while active and focused)
         self.session_timer = 0.0  # Total elapsed time in seconds
@@ -102,12 +145,17 @@ class AimExercise:
         # Track if mouse was locked before losing focus
         self.mouse_was_locked = False
         
-        # Focus tracking for pausing targets
-        self.focus_lost_time = 0  # When focus was lost
-        self.total_unfocused_time = 0  # Accumulated unfocused time since session start
-        
-        # Crosshair trail for tracking visualization
-        self.trail_points = []  # List of (yaw, pitch, timestamp)
+        # Suspension: while the window is hidden or unfocused the frame loop is
+        # stopped entirely (no timers, redraws or tuner work)
+        self.suspend_reasons = set()  # e.g. {'hidden', 'unfocused'}
+        self.suspended_at = 0  # When the running session was suspended (0 = running)
+        self.total_unfocused_time = 0  # Accumulated suspended time since session start
+        self.frame_after_id = None  # Pending Tk timer for the next frame
+        
+        # Crosshair trail for tracking visualization (F6 toggles)
+        self.trail = TrailBuffer(capacity=128)  # Ring buffer of (yaw, pitch, timestamp)
+        self.trail_renderer = None  # Created with the canvas in setup_ui
+        self.trail_enabled = True
         self.trail_fade_time = 0.5  # Seconds before trail fades completely
         self.last_trail_time = 0  # Track when we last added a trail point
         
@@ -115,16 +163,18 @@ class AimExercise:
         self.last_hit_yaw = 0.0  # Position where last target was hit
         self.last_hit_pitch = 0.0
         self.path_points = []  # List of (yaw, pitch) points during movement
-        self.path_efficiencies = []  # List of efficiency percentages for averaging
-        self.x_efficiencies = []  # X-axis (yaw) efficiency percentages
-        self.y_efficiencies = []  # Y-axis (pitch) efficiency percentages
+        self.max_path_points = 3000  # ~30 s of samples; older points are thinned beyond this
+        self.path_thinned = False  # Thinning shortens the measured path, so its efficiency is skipped
+        self.path_efficiencies = RunningMean()  # Running mean of path efficiency percentages
+        self.x_efficiencies = RunningMean()  # Running mean of X-axis (yaw) efficiency percentages
+        self.y_efficiencies = RunningMean()  # Running mean of Y-axis (pitch) efficiency percentages
         self.has_last_hit = False  # Whether we have a previous hit to measure from
         
         # Final approach analysis tracking
-        self.x_overshoots = []  # List of X overshoot counts per target
-        self.y_overshoots = []  # List of Y overshoot counts per target
-        self.x_micro_adjustments = []  # List of X micro-adjustment counts
-        self.y_micro_adjustments = []  # List of Y micro-adjustment counts
+        self.x_overshoots = RunningMean()  # Per-target X overshoot flags (mean = overshoot rate)
+        self.y_overshoots = RunningMean()  # Per-target Y overshoot flags (mean = overshoot rate)
+        self.x_micro_adjustments = RunningMean()  # Running mean of X micro-adjustment counts
+        self.y_micro_adjustments = RunningMean()  # Running mean of Y micro-adjustment counts
         self.approach_analysis_window = 1.0  # Analyze entire path (100%)
         
         # Last shot analysis
@@ -146,6 +196,51 @@ class AimExercise:
         self.last_shot_analysis = None  # Stores the most recent shot's approach data
         self.last_shot_was_hit = False  # Whether last shot was a hit or miss
         
+        # Post-shot analysis runs on a worker thread; results are applied from
+        # the frame loop. The generation tags jobs so stale results from a reset
+        # session are dropped.
+        self.analysis_worker = shot_analysis.AnalysisWorker()
+        # Optionally keep compressed copies of every approach path (--archive-paths)
+        self.archive_paths = archive_paths
+        self.path_archive = PathArchive()
+        self.last_archive_path = None
+        self.report_task = None  # Session report being built (F7)
+        
+        # Shot dispersion heatmaps (target-relative); lifetime is loaded on first save
+        self.session_heatmap = ShotHeatmap()
+        self.lifetime_heatmap = None
+        self.heatmap_images = {}  # label -> (heatmap version, PhotoImage)
+        
+        # Background services (shot log, checkpoints, metrics, reports) run as
+        # tasks on an asyncio loop in a sidecar thread; the Tk thread only
+        # hands them work. Their UI callbacks arrive as a <<ServiceCallbacks>>
+        # event posted when one is queued, so no timer runs while idle.
+        self.services = ServiceLoop(tk_waker=self.wake_for_services).start()
+        self.root.bind('<<ServiceCallbacks>>', lambda event: self.services.dispatch_tk())
+        
+        # Every shot and expiry is published here. Gameplay state updates run
+        # inline; slow consumers (the --log-shots file) get batches off-thread.
+        self.shot_events = EventBus(self.services)
+        self.shot_events.subscribe(self.on_shot_stats)
+        self.shot_events.subscribe(self.on_shot_score)
+        self.shot_events.subscribe(self.on_shot_sound)
+        self.shot_events.subscribe(self.on_shot_heatmap)
+        self.shot_events.subscribe(self.on_shot_experiment)
+        if log_shots:
+            os.makedirs(data_dir(), exist_ok=True)
+            self.shot_events.subscribe_async(JsonlShotLog(os.path.join(data_dir(), 'shots.jsonl')))
+        self.analysis_generation = 0
+        
+        # Frame-time instrumentation (F3 = overlay, F4 = export Chrome trace)
+        self.profiler = FrameProfiler()
+        
+        # Input-to-draw/photon latency measurement mode (F5)
+        self.latency = LatencyMonitor()
+        
+        # Callables run at the start of every frame on the Tk thread (e.g. the
+        # global hotkey dispatcher)
+        self.frame_callbacks = []
+        
         # Crosshair styles
         self.crosshair_styles = {
             0: {'name': 'None', 'type': 'none', 'outline': False},
@@ -156,6 +251,9 @@ class AimExercise:
             5: {'name': 'Circle', 'type': 'circle', 'outline': False},
             6: {'name': 'Circle+', 'type': 'circle', 'outline': True}
         }
+        # User-defined shapes from crosshairs.json get the following numbers
+        for style in load_custom_crosshairs(os.path.join(data_dir(), 'crosshairs.json')):
+            self.crosshair_styles[len(self.crosshair_styles)] = style
         self.current_crosshair = 0  # Default to no crosshair
         self.crosshair_color = "#39ff14"  # Neon green
         self.crosshair_outline_color = "#ff0000"  # Red outline
@@ -164,32 +262,59 @@ class AimExercise:
         self.crosshair_outline_thickness = 1  # Outline thickness
         
         # Hit precision tracking (how close to center)
-        self.hit_precisions = []  # List of precision percentages (100% = center)
+        self.hit_precisions = RunningMean()  # Running mean of precision percentages (100% = center)
         
         # Scoped sensitivity (activated by holding right-click)
         self.scoped_sens_percent = 49.9  # % of base sensitivity when scoped (like Fortnite ADS)
         self.scoped_active = False  # Whether right-click is held
         
-        # Mouse controller
-        self.mouse = MouseController()
+        # Mouse controller (pynput is imported on first start, see start_exercise)
+        self.mouse = None
         self.center_x = screen_width // 2
         self.center_y = screen_height // 2
         
         # FOV settings for projection
         self.fov = 105  # Field of view in degrees
         self.pixels_per_degree = screen_width / self.fov
-        
-        # Generate sound effects
-        self.sounds = {}
-        if SOUND_ENABLED:
-            try:
-                self.generate_sounds()
-            except Exception as e:
-                print(f"Sound generation failed: {e} - sounds disabled")
-                self.sounds = {}
+        self.projection = Projection(screen_width, self.fov, projection)
+        self.renderer_name = renderer  # Game view backend, created in setup_ui
+        
+        # Load sound effects in the background (cached WAV, synthesised on a miss)
+        self.sound_bank = SoundBank(buffer=audio_buffer)
+        with startup_timer.phase("start sound loader"):
+            self.sound_bank.load_async()
+        
+        # Extra latency summaries shown alongside input->draw in latency mode
+        self.latency_reporters = [self.sound_bank.latency_lines]
+        
+        # Recent camera poses and OS-level click times, so shots are scored
+        # where the crosshair was when the button went down
+        self.camera_history = CameraHistory()
+        self.click_timer = ClickTimer()
+        self.latency_reporters.append(self.click_timer.latency_lines)
+        
+        # Optional live stats for external dashboards (--metrics-port); the
+        # frame loop publishes a snapshot that server connections only read
+        self.metrics = None
+        self.last_metrics_frame_ns = 0
+        if metrics_port is not None:
+            self.metrics = MetricsServer(metrics_port, self.services)
+            if not self.metrics.start():
+                self.metrics = None
+        
+        # Periodic session checkpoints for crash-resume (0 = off); written
+        # on the service loop and removed when a session ends normally
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_path = os.path.join(data_dir(), 'checkpoint.json')
+        self.checkpoint_writer = checkpoint.CheckpointWriter(self.checkpoint_path, self.services)
+        self.last_checkpoint_time = 0.0
         
         # Create UI
-        self.setup_ui()
+        with startup_timer.phase("build UI"):
+            self.setup_ui()
+        
+        if resume:
+            self.root.after_idle(self.resume_session)
     
     def apply_sensitivity(self, x_fn_sens=None, y_fn_sens=None):
         """Apply sensitivity setting using Fortnite sensitivity percentages"""
@@ -276,57 +401,17 @@ class AimExercise:
             self.scoped_sens_var.set("49.9")
             self.scoped_sens_percent = 49.9
     
-    def generate_sounds(self):
-        """Generate procedural sound effects"""
-        import numpy as np
-        import struct
-        
-        sample_rate = 22050
-        
-        def make_sound_from_wave(wave_data):
-            """Convert numpy wave to pygame Sound using bytes"""
-            # Normalize and convert to 16-bit signed integers
-            wave_int = (wave_data * 32767).astype(np.int16)
-            # Convert to bytes
-            raw_bytes = wave_int.tobytes()
-            # Create sound from buffer
-            return pygame.mixer.Sound(buffer=raw_bytes)
-        
-        # Fire sound - short click/pop
-        duration = 0.05
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        fire_wave = np.sin(2 * np.pi * 800 * t) * np.exp(-t * 60) * 0.5
-        self.sounds['fire'] = make_sound_from_wave(fire_wave)
-        self.sounds['fire'].set_volume(0.3)
-        
-        # Hit sound - soft thump (lower frequencies, no high harmonics)
-        duration = 0.12
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        # Lower base frequency with quick decay for a soft "thud"
-        hit_wave = np.sin(2 * np.pi * 250 * t) + 0.5 * np.sin(2 * np.pi * 150 * t)
-        hit_wave = hit_wave * np.exp(-t * 35) * 0.4
-        self.sounds['hit'] = make_sound_from_wave(hit_wave)
-        self.sounds['hit'].set_volume(0.4)
-        
-        # Miss/expire sound - descending tone
-        duration = 0.2
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        freq = 400 - 200 * t / duration  # Descending from 400 to 200 Hz
-        miss_wave = np.sin(2 * np.pi * freq * t) * np.exp(-t * 10) * 0.3
-        self.sounds['miss'] = make_sound_from_wave(miss_wave)
-        self.sounds['miss'].set_volume(0.3)
-    
-    def play_sound(self, sound_name):
+    def play_sound(self, sound_name, event_ns=None):
         """Play a sound effect (only when game has focus)"""
-        if SOUND_ENABLED and sound_name in self.sounds and self.mouse_locked:
-            self.sounds[sound_name].play()
+        if self.mouse_locked:
+            self.sound_bank.play(sound_name, event_ns)
     
     def setup_ui(self):
         """Setup the exercise UI"""
         # Title
         self.title = tk.Label(
             self.root,
-            text="Random Targets Mode",
+            text=self.mode['title'],
             font=("Arial", 20, "bold"),
             bg="#1a1a1a",
             fg="#ffffff"
@@ -363,6 +448,21 @@ class AimExercise:
         )
         self.stop_btn.pack(side=tk.LEFT, padx=10)
         
+        # Offered when the last session didn't end normally (see resume_session)
+        self.resume_btn = tk.Button(
+            self.button_frame,
+            text="RESUME",
+            command=self.resume_session,
+            font=("Arial", 12, "bold"),
+            bg="#0077aa",
+            fg="white",
+            width=10,
+            height=1,
+            relief=tk.FLAT
+        )
+        if os.path.exists(self.checkpoint_path):
+            self.resume_btn.pack(side=tk.LEFT, padx=10)
+        
         self.reset_btn = tk.Button(
             self.button_frame,
             text="RESET STATS",
@@ -598,10 +698,37 @@ class AimExercise:
             btn.pack(side=tk.LEFT, padx=3)
             self.crosshair_buttons[style_num] = btn
         
+        # Mode select buttons frame
+        self.mode_frame = tk.Frame(self.root, bg="#1a1a1a")
+        self.mode_label = tk.Label(
+            self.mode_frame,
+            text="Mode:",
+            font=("Arial", 11),
+            bg="#1a1a1a",
+            fg="#aaaaaa"
+        )
+        self.mode_label.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.mode_buttons = {}
+        for mode_name, mode in MODES.items():
+            btn = tk.Button(
+                self.mode_frame,
+                text=mode['name'],
+                command=lambda m=mode_name: self.set_mode(m),
+                font=("Arial", 11, "bold"),
+                bg="#00aa00" if mode_name == self.game_mode else "#444444",
+                fg="white",
+                width=9,
+                height=1,
+                relief=tk.FLAT
+            )
+            btn.pack(side=tk.LEFT, padx=3)
+            self.mode_buttons[mode_name] = btn
+        
         # Stats display
         self.stats_label = tk.Label(
             self.root,
-            text="Press START to begin | T = toggle auto-tune | ESC to exit",
+            text="Press START to begin | T = toggle auto-tune | E = sens A/B | F3 = profiler | F6 = trail | F7 = report | ESC to exit",
             font=("Arial", 14),
             bg="#1a1a1a",
             fg="#00ff00"
@@ -618,6 +745,13 @@ class AimExercise:
         )
         self.canvas.bind("<Button-1>", self.on_shoot)
         
+        # The game view is drawn through the selected backend (--renderer);
+        # the Tk canvas itself stays in use for the menu and results screens
+        self.renderer = create_renderer(self.renderer_name, self.canvas)
+        self.view = self.renderer.view
+        self.trail_renderer = TrailRenderer(self.view)
+        self.crosshair_cache = CrosshairCache(self.view)
+        
         # Bind right-click for scoped sensitivity
         self.canvas.bind("<Button-3>", self.on_scope_press)
         self.canvas.bind("<ButtonRelease-3>", self.on_scope_release)
@@ -630,9 +764,27 @@ class AimExercise:
         self.root.bind("<t>", lambda e: self.toggle_auto_tune())
         self.root.bind("<T>", lambda e: self.toggle_auto_tune())
 
-        # Show the control widgets directly (only one mode exists, so there is
-        # no mode-select screen to gate them behind)
+        # Bind E to start/abandon a sensitivity A/B experiment
+        self.root.bind("<e>", lambda e: self.toggle_experiment())
+        self.root.bind("<E>", lambda e: self.toggle_experiment())
+
+        # Bind F3/F4 to the frame profiler overlay and trace export
+        self.root.bind("<F3>", lambda e: self.toggle_profiler_overlay())
+        self.root.bind("<F4>", lambda e: self.export_profiler_trace())
+
+        # Bind F5 to latency measurement mode
+        self.root.bind("<F5>", lambda e: self.toggle_latency_mode())
+
+        # Bind F6 to the crosshair trail
+        self.root.bind("<F6>", lambda e: self.toggle_trail())
+
+        # Bind F7 to building the report for the last archived session
+        self.root.bind("<F7>", lambda e: self.generate_report())
+
+        # Show the control widgets directly (the mode is picked with the mode
+        # buttons rather than a separate mode-select screen)
         self.button_frame.pack(pady=10)
+        self.mode_frame.pack(pady=5)
         self.sens_frame.pack(pady=5)
         self.crosshair_frame.pack(pady=5)
         self.stats_label.pack(pady=5)
@@ -644,6 +796,23 @@ class AimExercise:
         # Apply initial sensitivity from entry field values
         self.apply_custom_sensitivity()
     
+    def set_mode(self, mode_name):
+        """Select the game mode used by the next START"""
+        if self.is_active:
+            return
+        
+        self.game_mode = mode_name
+        self.mode = MODES[mode_name]
+        self.num_targets = self.mode['targets']
+        self.target_size = self.mode['size']
+        # Targets that never expire still fade purple -> blue over 3 seconds
+        self.target_lifetime = self.mode['lifetime'] or 3.0
+        self.title.config(text=self.mode['title'])
+        
+        # Update button highlighting
+        for name, btn in self.mode_buttons.items():
+            btn.config(bg="#00aa00" if name == mode_name else "#444444")
+    
     def set_scoped_preset(self, value):
         """Set scoped sensitivity to a preset value"""
         self.scoped_sens_percent = float(value)
@@ -665,6 +834,16 @@ class AimExercise:
         """Handle right-click release - deactivate scoped sensitivity"""
         self.scoped_active = False
     
+    def on_view_button(self, button, pressed):
+        """Mouse buttons read by renderers that own their window's input (pygame)"""
+        if button == 1 and pressed:
+            self.on_shoot(None)
+        elif button == 3:
+            if pressed:
+                self.on_scope_press(None)
+            else:
+                self.on_scope_release(None)
+    
     def set_crosshair_style(self, style_num):
         """Set the crosshair style"""
         self.current_crosshair = style_num
@@ -677,128 +856,33 @@ class AimExercise:
                 btn.config(bg="#444444")  # Default color
     
     def draw_crosshair(self, center_x, center_y):
-        """Draw the crosshair at the specified position"""
+        """Show the crosshair at the specified position (items are cached, see CrosshairCache)"""
         style = self.crosshair_styles[self.current_crosshair]
         
         # No crosshair option
         if style['type'] == 'none':
+            self.crosshair_cache.hide()
             return
         
-        size = self.crosshair_size
-        thickness = self.crosshair_thickness
-        outline_thickness = self.crosshair_outline_thickness
-        color = self.crosshair_color
-        outline_color = self.crosshair_outline_color
-        has_outline = style['outline']
-        
         # Change crosshair color when scoped
+        color = self.crosshair_color
         if self.scoped_active:
             color = "#ff9900"  # Orange when scoped
         
-        if style['type'] == 'cross':
-            # Draw cross crosshair
-            if has_outline:
-                # Draw red outline first (slightly larger)
-                outline_size = size + outline_thickness
-                outline_width = thickness + (outline_thickness * 2)
-                # Horizontal outline
-                self.canvas.create_line(
-                    center_x - outline_size, center_y,
-                    center_x + outline_size, center_y,
-                    fill=outline_color,
-                    width=outline_width,
-                    tags="crosshair"
-                )
-                # Vertical outline
-                self.canvas.create_line(
-                    center_x, center_y - outline_size,
-                    center_x, center_y + outline_size,
-                    fill=outline_color,
-                    width=outline_width,
-                    tags="crosshair"
-                )
-            
-            # Draw green cross
-            # Horizontal line
-            self.canvas.create_line(
-                center_x - size, center_y,
-                center_x + size, center_y,
-                fill=color,
-                width=thickness,
-                tags="crosshair"
-            )
-            # Vertical line
-            self.canvas.create_line(
-                center_x, center_y - size,
-                center_x, center_y + size,
-                fill=color,
-                width=thickness,
-                tags="crosshair"
-            )
-        
-        elif style['type'] == 'square':
-            # Draw square crosshair
-            half_size = size
-            
-            if has_outline:
-                # Draw red outline first (slightly larger)
-                outline_offset = outline_thickness
-                self.canvas.create_rectangle(
-                    center_x - half_size - outline_offset,
-                    center_y - half_size - outline_offset,
-                    center_x + half_size + outline_offset,
-                    center_y + half_size + outline_offset,
-                    outline=outline_color,
-                    width=thickness + outline_thickness,
-                    tags="crosshair"
-                )
-            
-            # Draw green square
-            self.canvas.create_rectangle(
-                center_x - half_size,
-                center_y - half_size,
-                center_x + half_size,
-                center_y + half_size,
-                outline=color,
-                width=thickness,
-                tags="crosshair"
-            )
-        
-        elif style['type'] == 'circle':
-            # Draw circle crosshair (hollow)
-            radius = size
-            
-            if has_outline:
-                # Draw red outline first (slightly larger)
-                outline_radius = radius + outline_thickness
-                self.canvas.create_oval(
-                    center_x - outline_radius,
-                    center_y - outline_radius,
-                    center_x + outline_radius,
-                    center_y + outline_radius,
-                    outline=outline_color,
-                    width=thickness + outline_thickness,
-                    tags="crosshair"
-                )
-            
-            # Draw green circle
-            self.canvas.create_oval(
-                center_x - radius,
-                center_y - radius,
-                center_x + radius,
-                center_y + radius,
-                outline=color,
-                width=thickness,
-                tags="crosshair"
-            )
+        self.crosshair_cache.show(
+            style, center_x, center_y,
+            self.crosshair_size, self.crosshair_thickness, color,
+            self.crosshair_outline_color, self.crosshair_outline_thickness
+        )
     
     def spawn_random_test_target(self):
         """Spawn a new target in random test mode (called by SPACE key)"""
-        if not self.is_active or self.game_mode != 'random':
+        if not self.is_active or self.mode['kind'] != 'click':
             return
         
         # Clear existing targets
-        self.targets = []
+        self.targets.clear()
+        self.spawn_backlog = 0
         
         # Reset debug visualization markers
         self.debug_x_overshoot_pos = None
@@ -811,15 +895,16 @@ class AimExercise:
         
         # Reset path tracking for new target
         self.path_points = [(self.yaw, self.pitch)]
+        self.path_thinned = False
         self.has_last_hit = True
         self.last_hit_yaw = self.yaw
         self.last_hit_pitch = self.pitch
         
         # Clear trail
-        self.trail_points = []
+        self.trail.clear()
         
         # Spawn new target
-        self.spawn_target_at_random_position()
+        self.spawn_targets(1)
         
     def start_exercise(self):
         """Start the aim exercise"""
@@ -829,6 +914,13 @@ class AimExercise:
         # Apply current sensitivity from entry fields before starting
         self.apply_custom_sensitivity()
         self.apply_scoped_sensitivity()
+        
+        if self.mouse is None:
+            from pynput.mouse import Controller as MouseController
+            self.mouse = MouseController()
+            self.click_timer.start()
+        self.camera_history.clear()
+        self.click_timer.clear()
             
         self.is_active = True
         self.mouse_locked = True
@@ -839,14 +931,16 @@ class AimExercise:
         # Hide UI elements
         self.title.pack_forget()
         self.button_frame.pack_forget()
+        self.mode_frame.pack_forget()
         self.sens_frame.pack_forget()
         self.crosshair_frame.pack_forget()
         self.stats_label.pack_forget()
         
-        # Expand canvas to full screen
+        # Expand the game view to full screen
         self.canvas.pack_forget()
         self.canvas.config(height=self.screen_height)
-        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.renderer.host.pack(fill=tk.BOTH, expand=True)
+        self.renderer.attach(self.screen_width, self.screen_height)
         self.canvas_width = self.screen_width
         self.canvas_height = self.screen_height
         
@@ -855,14 +949,16 @@ class AimExercise:
         self.pitch = 0.0
         
         # Clear targets and trail
-        self.targets = []
-        self.trail_points = []
-        self.path_efficiencies = []  # Reset path tracking
-        self.x_efficiencies = []  # Reset X efficiency tracking
-        self.y_efficiencies = []  # Reset Y efficiency tracking
+        self.targets.clear()
+        self.spawn_backlog = 0
+        self.trail.clear()
+        self.path_efficiencies = RunningMean()  # Reset path tracking
+        self.x_efficiencies = RunningMean()  # Reset X efficiency tracking
+        self.y_efficiencies = RunningMean()  # Reset Y efficiency tracking
         self.path_points = []
+        self.path_thinned = False
         self.has_last_hit = False
-        self.hit_precisions = []  # Reset hit precision tracking
+        self.hit_precisions = RunningMean()  # Reset hit precision tracking
         
         # Reset streak
         self.current_streak = 0
@@ -880,13 +976,15 @@ class AimExercise:
         self.recent_y_overshoots.clear()
         self.recent_x_undershoots.clear()
         self.recent_y_undershoots.clear()
+        self.sens_model.begin_session()
         self.reset_tune_state()
+        self.analysis_generation += 1
 
         # Reset approach analysis tracking
-        self.x_overshoots = []
-        self.y_overshoots = []
-        self.x_micro_adjustments = []
-        self.y_micro_adjustments = []
+        self.x_overshoots = RunningMean()
+        self.y_overshoots = RunningMean()
+        self.x_micro_adjustments = RunningMean()
+        self.y_micro_adjustments = RunningMean()
         self.last_shot_analysis = None
         self.last_shot_was_hit = False
         self.last_shot_type = ""
@@ -900,41 +998,72 @@ class AimExercise:
         self.debug_reversal_points = []
         self.debug_analysis_points = []
         
-        # Reset session timer and focus tracking
+        # Reset session timer and focus tracking (clicking START means we have focus)
         self.session_timer = 0.0
-        self.last_timer_update = time.time()
+        self.last_timer_update = self.clock()
         self.total_unfocused_time = 0
-        self.focus_lost_time = 0
+        self.suspended_at = 0
+        self.suspend_reasons.discard('unfocused')
+        self.cancel_frame()
         
         # Store last mouse position for delta calculation
         pos = self.mouse.position
         self.last_mouse_x = pos[0]
         self.last_mouse_y = pos[1]
         
-        # Spawn 2 initial targets
-        self.targets = []
-        self.spawn_target_at_random_position()
-        self.spawn_target_at_random_position()
+        # Spawn the mode's initial targets with a fresh spawn policy
+        self.targets.clear()
+        self.spawn_backlog = 0
+        self.spawn_policy = self.mode['spawn']()
+        self.score = 0
+        self.session_heatmap.reset()
+        self.spawn_targets(self.num_targets)
+        self.motion = self.mode['motion']() if self.mode['kind'] == 'tracking' else None
+        self.tracking.reset()
+        self.last_motion_time = self.clock()
         # Initialize path tracking from current position
         self.path_points = [(self.yaw, self.pitch)]
+        self.path_thinned = False
         self.has_last_hit = True
         self.last_hit_yaw = self.yaw
         self.last_hit_pitch = self.pitch
 
         self.lock_mouse_loop()
         
+    def resume_session(self):
+        """Start a session from the last checkpoint (after a crash)"""
+        state = checkpoint.load(self.checkpoint_path)
+        self.resume_btn.pack_forget()
+        if state is None:
+            print("No session checkpoint to resume")
+            return
+        started = time.perf_counter()
+        if state['mode'] in MODES:
+            self.set_mode(state['mode'])
+        self.x_sens_var.set(f"{state['x_sens']:.1f}")
+        self.y_sens_var.set(f"{state['y_sens']:.1f}")
+        self.scoped_sens_var.set(f"{state['scoped_sens_percent']:.1f}")
+        self.start_exercise()
+        checkpoint.restore(self, state)
+        self.last_checkpoint_time = self.clock()
+        print(f"Resumed session from checkpoint in {(time.perf_counter() - started) * 1000:.0f} ms")
+    
     def stop_exercise(self):
         """Stop the aim exercise"""
         self.is_active = False
+        self.suspended_at = 0
+        self.cancel_frame()
         self.mouse_locked = False
         self.scoped_active = False  # Reset scoped state
         self.start_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
         
         # Show UI elements again
+        self.renderer.host.pack_forget()
         self.canvas.pack_forget()
         self.title.pack(pady=10)
         self.button_frame.pack(pady=10)
+        self.mode_frame.pack(pady=5)
         self.sens_frame.pack(pady=5)
         self.crosshair_frame.pack(pady=5)
         self.stats_label.pack(pady=5)
@@ -945,21 +1074,42 @@ class AimExercise:
         self.canvas_width = self.screen_width
         self.canvas_height = self.canvas_height_inactive
         
+        self.renderer.clear()
         self.canvas.delete("all")
+        self.trail_renderer.forget()
+        self.crosshair_cache.forget()
+        
+        # Fold in analysis of the final shots before showing session totals
+        self.analysis_worker.flush()
+        self.process_analysis_results()
+        self.shot_events.flush()
+        self.save_path_archive()
+        self.save_heatmaps()
+        self.save_sens_model()
         self.update_stats_display()
+        self.draw_results()
+        
+        if self.experiment is not None:
+            self.end_experiment()
+        
+        # The session ended normally; there is nothing to resume
+        self.checkpoint_writer.discard()
+        self.resume_btn.pack_forget()
+        if self.metrics is not None:
+            self.publish_metrics(self.clock())
         
     def reset_stats(self):
         """Reset statistics"""
         self.stats.reset()
-        self.path_efficiencies = []
-        self.x_efficiencies = []
-        self.y_efficiencies = []
-        self.hit_precisions = []
+        self.path_efficiencies = RunningMean()
+        self.x_efficiencies = RunningMean()
+        self.y_efficiencies = RunningMean()
+        self.hit_precisions = RunningMean()
         self.has_last_hit = False
-        self.x_overshoots = []
-        self.y_overshoots = []
-        self.x_micro_adjustments = []
-        self.y_micro_adjustments = []
+        self.x_overshoots = RunningMean()
+        self.y_overshoots = RunningMean()
+        self.x_micro_adjustments = RunningMean()
+        self.y_micro_adjustments = RunningMean()
         self.current_streak = 0
         self.best_streak = 0
         self.recent_hits.clear()
@@ -973,12 +1123,25 @@ class AimExercise:
         self.recent_x_undershoots.clear()
         self.recent_y_undershoots.clear()
         self.reset_tune_state()
+        self.analysis_generation += 1
+        self.score = 0
+        self.tracking.reset()
+        self.session_heatmap.reset()
         self.update_stats_display()
+        if not self.is_active:
+            self.draw_results()
         
     def lock_mouse_loop(self):
         """Continuously recenter mouse and update view"""
-        if self.is_active:
-            current_time = time.time()
+        self.frame_after_id = None
+        if self.is_active and not self.suspended_at:
+            profiler = self.profiler
+            frame_start = time.perf_counter_ns() if profiler.enabled or self.metrics else 0
+            for callback in self.frame_callbacks:
+                callback()
+            for button, pressed in self.renderer.poll_input():
+                self.on_view_button(button, pressed)
+            current_time = self.clock()
             
             # Update session timer only when active and mouse is locked (window focused)
             if self.mouse_locked:
@@ -988,376 +1151,312 @@ class AimExercise:
             
             if self.mouse_locked:
                 # Get current mouse position
-                pos = self.mouse.position
+                with profiler.section('input.mouse_read'):
+                    pos = self.mouse.position
+                    sample_ns = time.perf_counter_ns()
                 if pos is None:
-                    self.root.after(1, self.lock_mouse_loop)
+                    self.frame_after_id = self.root.after(1, self.lock_mouse_loop)
                     return
                 current_x, current_y = pos[0], pos[1]
                 
-                # Calculate delta (mouse movement)
-                delta_x = current_x - self.last_mouse_x
-                delta_y = current_y - self.last_mouse_y
-                
-                # Apply scoped sensitivity multiplier if active
-                sens_multiplier = 1.0
-                if self.scoped_active:
-                    sens_multiplier = self.scoped_sens_percent / 100.0
-                
-                # Update camera angles with separate horizontal/vertical sensitivity
-                # Apply scoped multiplier to both axes
-                self.yaw += (delta_x / self.h_counts_per_degree) * sens_multiplier
-                self.pitch -= (delta_y / self.v_counts_per_degree) * sens_multiplier
-                
-                # Clamp pitch to screen bounds (small range)
-                max_pitch = (self.canvas_height / 2) / self.pixels_per_degree * 0.5
-                self.pitch = max(-max_pitch, min(max_pitch, self.pitch))
+                with profiler.section('input.camera'):
+                    # Calculate delta (mouse movement)
+                    delta_x = current_x - self.last_mouse_x
+                    delta_y = current_y - self.last_mouse_y
+                    if delta_x or delta_y:
+                        self.latency.input_sampled(sample_ns)
+                    
+                    # Apply scoped sensitivity multiplier if active
+                    sens_multiplier = 1.0
+                    if self.scoped_active:
+                        sens_multiplier = self.scoped_sens_percent / 100.0
+                    
+                    # Update camera angles with separate horizontal/vertical sensitivity
+                    # Apply scoped multiplier to both axes
+                    self.yaw += (delta_x / self.h_counts_per_degree) * sens_multiplier
+                    self.pitch -= (delta_y / self.v_counts_per_degree) * sens_multiplier
+                    
+                    # Clamp pitch to screen bounds (small range)
+                    max_pitch = (self.canvas_height / 2) / self.pixels_per_degree * 0.5
+                    self.pitch = max(-max_pitch, min(max_pitch, self.pitch))
 
-                # Clamp yaw to screen bounds (small range) instead of wrapping 360
-                max_yaw = (self.canvas_width / 2) / self.pixels_per_degree * 0.5
-                self.yaw = max(-max_yaw, min(max_yaw, self.yaw))
+                    # Clamp yaw to screen bounds (small range) instead of wrapping 360
+                    max_yaw = (self.canvas_width / 2) / self.pixels_per_degree * 0.5
+                    self.yaw = max(-max_yaw, min(max_yaw, self.yaw))
+                    self.camera_history.append(sample_ns, self.yaw, self.pitch)
+                
+                # Move tracking targets and measure crosshair-on-target error
+                if self.motion is not None:
+                    with profiler.section('tracking.update'):
+                        self.update_tracking()
                 
                 # Add trail point every few milliseconds
-                current_time = time.time()
-                if current_time - self.last_trail_time > 0.01:  # Every 10ms
-                    self.last_trail_time = current_time
-                    
-                    # Track path for efficiency calculation
-                    if self.game_mode == 'random' and self.has_last_hit:
-                        self.path_points.append((self.yaw, self.pitch))
+                with profiler.section('input.path_append'):
+                    current_time = self.clock()
+                    if current_time - self.last_trail_time > 0.01:  # Every 10ms
+                        self.last_trail_time = current_time
+                        self.trail.append(self.yaw, self.pitch, current_time)
+                        
+                        # Track path for efficiency calculation
+                        if self.mode['kind'] == 'click' and self.has_last_hit:
+                            self.path_points.append((self.yaw, self.pitch))
+                            if len(self.path_points) > self.max_path_points:
+                                self.thin_path()
                 
                 # Recenter mouse to lock position only if window has focus
-                if self.root.focus_displayof() is not None:
-                    self.mouse.position = (self.center_x, self.center_y)
-                    self.last_mouse_x = self.center_x
-                    self.last_mouse_y = self.center_y
+                with profiler.section('input.recenter'):
+                    if self.root.focus_displayof() is not None:
+                        self.mouse.position = (self.center_x, self.center_y)
+                        self.last_mouse_x = self.center_x
+                        self.last_mouse_y = self.center_y
+            
+            # Publish any post-shot analysis the worker has finished
+            with profiler.section('analysis.apply'):
+                self.process_analysis_results()
             
             # Refresh the forecast and (if enabled) gently drift live sens
-            self.update_auto_tune(time.time())
+            with profiler.section('tune.update'):
+                self.update_auto_tune(self.clock())
+            
+            # Snapshot the session now and then so a crash loses little
+            if self.checkpoint_interval and current_time - self.last_checkpoint_time >= self.checkpoint_interval:
+                with profiler.section('checkpoint.capture'):
+                    self.last_checkpoint_time = current_time
+                    self.checkpoint_writer.submit(checkpoint.capture(self))
 
             # Always redraw the scene (even when unlocked)
-            self.draw_scene()
+            with profiler.section('draw.scene'):
+                self.draw_scene()
+
+            if frame_start:
+                frame_end = time.perf_counter_ns()
+                if profiler.enabled:
+                    profiler.record('frame', frame_start, frame_end)
+                if self.metrics is not None:
+                    self.publish_metrics(current_time, frame_start, frame_end)
 
             # Schedule next check
-            self.root.after(1, self.lock_mouse_loop)
+            self.frame_after_id = self.root.after(1, self.lock_mouse_loop)
     
-    def calculate_path_efficiency(self, target_yaw, target_pitch):
-        """Calculate how efficiently the cursor moved from last hit to this target"""
-        if len(self.path_points) < 2 or not self.has_last_hit:
-            return None  # Not enough data
-        
-        # Calculate direct distance from last hit to this target
-        yaw_diff = target_yaw - self.last_hit_yaw
-        # Handle yaw wraparound
-        while yaw_diff > 180:
-            yaw_diff -= 360
-        while yaw_diff < -180:
-            yaw_diff += 360
-            
-        direct_distance = math.sqrt(
-            yaw_diff ** 2 +
-            (target_pitch - self.last_hit_pitch) ** 2
-        )
-        
-        if direct_distance < 0.1:  # Target was very close, skip
-            return None
-        
-        # Calculate actual path length traveled
-        actual_distance = 0.0
-        for i in range(1, len(self.path_points)):
-            yaw1, pitch1 = self.path_points[i - 1]
-            yaw2, pitch2 = self.path_points[i]
-            
-            # Handle yaw wraparound
-            seg_yaw_diff = yaw2 - yaw1
-            while seg_yaw_diff > 180:
-                seg_yaw_diff -= 360
-            while seg_yaw_diff < -180:
-                seg_yaw_diff += 360
-            
-            segment_distance = math.sqrt(seg_yaw_diff ** 2 + (pitch2 - pitch1) ** 2)
-            actual_distance += segment_distance
-        
-        # Efficiency = direct / actual * 100 (100% = perfect straight line)
-        if actual_distance > 0:
-            efficiency = (direct_distance / actual_distance) * 100
-            return min(efficiency, 100.0)  # Cap at 100%
-        return None
-    
-    def calculate_axis_efficiency(self, target_yaw, target_pitch):
-        """Calculate X and Y axis efficiency separately"""
-        if len(self.path_points) < 2 or not self.has_last_hit:
-            return None, None  # Not enough data
-        
-        # Calculate direct X (yaw) distance from last hit to target
-        direct_x = target_yaw - self.last_hit_yaw
-        # Handle yaw wraparound
-        while direct_x > 180:
-            direct_x -= 360
-        while direct_x < -180:
-            direct_x += 360
-        direct_x = abs(direct_x)
-        
-        # Calculate direct Y (pitch) distance
-        direct_y = abs(target_pitch - self.last_hit_pitch)
-        
-        # Skip if movement was too small on either axis
-        min_movement = 0.5  # Minimum degrees to consider
-        
-        # Calculate actual X and Y distances traveled
-        actual_x = 0.0
-        actual_y = 0.0
-        
-        for i in range(1, len(self.path_points)):
-            yaw1, pitch1 = self.path_points[i - 1]
-            yaw2, pitch2 = self.path_points[i]
-            
-            # Handle yaw wraparound for X movement
-            seg_x = yaw2 - yaw1
-            while seg_x > 180:
-                seg_x -= 360
-            while seg_x < -180:
-                seg_x += 360
-            actual_x += abs(seg_x)
-            
-            # Y movement (no wraparound needed)
-            actual_y += abs(pitch2 - pitch1)
-        
-        # Calculate X efficiency
-        x_efficiency = None
-        if direct_x >= min_movement and actual_x > 0:
-            x_efficiency = (direct_x / actual_x) * 100
-            x_efficiency = min(x_efficiency, 100.0)  # Cap at 100%
-        
-        # Calculate Y efficiency
-        y_efficiency = None
-        if direct_y >= min_movement and actual_y > 0:
-            y_efficiency = (direct_y / actual_y) * 100
-            y_efficiency = min(y_efficiency, 100.0)  # Cap at 100%
-        
-        return x_efficiency, y_efficiency
+    def apply_shot_analysis(self, result):
+        """Publish a finished background analysis into the HUD and marker state"""
+        job = result['job']
+        if job['generation'] != self.analysis_generation:
+            return  # Shot belongs to a session that has since been reset
+        
+        shot_time = job['time']
+        
+        if result['efficiency'] is not None:
+            self.path_efficiencies.append(result['efficiency'])
+            self.recent_path_efficiencies.append((shot_time, result['efficiency']))
+        if result['x_efficiency'] is not None:
+            self.x_efficiencies.append(result['x_efficiency'])
+            self.recent_x_efficiencies.append((shot_time, result['x_efficiency']))
+        if result['y_efficiency'] is not None:
+            self.y_efficiencies.append(result['y_efficiency'])
+            self.recent_y_efficiencies.append((shot_time, result['y_efficiency']))
+        
+        # Overshoots (record 1 if one occurred, 0 otherwise) + marker positions
+        self.debug_analysis_points = []
+        self.debug_pause_points = []
+        self.debug_x_undershoot_points = []
+        self.debug_y_undershoot_points = []
+        approach_data = result['approach']
+        if approach_data:
+            x_over = 1 if approach_data['x_max_overshoot'] > 0 else 0
+            y_over = 1 if approach_data['y_max_overshoot'] > 0 else 0
+            self.x_overshoots.append(x_over)
+            self.y_overshoots.append(y_over)
+            self.recent_x_overshoots.append((shot_time, x_over))
+            self.recent_y_overshoots.append((shot_time, y_over))
+            self.last_shot_analysis = approach_data
+            self.debug_reversal_points = approach_data['reversal_points']
+            self.debug_x_overshoot_pos = approach_data['x_overshoot_pos']
+            self.debug_y_overshoot_pos = approach_data['y_overshoot_pos']
+            self.debug_markers_timestamp = shot_time
+        
+        # Undershoots (shot position vs target edge)
+        x_under_val = result['x_undershoot']
+        y_under_val = result['y_undershoot']
+        self.x_micro_adjustments.append(x_under_val)
+        self.y_micro_adjustments.append(y_under_val)
+        self.recent_x_undershoots.append((shot_time, x_under_val))
+        self.recent_y_undershoots.append((shot_time, y_under_val))
+        shot_pos = (job['shot_yaw'], job['shot_pitch'])
+        if x_under_val:
+            self.debug_x_undershoot_points = [shot_pos]
+        if y_under_val:
+            self.debug_y_undershoot_points = [shot_pos]
+        
+        # Auto-tuner samples: directional bias + per-axis accuracy
+        self.tune_x.append((shot_time, result['x_bias'], result['x_precision'], job['x_sens']))
+        self.tune_y.append((shot_time, result['y_bias'], result['y_precision'], job['y_sens']))
+        self.sens_model.observe('x', job['x_sens'], result['x_precision'])
+        self.sens_model.observe('y', job['y_sens'], result['y_precision'])
+        
+        self.last_shot_was_hit = job['hit']
+        self.last_shot_type = "HIT" if job['hit'] else "MISS"
+        
+        if result['compressed_path'] is not None:
+            self.path_archive.add({
+                'time': shot_time,
+                'hit': job['hit'],
+                'target_yaw': job['target_yaw'],
+                'target_pitch': job['target_pitch'],
+                'radius': job['target_angular_size'],
+                'start_yaw': job['start_yaw'],
+                'start_pitch': job['start_pitch'],
+                'shot_yaw': job['shot_yaw'],
+                'shot_pitch': job['shot_pitch'],
+                'yaw_diff': job['yaw_diff'],
+                'pitch_diff': job['pitch_diff'],
+                'x_sens': job['x_sens'],
+                'y_sens': job['y_sens'],
+                'thinned': job['thinned']
+            }, result['compressed_path'])
     
-    def analyze_final_approach(self, target_yaw, target_pitch, capture_debug=False):
-        """
-        Analyze the approach to the target to detect overshoot patterns.
-        Undershoot is now detected separately based on shot position vs target edge.
+    def save_path_archive(self):
+        """Write the session's compressed approach paths to the data directory"""
+        archive = self.path_archive
+        if not archive:
+            return
+        path = os.path.join(data_dir(), 'paths', time.strftime("paths_%Y%m%d_%H%M%S.bin"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            archive.save(path)
+            self.last_archive_path = path
+            print(f"Saved {len(archive)} approach paths to {path} "
+                  f"({archive.raw_bytes} -> {archive.bytes} bytes, {archive.ratio():.1f}x, "
+                  f"{archive.fallbacks} without simplification, {archive.lossless} lossless)")
+        except OSError as e:
+            print(f"Could not save approach paths: {e}")
+        archive.clear()
+    
+    def save_heatmaps(self):
+        """Persist the session heatmap and fold it into the lifetime one"""
+        if self.session_heatmap.total() == 0:
+            return
+        lifetime_path = os.path.join(data_dir(), 'heatmap_lifetime.npz')
+        if self.lifetime_heatmap is None:
+            self.lifetime_heatmap = ShotHeatmap.load(lifetime_path)
+        self.lifetime_heatmap.merge(self.session_heatmap)
+        session_path = os.path.join(data_dir(), 'sessions', time.strftime("heatmap_%Y%m%d_%H%M%S.npz"))
+        os.makedirs(os.path.dirname(session_path), exist_ok=True)
+        try:
+            self.session_heatmap.save(session_path)
+            self.lifetime_heatmap.save(lifetime_path)
+        except OSError as e:
+            print(f"Could not save heatmaps: {e}")
+    
+    def save_sens_model(self):
+        """Persist the profile's tuner model so the next session starts warm"""
+        try:
+            self.sens_model.save(self.sens_model_path)
+        except OSError as e:
+            print(f"Could not save tuner profile: {e}")
+    
+    def get_heatmap_image(self, label, heatmap, zoom):
+        """PhotoImage of a heatmap, re-rendered only when its counts changed"""
+        cached = self.heatmap_images.get(label)
+        if cached is not None and cached[0] == heatmap.version:
+            return cached[1]
+        image = tk.PhotoImage(width=heatmap.bins, height=heatmap.bins)
+        image.put(heatmap.image_data())
+        image = image.zoom(zoom)
+        self.heatmap_images[label] = (heatmap.version, image)
+        return image
+    
+    def draw_results(self):
+        """Draw session/lifetime shot dispersion heatmaps on the idle canvas"""
+        self.canvas.delete("results")
+        plots = []
+        if self.session_heatmap.total():
+            plots.append(("Session", self.session_heatmap))
+        if self.lifetime_heatmap is not None and self.lifetime_heatmap.total():
+            plots.append(("Lifetime", self.lifetime_heatmap))
+        if not plots:
+            return
         
-        Returns dict with:
-        - x_reversals: Number of X direction changes (overshoot indicator)
-        - y_reversals: Number of Y direction changes (overshoot indicator)
-        - x_max_overshoot: Maximum distance past target on X axis
-        - y_max_overshoot: Maximum distance past target on Y axis
+        zoom = 6
+        center_y = self.canvas_height // 2
+        for i, (label, heatmap) in enumerate(plots):
+            size = heatmap.bins * zoom
+            spacing = size + 80
+            x = self.canvas_width // 2 + (i - (len(plots) - 1) / 2) * spacing
+            self.canvas.create_image(x, center_y, image=self.get_heatmap_image(label, heatmap, zoom),
+                                     tags="results")
+            # Target outline: the +-1 normalised square
+            half = size / 2 / heatmap.extent
+            self.canvas.create_rectangle(
+                x - half, center_y - half, x + half, center_y + half,
+                outline="#ffffff",
+                width=1,
+                tags="results"
+            )
+            self.canvas.create_text(
+                x,
+                center_y - size / 2 - 15,
+                text=f"{label} dispersion ({heatmap.total()} shots)",
+                font=("Arial", 12),
+                fill="#aaaaaa",
+                tags="results"
+            )
+    
+    def process_analysis_results(self):
+        """Apply every background analysis result that has finished"""
+        results = self.analysis_worker.drain()
+        for result in results:
+            self.apply_shot_analysis(result)
+        if results and not self.is_active:
+            self.update_stats_display()
+    
+    def update_tracking(self):
+        """Advance moving targets one step and accumulate this sample's tracking error"""
+        now = self.clock()
+        dt = min(now - self.last_motion_time, self.motion_max_dt)
+        self.last_motion_time = now
+        targets = self.targets
+        if dt <= 0 or not targets:
+            return
         
-        If capture_debug=True, also populates self.debug_*_points lists for visualization.
-        """
-        if len(self.path_points) < 5 or not self.has_last_hit:
-            return None
-        
-        # Clear debug points if requested
-        if capture_debug:
-            self.debug_analysis_points = []
-            self.debug_reversal_points = []
-            self.debug_pause_points = []
-            self.debug_x_undershoot_points = []
-            self.debug_y_undershoot_points = []
-            self.debug_x_overshoot_pos = None
-            self.debug_y_overshoot_pos = None
-            self.debug_markers_timestamp = time.time()
-        
-        # Initialize counters
-        x_reversals = 0
-        y_reversals = 0
-        x_max_overshoot = 0.0
-        y_max_overshoot = 0.0
-        x_max_overshoot_pos = None
-        y_max_overshoot_pos = None
-        
-        last_x_dir = 0
-        last_y_dir = 0
-        
-        # Calculate target direction from START of path
-        path_start_yaw, path_start_pitch = self.path_points[0]
-        
-        # Handle yaw wraparound for target direction
-        target_x_diff = target_yaw - path_start_yaw
-        while target_x_diff > 180:
-            target_x_diff -= 360
-        while target_x_diff < -180:
-            target_x_diff += 360
-        target_x_dir = 1 if target_x_diff > 0 else -1
-        
-        target_y_diff = target_pitch - path_start_pitch
-        target_y_dir = 1 if target_y_diff > 0 else -1
-        
-        # Calculate target angular radius
-        target_angular_radius = self.target_size / self.pixels_per_degree
-        
-        # Calculate target far edges (for overshoot detection)
-        target_x_far_edge = target_yaw + (target_x_dir * target_angular_radius)
-        target_y_far_edge = target_pitch + (target_y_dir * target_angular_radius)
-        
-        # Scan path for overshoots and reversals
-        for i in range(1, len(self.path_points)):
-            prev_yaw, prev_pitch = self.path_points[i - 1]
-            curr_yaw, curr_pitch = self.path_points[i]
-            
-            # Calculate movement deltas
-            dx = curr_yaw - prev_yaw
-            while dx > 180:
-                dx -= 360
-            while dx < -180:
-                dx += 360
-            dy = curr_pitch - prev_pitch
-            
-            # Calculate distance from target center on each axis
-            x_dist_from_center = curr_yaw - target_yaw
-            while x_dist_from_center > 180:
-                x_dist_from_center -= 360
-            while x_dist_from_center < -180:
-                x_dist_from_center += 360
-            
-            y_dist_from_center = curr_pitch - target_pitch
-            
-            # Check if cursor is outside target boundary on X axis
-            x_outside_target = abs(x_dist_from_center) > target_angular_radius
-            
-            # Check if cursor is outside target boundary on Y axis  
-            y_outside_target = abs(y_dist_from_center) > target_angular_radius
-            
-            # Check for X overshoot (past far edge AND outside target X bounds)
-            curr_x_diff = target_x_far_edge - curr_yaw
-            while curr_x_diff > 180:
-                curr_x_diff -= 360
-            while curr_x_diff < -180:
-                curr_x_diff += 360
-            
-            curr_x_side = 1 if curr_x_diff > 0 else -1
-            x_past_far_edge = (curr_x_side != target_x_dir)
-            
-            # Only count X overshoot if outside target on X axis
-            if x_past_far_edge and x_outside_target:
-                overshoot_dist = abs(curr_x_diff)
-                if overshoot_dist > x_max_overshoot:
-                    x_max_overshoot = overshoot_dist
-                    x_max_overshoot_pos = (curr_yaw, curr_pitch)
-            
-            # Check for Y overshoot (past far edge AND outside target Y bounds)
-            curr_y_diff = target_y_far_edge - curr_pitch
-            curr_y_side = 1 if curr_y_diff > 0 else -1
-            y_past_far_edge = (curr_y_side != target_y_dir)
-            
-            # Only count Y overshoot if outside target on Y axis
-            if y_past_far_edge and y_outside_target:
-                overshoot_dist = abs(curr_y_diff)
-                if overshoot_dist > y_max_overshoot:
-                    y_max_overshoot = overshoot_dist
-                    y_max_overshoot_pos = (curr_yaw, curr_pitch)
-            
-            # Determine movement direction for reversal detection
-            curr_x_dir = 1 if dx > 0.01 else (-1 if dx < -0.01 else 0)
-            curr_y_dir = 1 if dy > 0.01 else (-1 if dy < -0.01 else 0)
-            
-            # Detect X reversals
-            if curr_x_dir != 0 and last_x_dir != 0 and curr_x_dir != last_x_dir:
-                x_reversals += 1
-                if capture_debug:
-                    self.debug_reversal_points.append((prev_yaw, prev_pitch))
-            
-            # Detect Y reversals
-            if curr_y_dir != 0 and last_y_dir != 0 and curr_y_dir != last_y_dir:
-                y_reversals += 1
-                if capture_debug:
-                    self.debug_reversal_points.append((prev_yaw, prev_pitch))
-            
-            # Update last direction
-            if curr_x_dir != 0:
-                last_x_dir = curr_x_dir
-            if curr_y_dir != 0:
-                last_y_dir = curr_y_dir
-        
-        # Capture max overshoot positions for debug visualization
-        if capture_debug:
-            self.debug_x_overshoot_pos = x_max_overshoot_pos
-            self.debug_y_overshoot_pos = y_max_overshoot_pos
-        
-        return {
-            'x_reversals': x_reversals,
-            'y_reversals': y_reversals,
-            'x_max_overshoot': x_max_overshoot,
-            'y_max_overshoot': y_max_overshoot
-        }
+        # Move every target at once, bouncing inside the spawn bounds
+        margin = 0.85
+        max_pitch = (self.canvas_height / 2) / self.pixels_per_degree * 0.5 * margin
+        max_yaw = (self.canvas_width / 2) / self.pixels_per_degree * 0.5 * margin
+        self.motion.update(targets, dt, self.rng)
+        targets.integrate(dt, max_yaw, max_pitch)
+        
+        # Error of the crosshair against the nearest target (+ = right of / above it)
+        target, row, _ = targets.nearest(self.yaw, self.pitch)
+        error_x = shot_analysis.wrap_degrees(self.yaw - target.yaw)
+        error_y = self.pitch - target.pitch
+        radius = target.size / self.pixels_per_degree
+        on_target, segment = self.tracking.add(
+            dt, error_x, error_y,
+            float(targets.vyaw[row]), float(targets.vpitch[row]), radius
+        )
+        if on_target:
+            self.score += self.mode['scoring'].on_target * dt
+        if segment is not None:
+            self.apply_tracking_segment(segment)
     
-    def check_undershoot(self, target_yaw, target_pitch, capture_debug=False):
-        """
-        Check if the current crosshair position is short of the target's edges.
-        Only counts as undershoot if click is outside target boundary on that axis.
-        Returns (x_undershoot, y_undershoot) booleans.
-        """
-        if len(self.path_points) < 2 or not self.has_last_hit:
-            return False, False
-        
-        # Calculate target angular radius
-        target_angular_radius = self.target_size / self.pixels_per_degree
-        
-        # Calculate distance from target center on each axis
-        x_dist_from_center = self.yaw - target_yaw
-        while x_dist_from_center > 180:
-            x_dist_from_center -= 360
-        while x_dist_from_center < -180:
-            x_dist_from_center += 360
-        
-        y_dist_from_center = self.pitch - target_pitch
-        
-        # Check if click is outside target boundary on each axis
-        x_outside_target = abs(x_dist_from_center) > target_angular_radius
-        y_outside_target = abs(y_dist_from_center) > target_angular_radius
-        
-        # If click is inside target on this axis, no undershoot on that axis
-        if not x_outside_target and not y_outside_target:
-            # Click is inside target - no undershoot
-            return False, False
-        
-        # Calculate approach direction from path start
-        path_start_yaw, path_start_pitch = self.path_points[0]
-        
-        target_x_diff = target_yaw - path_start_yaw
-        while target_x_diff > 180:
-            target_x_diff -= 360
-        while target_x_diff < -180:
-            target_x_diff += 360
-        target_x_dir = 1 if target_x_diff > 0 else -1
-        
-        target_y_diff = target_pitch - path_start_pitch
-        target_y_dir = 1 if target_y_diff > 0 else -1
-        
-        # Calculate target near edges (the side we approach from)
-        target_x_near_edge = target_yaw - (target_x_dir * target_angular_radius)
-        target_y_near_edge = target_pitch - (target_y_dir * target_angular_radius)
-        
-        # Check if crosshair has reached the near edges
-        # X undershoot: crosshair hasn't reached target's near X edge AND is outside target X bounds
-        curr_x_diff = target_x_near_edge - self.yaw
-        while curr_x_diff > 180:
-            curr_x_diff -= 360
-        while curr_x_diff < -180:
-            curr_x_diff += 360
-        
-        # If we're still on the same side as we started (haven't crossed near edge), it's an undershoot
-        curr_x_side = 1 if curr_x_diff > 0 else -1
-        x_undershoot = (curr_x_side == target_x_dir) and x_outside_target
-        
-        # Y undershoot
-        curr_y_diff = target_y_near_edge - self.pitch
-        curr_y_side = 1 if curr_y_diff > 0 else -1
-        y_undershoot = (curr_y_side == target_y_dir) and y_outside_target
-        
-        # Capture debug markers
-        if capture_debug:
-            if x_undershoot:
-                self.debug_x_undershoot_points = [(self.yaw, self.pitch)]
-            if y_undershoot:
-                self.debug_y_undershoot_points = [(self.yaw, self.pitch)]
-        
-        return x_undershoot, y_undershoot
+    def apply_tracking_segment(self, segment):
+        """Turn a finished tracking segment into one auto-tuner sample per axis"""
+        x_bias, y_bias, x_precision, y_precision = self.tracking.tune_sample(segment)
+        now = self.clock()
+        self.tune_x.append((now, x_bias, x_precision, self.current_x_sens))
+        self.tune_y.append((now, y_bias, y_precision, self.current_y_sens))
+        self.sens_model.observe('x', self.current_x_sens, x_precision)
+        self.sens_model.observe('y', self.current_y_sens, y_precision)
+    
+    def get_tracking_text(self):
+        """One-line summary of the session's tracking error"""
+        session = self.tracking.session
+        rms_x, rms_y = session.rms()
+        lag_x, lag_y = session.lag()
+        return (f"On target: {session.on_target_fraction() * 100:.1f}% | "
+                f"RMS X={rms_x:.2f}° Y={rms_y:.2f}° | "
+                f"Lag X={lag_x * 1000:+.0f}ms Y={lag_y * 1000:+.0f}ms")
     
     def record_hit_position(self):
         """Record the current position as a hit location"""
@@ -1365,42 +1464,37 @@ class AimExercise:
         self.last_hit_pitch = self.pitch
         self.has_last_hit = True
         self.path_points = [(self.yaw, self.pitch)]  # Start fresh path from this hit
+        self.path_thinned = False
+    
+    def thin_path(self):
+        """Halve the density of the older half of a long miss path, keeping the recent approach intact"""
+        half = len(self.path_points) // 2
+        self.path_points = self.path_points[:half:2] + self.path_points[half:]
+        self.path_thinned = True
     
     def get_average_path_efficiency(self):
         """Get average path efficiency across all tracked movements"""
-        if not self.path_efficiencies:
-            return 0.0
-        return sum(self.path_efficiencies) / len(self.path_efficiencies)
+        return self.path_efficiencies.mean()
     
     def get_average_x_efficiency(self):
         """Get average X-axis efficiency"""
-        if not self.x_efficiencies:
-            return 0.0
-        return sum(self.x_efficiencies) / len(self.x_efficiencies)
+        return self.x_efficiencies.mean()
     
     def get_average_y_efficiency(self):
         """Get average Y-axis efficiency"""
-        if not self.y_efficiencies:
-            return 0.0
-        return sum(self.y_efficiencies) / len(self.y_efficiencies)
+        return self.y_efficiencies.mean()
     
     def get_average_hit_precision(self):
         """Get average hit precision (100% = center of target)"""
-        if not self.hit_precisions:
-            return 0.0
-        return sum(self.hit_precisions) / len(self.hit_precisions)
+        return self.hit_precisions.mean()
     
     def get_average_overshoots(self):
         """Get average overshoot counts for X and Y"""
-        x_avg = sum(self.x_overshoots) / len(self.x_overshoots) if self.x_overshoots else 0.0
-        y_avg = sum(self.y_overshoots) / len(self.y_overshoots) if self.y_overshoots else 0.0
-        return x_avg, y_avg
+        return self.x_overshoots.mean(), self.y_overshoots.mean()
     
     def get_average_micro_adjustments(self):
         """Get average micro-adjustment counts for X and Y"""
-        x_avg = sum(self.x_micro_adjustments) / len(self.x_micro_adjustments) if self.x_micro_adjustments else 0.0
-        y_avg = sum(self.y_micro_adjustments) / len(self.y_micro_adjustments) if self.y_micro_adjustments else 0.0
-        return x_avg, y_avg
+        return self.x_micro_adjustments.mean(), self.y_micro_adjustments.mean()
     
     def prune_rolling_metrics(self, current_time):
         """Remove entries older than rolling_window from recent metrics"""
@@ -1436,17 +1530,19 @@ class AimExercise:
         while samples and samples[0][0] < cutoff:
             samples.popleft()
 
-    def _axis_forecast(self, samples, live_sens, current_time):
+    def _axis_forecast(self, samples, live_sens, current_time, prior=None):
         """Estimate the accuracy-optimal sens for one axis from recent shots.
 
         Returns (target_sens, mean_bias, n). target_sens is where the
         systematic over/under bias would be nulled (the max-accuracy point),
         with a small precision hill-climb refinement once bias is balanced.
+        A profile prior stands in until there are enough shots, then is
+        blended in with the weight of tune_min_shots samples.
         """
         self._prune_tune(samples, current_time)
         n = len(samples)
         if n < self.tune_min_shots:
-            return live_sens, 0.0, n
+            return (live_sens if prior is None else prior), 0.0, n
 
         mean_bias = sum(b for (_, b, _, _) in samples) / n
 
@@ -1469,6 +1565,9 @@ class AimExercise:
                 elif low_acc > high_acc + 0.03:
                     target -= self.tune_refine_step
 
+        if prior is not None:
+            target = (prior * self.tune_min_shots + target * n) / (self.tune_min_shots + n)
+
         target = max(1.0, min(20.0, target))
         return target, mean_bias, n
 
@@ -1478,8 +1577,9 @@ class AimExercise:
             return
         self.last_forecast_time = current_time
 
-        tx, _, _ = self._axis_forecast(self.tune_x, self.current_x_sens, current_time)
-        ty, _, _ = self._axis_forecast(self.tune_y, self.current_y_sens, current_time)
+        prior_x, prior_y = self.sens_prior or (None, None)
+        tx, _, _ = self._axis_forecast(self.tune_x, self.current_x_sens, current_time, prior_x)
+        ty, _, _ = self._axis_forecast(self.tune_y, self.current_y_sens, current_time, prior_y)
 
         # Smooth the displayed forecast so it glides rather than jumps.
         a = self.forecast_ema
@@ -1490,6 +1590,8 @@ class AimExercise:
         """True when enough recent samples exist for the forecast/drift."""
         self._prune_tune(self.tune_x, current_time)
         self._prune_tune(self.tune_y, current_time)
+        if self.sens_prior is not None:
+            return True  # The profile's history is enough to start drifting
         return (len(self.tune_x) >= self.tune_min_shots and
                 len(self.tune_y) >= self.tune_min_shots)
 
@@ -1535,25 +1637,86 @@ class AimExercise:
         self.apply_custom_sensitivity()
 
     def reset_tune_state(self):
-        """Clear tuner samples and re-seed the forecast at the current sens."""
+        """Clear tuner samples and re-seed the forecast (from the profile model if it has history)."""
         self.tune_x.clear()
         self.tune_y.clear()
-        self.forecast_x = self.current_x_sens
-        self.forecast_y = self.current_y_sens
-        self.last_tune_time = time.time()
+        prior_x = self.sens_model.sample('x')
+        prior_y = self.sens_model.sample('y')
+        if prior_x is None or prior_y is None:
+            self.sens_prior = None
+            self.forecast_x = self.current_x_sens
+            self.forecast_y = self.current_y_sens
+        else:
+            self.sens_prior = (prior_x, prior_y)
+            self.forecast_x, self.forecast_y = self.sens_prior
+        self.last_tune_time = self.clock()
         self.last_forecast_time = 0.0
 
     def toggle_auto_tune(self):
         """Enable/disable automatic drift (the forecast keeps updating either way)."""
         self.auto_tune_enabled = not self.auto_tune_enabled
         # Don't fire a step the instant it's switched on.
-        self.last_tune_time = time.time()
+        self.last_tune_time = self.clock()
         if getattr(self, 'auto_tune_btn', None) is not None:
             if self.auto_tune_enabled:
                 self.auto_tune_btn.config(text="AUTO-TUNE: ON", bg="#00aa00")
             else:
                 self.auto_tune_btn.config(text="AUTO-TUNE: OFF", bg="#555555")
 
+    def experiment_candidates(self):
+        """(x, y) settings to compare: --experiment-sens, or the live setting +/- experiment_step"""
+        if self.experiment_sens:
+            return list(self.experiment_sens)
+        x, y = self.current_x_sens, self.current_y_sens
+        step = self.experiment_step
+        candidates = []
+        for delta in (-step, 0.0, step):
+            cx = round(x + delta, 1)
+            # Keep the live X:Y ratio so only overall speed varies
+            cy = round(y * cx / x, 1)
+            if 1.0 <= cx <= 20.0 and 1.0 <= cy <= 20.0:
+                candidates.append((cx, cy))
+        return candidates
+
+    def toggle_experiment(self):
+        """Start an A/B sensitivity experiment, or abandon the running one"""
+        if self.experiment is not None and not self.experiment.decided:
+            self.end_experiment()
+            return
+        try:
+            self.experiment = SensExperiment(self.experiment_candidates(), self.experiment_metric)
+        except ValueError as e:
+            print(f"Cannot start sensitivity experiment: {e}")
+            self.experiment = None
+            return
+        self.experiment_baseline = (self.current_x_sens, self.current_y_sens)
+        # Drift would move the setting under the test's feet
+        if self.auto_tune_enabled:
+            self.toggle_auto_tune()
+        print(f"Sensitivity experiment ({self.experiment.metric}): "
+              + ", ".join(arm.label for arm in self.experiment.arms))
+        self.apply_experiment_arm(self.experiment.current)
+
+    def apply_experiment_arm(self, arm):
+        """Make an experiment arm the live setting (entry fields follow)"""
+        self.x_sens_var.set(f"{arm.x_sens:.1f}")
+        self.y_sens_var.set(f"{arm.y_sens:.1f}")
+        self.apply_sensitivity(arm.x_sens, arm.y_sens)
+
+    def end_experiment(self):
+        """Abandon an undecided experiment and go back to the setting it started from"""
+        experiment = self.experiment
+        self.experiment = None
+        if experiment is None or experiment.decided:
+            return
+        print(f"Sensitivity experiment abandoned after {experiment.total} shots:")
+        for line in experiment.summary_lines():
+            print(line)
+        x, y = self.experiment_baseline
+        self.x_sens_var.set(f"{x:.1f}")
+        self.y_sens_var.set(f"{y:.1f}")
+        self.apply_sensitivity(x, y)
+
     def get_rolling_accuracy(self, current_time):
         """Get accuracy for the last rolling_window seconds"""
         self.prune_rolling_metrics(current_time)
@@ -1605,9 +1768,9 @@ class AimExercise:
             y_pct = (sum(v for _, v in self.recent_y_undershoots) / len(self.recent_y_undershoots)) * 100
         return x_pct, y_pct
     
-    def spawn_target_at_random_position(self):
-        """Spawn a new purple target at random position within world bounds"""
-        if not self.is_active:
+    def spawn_targets(self, count=1):
+        """Spawn targets with the current mode's spawn policy within world bounds"""
+        if not self.is_active or count <= 0:
             return
         
         # Don't spawn targets when window is not focused
@@ -1620,57 +1783,31 @@ class AimExercise:
         
         # Spawn within the bounded world space (with margin from edges)
         margin = 0.85  # Stay within 85% of bounds so targets aren't at very edge
-        target_yaw = random.uniform(-max_yaw * margin, max_yaw * margin)
-        target_pitch = random.uniform(-max_pitch * margin, max_pitch * margin)
-        
-        self.targets.append({
-            'yaw': target_yaw,
-            'pitch': target_pitch,
-            'spawn_time': time.time(),
-            'paused_duration': 0.0  # Track time paused due to unfocus
-        })
-    
-    def find_closest_target(self):
-        """Find the target closest to the current crosshair position"""
-        if not self.targets:
-            return None, None, float('inf')
-        
-        closest_target = None
-        closest_index = None
-        closest_distance = float('inf')
-        
-        for i, target in enumerate(self.targets):
-            target_yaw = target['yaw']
-            target_pitch = target['pitch']
-            
-            # Calculate angular distance to crosshair
-            yaw_diff = target_yaw - self.yaw
-            while yaw_diff > 180:
-                yaw_diff -= 360
-            while yaw_diff < -180:
-                yaw_diff += 360
-            
-            pitch_diff = target_pitch - self.pitch
-            
-            distance = math.sqrt(yaw_diff**2 + pitch_diff**2)
-            
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_target = target
-                closest_index = i
-        
-        return closest_target, closest_index, closest_distance
+        count += self.spawn_backlog
+        yaws, pitches = self.spawn_policy.spawn(
+            count, self.targets.yaws, self.targets.pitches,
+            max_yaw * margin, max_pitch * margin, self.rng
+        )
+        self.spawn_backlog = count - len(yaws)  # Placed as cells free up
+        state = ALIVE if self.mode['lifetime'] is not None else FROZEN
+        self.targets.add_many(yaws, pitches, self.clock(), self.target_size, state)
+    
+    def find_closest_target(self, yaw=None, pitch=None):
+        """Find the target closest to the crosshair (its current position unless given)"""
+        if yaw is None:
+            yaw, pitch = self.yaw, self.pitch
+        return self.targets.nearest(yaw, pitch)
     
     def get_target_current_size(self, target):
         """Get the current size of a target (constant, no shrinking)"""
-        return self.target_size
+        return target.size
     
     def get_target_effective_age(self, target):
         """Get the effective age of a target, accounting for paused time"""
-        current_time = time.time()
-        raw_age = current_time - target['spawn_time']
+        current_time = self.clock()
+        raw_age = current_time - target.spawn_time
         # Subtract paused duration to get effective age
-        return raw_age - target.get('paused_duration', 0.0)
+        return raw_age - target.paused_duration
     
     def get_target_color(self, target):
         """Get the current color of a target based on its age (purple to blue over lifetime)"""
@@ -1692,617 +1829,820 @@ class AimExercise:
     
     def draw_scene(self):
         """Draw the crosshair, trail, and targets based on camera view"""
-        self.canvas.delete("all")
+        profiler = self.profiler
+        # Clear everything drawn last frame; persistent items (the trail) are updated in place
+        self.renderer.begin_frame()
         
-        current_time = time.time()
+        current_time = self.clock()
         center_x = self.canvas_width // 2
         center_y = self.canvas_height // 2
         
-        # Draw background grid pattern for spatial reference
+        with profiler.section('draw.grid'):
+            self.draw_grid(center_x, center_y)
+        
+        with profiler.section('draw.trail'):
+            self.draw_trail(current_time, center_x, center_y)
+        
+        if self.is_active:
+            with profiler.section('draw.hud'):
+                self.draw_hud(current_time, center_x)
+        
+        with profiler.section('draw.targets'):
+            self.draw_targets(current_time, center_x, center_y)
+        if self.mode['kind'] == 'click':
+            with profiler.section('draw.markers'):
+                self.draw_markers(current_time, center_x, center_y)
+        
+        # Draw crosshair last (on top of everything)
+        with profiler.section('draw.crosshair'):
+            self.draw_crosshair(center_x, center_y)
+        
+        if profiler.overlay_visible:
+            self.draw_profiler_overlay()
+        
+        latency = self.latency
+        if latency.enabled:
+            self.draw_latency_overlay()
+        
+        with profiler.section('draw.present'):
+            self.renderer.present()
+        
+        if latency.enabled:
+            latency.frame_submitted(time.perf_counter_ns())
+    
+    def draw_grid(self, center_x, center_y):
+        """Draw the background grid that scrolls with the camera.
+
+        Lines of constant yaw and pitch every 10 degrees, sampled and pushed
+        through the same projection as targets and markers so they stay lined
+        up with them; under RECTILINEAR the pitch lines curve at a wide FOV.
+        """
+        import numpy as np
+
         grid_color = "#353535"  # Very faint grid
         grid_spacing_degrees = 10  # Grid lines every 10 degrees
         
-        # Calculate grid offset based on camera position
-        yaw_offset = (self.yaw % grid_spacing_degrees) * self.pixels_per_degree
-        pitch_offset = (self.pitch % grid_spacing_degrees) * self.pixels_per_degree
-        
-        # Draw vertical grid lines
-        for x in range(-self.canvas_width, self.canvas_width * 2, int(grid_spacing_degrees * self.pixels_per_degree)):
-            line_x = x - yaw_offset
-            if 0 <= line_x <= self.canvas_width:
-                self.canvas.create_line(
-                    line_x, 0, line_x, self.canvas_height,
-                    fill=grid_color,
-                    width=1,
-                    tags="grid"
-                )
+        if self.projection.mode == LINEAR:
+            # Straight lines: two samples each, spanning just past the screen
+            half_w = self.canvas_width / 2 / self.pixels_per_degree + grid_spacing_degrees
+            half_h = self.canvas_height / 2 / self.pixels_per_degree + grid_spacing_degrees
+            yaw_lo, yaw_hi = self.yaw - half_w, self.yaw + half_w
+            pitch_lo, pitch_hi = self.pitch - half_h, self.pitch + half_h
+            samples = 2
+        else:
+            # Whole sphere; points behind the camera come back as NaN
+            yaw_lo, yaw_hi = self.yaw - 180.0, self.yaw + 180.0
+            pitch_lo, pitch_hi = -90.0, 90.0
+            samples = 73  # 5 degree steps in yaw, 2.5 in pitch
+        
+        first = math.ceil(yaw_lo / grid_spacing_degrees)
+        line_yaws = np.arange(first, math.floor(yaw_hi / grid_spacing_degrees) + 1) * grid_spacing_degrees
+        first = math.ceil(pitch_lo / grid_spacing_degrees)
+        line_pitches = np.arange(first, math.floor(pitch_hi / grid_spacing_degrees) + 1) * grid_spacing_degrees
+        if self.projection.mode != LINEAR:
+            line_pitches = line_pitches[np.abs(line_pitches) < 90]  # The poles are points, not lines
+        
+        # Every sample of every line in one projection batch: vertical (constant
+        # yaw) lines first, then horizontal (constant pitch) ones
+        along_pitch = np.linspace(pitch_lo, pitch_hi, samples)
+        along_yaw = np.linspace(yaw_lo, yaw_hi, samples)
+        yaws = np.concatenate([np.repeat(line_yaws, samples), np.tile(along_yaw, len(line_pitches))])
+        pitches = np.concatenate([np.tile(along_pitch, len(line_yaws)), np.repeat(line_pitches, samples)])
+        xs, ys, _ = self.projection.project(
+            yaws, pitches, self.yaw, self.pitch,
+            center_x, center_y, self.canvas_width, self.canvas_height
+        )
         
-        # Draw horizontal grid lines
-        for y in range(-self.canvas_height, self.canvas_height * 2, int(grid_spacing_degrees * self.pixels_per_degree)):
-            line_y = y + pitch_offset
-            if 0 <= line_y <= self.canvas_height:
-                self.canvas.create_line(
-                    0, line_y, self.canvas_width, line_y,
-                    fill=grid_color,
-                    width=1,
-                    tags="grid"
-                )
+        # Drop points behind the camera or far off screen (near the horizon);
+        # what is left of each line is one contiguous run
+        with np.errstate(invalid='ignore'):
+            keep = ((np.abs(xs - center_x) < self.canvas_width * 4) &
+                    (np.abs(ys - center_y) < self.canvas_height * 4)).reshape(-1, samples)
+            xs = np.where(keep, xs.reshape(-1, samples), np.nan)
+            ys = np.where(keep, ys.reshape(-1, samples), np.nan)
+        
+        # Only lines with a segment whose bounding box touches the screen
+        drawn = keep.sum(axis=1) >= 2
+        with np.errstate(invalid='ignore'):
+            drawn[drawn] &= ((np.nanmax(xs[drawn], axis=1) >= 0) &
+                             (np.nanmin(xs[drawn], axis=1) <= self.canvas_width) &
+                             (np.nanmax(ys[drawn], axis=1) >= 0) &
+                             (np.nanmin(ys[drawn], axis=1) <= self.canvas_height))
+        for row in drawn.nonzero()[0].tolist():
+            line_keep = keep[row]
+            coords = np.column_stack([xs[row][line_keep], ys[row][line_keep]]).ravel().tolist()
+            self.view.create_line(coords, fill=grid_color, width=1, tags="grid")
+    
+    def draw_trail(self, current_time, center_x, center_y):
+        """Point the trail lines at the crosshair positions of the last trail_fade_time"""
+        if not (self.trail_enabled and self.is_active):
+            self.trail_renderer.hide()
+            return
+        yaws, pitches, times = self.trail.since(current_time - self.trail_fade_time)
+        xs, ys, _ = self.projection.project(
+            yaws, pitches, self.yaw, self.pitch,
+            center_x, center_y, self.canvas_width, self.canvas_height
+        )
+        import numpy as np
+        keep = np.isfinite(xs)  # Drop points behind the camera (rectilinear)
+        self.trail_renderer.update(xs[keep], ys[keep], current_time - times[keep], self.trail_fade_time)
+    
+    def toggle_trail(self):
+        """Show/hide the crosshair trail"""
+        self.trail_enabled = not self.trail_enabled
+    
+    def generate_report(self):
+        """Build the HTML report for the last archived session off the Tk thread"""
+        if self.report_task is not None and not self.report_task.done():
+            print("Session report already being built")
+            return
+        from src import report  # Pulls in multiprocessing; keep it off the cold-start path
+        archive = self.last_archive_path or report.latest_archive()
+        if archive is None:
+            print("No approach paths to report on yet; run with --archive-paths")
+            return
+        print(f"Building session report for {archive}...")
+        shots_path = os.path.join(data_dir(), 'shots.jsonl')
+
+        async def build():
+            try:
+                path = await self.services.offload(report.build_report, [archive], shots_path)
+            except (OSError, ValueError) as e:
+                print(f"Could not build session report: {e}")
+                return
+            self.services.call_in_tk(self.on_report_ready, path)
+
+        self.report_task = self.services.spawn(build(), "session-report")
+    
+    def on_report_ready(self, path):
+        """Tk-side completion of generate_report"""
+        print(f"Session report written to {path}")
+        if not self.is_active:
+            self.stats_label.config(text=f"Report saved: {path}")
+    
+    def wake_for_services(self):
+        """Have the Tk thread run queued service callbacks; called from the service loop thread"""
+        self.root.event_generate('<<ServiceCallbacks>>', when='tail')
+    
+    def draw_hud(self, current_time, center_x):
+        """Draw the stats, timer and auto-tune overlay along the top of the canvas"""
+        accuracy = self.stats.get_accuracy()
+        avg_time = self.stats.get_average_reaction_time()
         
-        # Draw stats overlay at top
-        if self.is_active:
-            accuracy = self.stats.get_accuracy()
-            avg_time = self.stats.get_average_reaction_time()
-            
-            # Draw timer in top right corner
-            timer_minutes = int(self.session_timer // 60)
-            timer_seconds = int(self.session_timer % 60)
-            timer_text = f"{timer_minutes:02d}:{timer_seconds:02d}"
-            self.canvas.create_text(
-                self.canvas_width - 60,
-                30,
-                text=timer_text,
-                font=("Arial", 20, "bold"),
-                fill="#ffffff",
-                tags="timer"
+        # Draw timer in top right corner
+        timer_minutes = int(self.session_timer // 60)
+        timer_seconds = int(self.session_timer % 60)
+        timer_text = f"{timer_minutes:02d}:{timer_seconds:02d}"
+        self.view.create_text(
+            self.canvas_width - 60,
+            30,
+            text=timer_text,
+            font=("Arial", 20, "bold"),
+            fill="#ffffff",
+            tags="timer"
+        )
+        
+        # Draw last 3 streak tallies below timer (top right) - only in click modes
+        if self.mode['kind'] == 'click':
+            # Format streak history, showing oldest to newest (left to right)
+            streak_display = []
+            for i in range(3):
+                idx = len(self.streak_history) - 3 + i
+                if idx >= 0 and idx < len(self.streak_history):
+                    streak_display.append(str(self.streak_history[idx]))
+                else:
+                    streak_display.append("-")
+            streak_history_text = f"Last 3: {streak_display[0]} | {streak_display[1]} | {streak_display[2]}"
+            self.view.create_text(
+                self.canvas_width - 80,
+                55,
+                text=streak_history_text,
+                font=("Arial", 12),
+                fill="#aaaaaa",
+                tags="streak_history"
             )
             
-            # Draw last 3 streak tallies below timer (top right) - only in random mode
-            if self.game_mode == 'random':
-                # Format streak history, showing oldest to newest (left to right)
-                streak_display = []
-                for i in range(3):
-                    idx = len(self.streak_history) - 3 + i
-                    if idx >= 0 and idx < len(self.streak_history):
-                        streak_display.append(str(self.streak_history[idx]))
-                    else:
-                        streak_display.append("-")
-                streak_history_text = f"Last 3: {streak_display[0]} | {streak_display[1]} | {streak_display[2]}"
-                self.canvas.create_text(
-                    self.canvas_width - 80,
-                    55,
-                    text=streak_history_text,
-                    font=("Arial", 12),
-                    fill="#aaaaaa",
-                    tags="streak_history"
-                )
-                
-                # First line: basic stats with streak
-                stats_text = f"Hits: {self.stats.hits} | Misses: {self.stats.misses} | Accuracy: {accuracy:.1f}%"
-                if avg_time > 0:
-                    stats_text += f" | Avg: {avg_time:.3f}s"
-                stats_text += f" | Streak: {self.current_streak} (Best: {self.best_streak})"
-                avg_precision = self.get_average_hit_precision()
-                if avg_precision > 0:
-                    stats_text += f" | Prec: {avg_precision:.1f}%"
-                
-                # Second line: path efficiency breakdown
-                avg_efficiency = self.get_average_path_efficiency()
-                avg_x_eff = self.get_average_x_efficiency()
-                avg_y_eff = self.get_average_y_efficiency()
-                
-                efficiency_text = ""
-                if avg_efficiency > 0:
-                    efficiency_text = f"Path: {avg_efficiency:.1f}%"
-                if avg_x_eff > 0:
-                    efficiency_text += f" | X: {avg_x_eff:.1f}%"
-                if avg_y_eff > 0:
-                    efficiency_text += f" | Y: {avg_y_eff:.1f}%"
-                
-                # Third line: 30-second rolling metrics
-                rolling_acc = self.get_rolling_accuracy(current_time)
-                rolling_rt = self.get_rolling_avg_reaction_time(current_time)
-                rolling_eff = self.get_rolling_path_efficiency(current_time)
-                rolling_prec = self.get_rolling_precision(current_time)
-                
-                rolling_text = f"[30s] Acc: {rolling_acc:.1f}%"
-                if rolling_rt > 0:
-                    rolling_text += f" | Avg: {rolling_rt:.3f}s"
-                if rolling_eff > 0:
-                    rolling_text += f" | Path: {rolling_eff:.1f}%"
-                if rolling_prec > 0:
-                    rolling_text += f" | Prec: {rolling_prec:.1f}%"
-                
-                # Fourth line: approach analysis (overshoot/undershoot from last shot)
-                approach_text = ""
-                if self.last_shot_analysis:
-                    data = self.last_shot_analysis
-                    approach_text = f"LAST: {self.last_shot_type}"
-                    # Show overshoot distances in degrees
-                    if data['x_max_overshoot'] > 0 or data['y_max_overshoot'] > 0:
-                        approach_text += f" | OVER: X={data['x_max_overshoot']:.2f}° Y={data['y_max_overshoot']:.2f}°"
-                    # Show if undershoot occurred (shot before reaching target edge)
-                    x_under = len(self.debug_x_undershoot_points) > 0
-                    y_under = len(self.debug_y_undershoot_points) > 0
-                    if x_under or y_under:
-                        under_parts = []
-                        if x_under:
-                            under_parts.append("X")
-                        if y_under:
-                            under_parts.append("Y")
-                        approach_text += f" | UNDER: {'+'.join(under_parts)}"
-                
-                # Fifth line: percentages for overs and unders (session totals)
-                last_shot_text = ""
-                total_samples = len(self.x_overshoots)
-                if total_samples > 0:
-                    # Count shots with overs/unders (threshold > 0 means it occurred)
-                    x_over_count = sum(1 for x in self.x_overshoots if x > 0)
-                    y_over_count = sum(1 for y in self.y_overshoots if y > 0)
-                    x_under_count = sum(1 for x in self.x_micro_adjustments if x > 0)
-                    y_under_count = sum(1 for y in self.y_micro_adjustments if y > 0)
-                    
-                    # Calculate percentages
-                    x_over_pct = (x_over_count / total_samples) * 100
-                    y_over_pct = (y_over_count / total_samples) * 100
-                    x_under_pct = (x_under_count / total_samples) * 100
-                    y_under_pct = (y_under_count / total_samples) * 100
-                    
-                    last_shot_text = f"Session({total_samples}): OVER X={x_over_pct:.0f}% Y={y_over_pct:.0f}% | UNDER X={x_under_pct:.0f}% Y={y_under_pct:.0f}%"
-                
-                # Sixth line: 30-second rolling overshoot/undershoot
-                rolling_over_under_text = ""
-                rolling_x_over, rolling_y_over = self.get_rolling_overshoot_percentages(current_time)
-                rolling_x_under, rolling_y_under = self.get_rolling_undershoot_percentages(current_time)
-                rolling_samples = len(self.recent_x_overshoots)
-                if rolling_samples > 0:
-                    rolling_over_under_text = f"[30s]({rolling_samples}): OVER X={rolling_x_over:.0f}% Y={rolling_y_over:.0f}% | UNDER X={rolling_x_under:.0f}% Y={rolling_y_under:.0f}%"
-
-            # Show current sensitivity (X and Y) and scoped status
-            sens_display = f" | X: {self.current_x_sens:.1f}% Y: {self.current_y_sens:.1f}%"
-            if self.scoped_active:
-                sens_display += f" | SCOPED ({self.scoped_sens_percent:.1f}%)"
-            stats_text += sens_display
+            # First line: basic stats with streak
+            stats_text = f"Hits: {self.stats.hits} | Misses: {self.stats.misses} | Accuracy: {accuracy:.1f}%"
+            if avg_time > 0:
+                stats_text += f" | Avg: {avg_time:.3f}s"
+            stats_text += f" | Streak: {self.current_streak} (Best: {self.best_streak})"
+            stats_text += f" | Score: {self.score:.0f}"
+            avg_precision = self.get_average_hit_precision()
+            if avg_precision > 0:
+                stats_text += f" | Prec: {avg_precision:.1f}%"
             
-            # Add message if mouse is unlocked
-            if not self.mouse_locked and self.mouse_was_locked:
-                stats_text += " | CLICK TO REACTIVATE MOUSE LOCK"
+            # Second line: path efficiency breakdown
+            avg_efficiency = self.get_average_path_efficiency()
+            avg_x_eff = self.get_average_x_efficiency()
+            avg_y_eff = self.get_average_y_efficiency()
             
-            # Draw first line of stats
-            self.canvas.create_text(
-                center_x,
-                30,
-                text=stats_text,
-                font=("Arial", 16, "bold"),
-                fill="#00ff00",
-                tags="stats"
-            )
+            efficiency_text = ""
+            if avg_efficiency > 0:
+                efficiency_text = f"Path: {avg_efficiency:.1f}%"
+            if avg_x_eff > 0:
+                efficiency_text += f" | X: {avg_x_eff:.1f}%"
+            if avg_y_eff > 0:
+                efficiency_text += f" | Y: {avg_y_eff:.1f}%"
             
-            # Draw second line (efficiency breakdown) if we have data
-            if efficiency_text:
-                self.canvas.create_text(
-                    center_x,
-                    55,
-                    text=efficiency_text,
-                    font=("Arial", 14),
-                    fill="#ffaa00",  # Orange for efficiency stats
-                    tags="stats"
-                )
+            # Third line: 30-second rolling metrics
+            rolling_acc = self.get_rolling_accuracy(current_time)
+            rolling_rt = self.get_rolling_avg_reaction_time(current_time)
+            rolling_eff = self.get_rolling_path_efficiency(current_time)
+            rolling_prec = self.get_rolling_precision(current_time)
             
-            # Draw third line (rolling 30s metrics) if we have data
-            if rolling_text:
-                self.canvas.create_text(
-                    center_x,
-                    80,
-                    text=rolling_text,
-                    font=("Arial", 13),
-                    fill="#00ccff",  # Cyan for rolling metrics
-                    tags="stats"
-                )
+            rolling_text = f"[30s] Acc: {rolling_acc:.1f}%"
+            if rolling_rt > 0:
+                rolling_text += f" | Avg: {rolling_rt:.3f}s"
+            if rolling_eff > 0:
+                rolling_text += f" | Path: {rolling_eff:.1f}%"
+            if rolling_prec > 0:
+                rolling_text += f" | Prec: {rolling_prec:.1f}%"
             
-            # Draw fourth line (approach analysis) if we have data
-            if approach_text:
-                y_pos = 105
-                self.canvas.create_text(
-                    center_x,
-                    y_pos,
-                    text=approach_text,
-                    font=("Arial", 13),
-                    fill="#ff6666",  # Light red for approach analysis
-                    tags="stats"
-                )
+            # Fourth line: approach analysis (overshoot/undershoot from last shot)
+            approach_text = ""
+            if self.last_shot_analysis:
+                data = self.last_shot_analysis
+                approach_text = f"LAST: {self.last_shot_type}"
+                # Show overshoot distances in degrees
+                if data['x_max_overshoot'] > 0 or data['y_max_overshoot'] > 0:
+                    approach_text += f" | OVER: X={data['x_max_overshoot']:.2f}° Y={data['y_max_overshoot']:.2f}°"
+                # Show if undershoot occurred (shot before reaching target edge)
+                x_under = len(self.debug_x_undershoot_points) > 0
+                y_under = len(self.debug_y_undershoot_points) > 0
+                if x_under or y_under:
+                    under_parts = []
+                    if x_under:
+                        under_parts.append("X")
+                    if y_under:
+                        under_parts.append("Y")
+                    approach_text += f" | UNDER: {'+'.join(under_parts)}"
             
-            # Draw fifth line (last shot details) if we have data
-            if last_shot_text:
-                y_pos = 130
-                self.canvas.create_text(
-                    center_x,
-                    y_pos,
-                    text=last_shot_text,
-                    font=("Arial", 12),
-                    fill="#66ffff",  # Cyan for debug info
-                    tags="stats"
-                )
-            
-            # Draw sixth line (30-second rolling over/under) if we have data
-            if rolling_over_under_text:
-                self.canvas.create_text(
-                    center_x,
-                    155,
-                    text=rolling_over_under_text,
-                    font=("Arial", 12),
-                    fill="#ffff66",  # Yellow for rolling over/under
-                    tags="stats"
-                )
+            # Fifth line: percentages for overs and unders (session totals)
+            last_shot_text = ""
+            total_samples = len(self.x_overshoots)
+            if total_samples > 0:
+                # Count shots with overs/unders (threshold > 0 means it occurred)
+                x_over_count = self.x_overshoots.positive
+                y_over_count = self.y_overshoots.positive
+                x_under_count = self.x_micro_adjustments.positive
+                y_under_count = self.y_micro_adjustments.positive
+                
+                # Calculate percentages
+                x_over_pct = (x_over_count / total_samples) * 100
+                y_over_pct = (y_over_count / total_samples) * 100
+                x_under_pct = (x_under_count / total_samples) * 100
+                y_under_pct = (y_under_count / total_samples) * 100
+                
+                last_shot_text = f"Session({total_samples}): OVER X={x_over_pct:.0f}% Y={y_over_pct:.0f}% | UNDER X={x_under_pct:.0f}% Y={y_under_pct:.0f}%"
             
-            # Auto-tune / forecasted-perfect-settings line (always shown)
-            n_tune = min(len(self.tune_x), len(self.tune_y))
-            at_state = "ON" if self.auto_tune_enabled else "OFF"
-            at_color = "#00ff88" if self.auto_tune_enabled else "#888888"
-            if n_tune < self.tune_min_shots:
-                forecast_text = (f"AUTO-TUNE {at_state} [T]   "
-                                 f"Forecast: calibrating {n_tune}/{self.tune_min_shots} shots")
-            else:
-                def _arrow(fore, live):
-                    if fore > live + 0.05:
-                        return "↑"   # driving up
-                    if fore < live - 0.05:
-                        return "↓"   # driving down
-                    return "•"       # at target
-                ax = _arrow(self.forecast_x, self.current_x_sens)
-                ay = _arrow(self.forecast_y, self.current_y_sens)
-                forecast_text = (f"AUTO-TUNE {at_state} [T]   Forecast  "
-                                 f"X {self.forecast_x:.1f}{ax}  Y {self.forecast_y:.1f}{ay}   "
-                                 f"(now X {self.current_x_sens:.1f} / Y {self.current_y_sens:.1f})")
-            self.canvas.create_text(
+            # Sixth line: 30-second rolling overshoot/undershoot
+            rolling_over_under_text = ""
+            rolling_x_over, rolling_y_over = self.get_rolling_overshoot_percentages(current_time)
+            rolling_x_under, rolling_y_under = self.get_rolling_undershoot_percentages(current_time)
+            rolling_samples = len(self.recent_x_overshoots)
+            if rolling_samples > 0:
+                rolling_over_under_text = f"[30s]({rolling_samples}): OVER X={rolling_x_over:.0f}% Y={rolling_y_over:.0f}% | UNDER X={rolling_x_under:.0f}% Y={rolling_y_under:.0f}%"
+        else:
+            # Tracking modes: continuous error instead of per-shot analysis
+            stats_text = f"Score: {self.score:.0f}"
+            efficiency_text = self.get_tracking_text()
+            rolling_text = ""
+            approach_text = ""
+            last_shot_text = ""
+            rolling_over_under_text = ""
+
+        # Show current sensitivity (X and Y) and scoped status
+        sens_display = f" | X: {self.current_x_sens:.1f}% Y: {self.current_y_sens:.1f}%"
+        if self.scoped_active:
+            sens_display += f" | SCOPED ({self.scoped_sens_percent:.1f}%)"
+        stats_text += sens_display
+        
+        # Add message if mouse is unlocked
+        if not self.mouse_locked and self.mouse_was_locked:
+            stats_text += " | CLICK TO REACTIVATE MOUSE LOCK"
+        
+        # Draw first line of stats
+        self.view.create_text(
+            center_x,
+            30,
+            text=stats_text,
+            font=("Arial", 16, "bold"),
+            fill="#00ff00",
+            tags="stats"
+        )
+        
+        # Draw second line (efficiency breakdown) if we have data
+        if efficiency_text:
+            self.view.create_text(
+                center_x,
+                55,
+                text=efficiency_text,
+                font=("Arial", 14),
+                fill="#ffaa00",  # Orange for efficiency stats
+                tags="stats"
+            )
+        
+        # Draw third line (rolling 30s metrics) if we have data
+        if rolling_text:
+            self.view.create_text(
+                center_x,
+                80,
+                text=rolling_text,
+                font=("Arial", 13),
+                fill="#00ccff",  # Cyan for rolling metrics
+                tags="stats"
+            )
+        
+        # Draw fourth line (approach analysis) if we have data
+        if approach_text:
+            y_pos = 105
+            self.view.create_text(
+                center_x,
+                y_pos,
+                text=approach_text,
+                font=("Arial", 13),
+                fill="#ff6666",  # Light red for approach analysis
+                tags="stats"
+            )
+        
+        # Draw fifth line (last shot details) if we have data
+        if last_shot_text:
+            y_pos = 130
+            self.view.create_text(
                 center_x,
-                182,
-                text=forecast_text,
-                font=("Arial", 13, "bold"),
-                fill=at_color,
+                y_pos,
+                text=last_shot_text,
+                font=("Arial", 12),
+                fill="#66ffff",  # Cyan for debug info
+                tags="stats"
+            )
+        
+        # Draw sixth line (30-second rolling over/under) if we have data
+        if rolling_over_under_text:
+            self.view.create_text(
+                center_x,
+                155,
+                text=rolling_over_under_text,
+                font=("Arial", 12),
+                fill="#ffff66",  # Yellow for rolling over/under
+                tags="stats"
+            )
+        
+        # Auto-tune / forecasted-perfect-settings line (always shown)
+        n_tune = min(len(self.tune_x), len(self.tune_y))
+        at_state = "ON" if self.auto_tune_enabled else "OFF"
+        at_color = "#00ff88" if self.auto_tune_enabled else "#888888"
+        if n_tune < self.tune_min_shots and self.sens_prior is None:
+            forecast_text = (f"AUTO-TUNE {at_state} [T]   "
+                             f"Forecast: calibrating {n_tune}/{self.tune_min_shots} shots")
+        else:
+            def _arrow(fore, live):
+                if fore > live + 0.05:
+                    return "↑"   # driving up
+                if fore < live - 0.05:
+                    return "↓"   # driving down
+                return "•"       # at target
+            ax = _arrow(self.forecast_x, self.current_x_sens)
+            ay = _arrow(self.forecast_y, self.current_y_sens)
+            forecast_text = (f"AUTO-TUNE {at_state} [T]   Forecast  "
+                             f"X {self.forecast_x:.1f}{ax}  Y {self.forecast_y:.1f}{ay}   "
+                             f"(now X {self.current_x_sens:.1f} / Y {self.current_y_sens:.1f})")
+        self.view.create_text(
+            center_x,
+            182,
+            text=forecast_text,
+            font=("Arial", 13, "bold"),
+            fill=at_color,
+            tags="stats"
+        )
+        
+        if self.experiment is not None:
+            self.view.create_text(
+                center_x,
+                207,
+                text=self.experiment.status_text(),
+                font=("Arial", 12, "bold"),
+                fill="#ffcc00" if self.experiment.decided else "#66ccff",
                 tags="stats"
             )
 
-            # Draw scoped indicator if active
-            if self.scoped_active:
-                self.canvas.create_text(
-                    center_x,
-                    self.canvas_height - 40,
-                    text=f"⊕ SCOPED ({self.scoped_sens_percent:.1f}%)",
-                    font=("Arial", 18, "bold"),
-                    fill="#ff9900",
-                    tags="scoped_indicator"
-                )
+        # Draw scoped indicator if active
+        if self.scoped_active:
+            self.view.create_text(
+                center_x,
+                self.canvas_height - 40,
+                text=f"⊕ SCOPED ({self.scoped_sens_percent:.1f}%)",
+                font=("Arial", 18, "bold"),
+                fill="#ff9900",
+                tags="scoped_indicator"
+            )
+    
+    def draw_targets(self, current_time, center_x, center_y):
+        """Expire old targets (spawning replacements) and draw the live ones"""
+        # Expire targets in one vectorized pass (only when focused)
+        expired_ids = []
+        if self.mouse_locked and self.mode['lifetime'] is not None:
+            expired_ids = self.targets.expired_ids(current_time, self.target_lifetime)
+        
+        for target_id in expired_ids:
+            target = self.targets.get(target_id)
+            self.shot_events.publish(ShotEvent(
+                EXPIRE, current_time, target_id, target.yaw, target.pitch, self.yaw, self.pitch,
+                self.get_target_current_size(target) / self.pixels_per_degree))
+            self.targets.remove(target_id)
+        
+        # Project every remaining target at once; only DRAW those on screen
+        # (off-screen targets stay in the store regardless)
+        targets = self.targets
+        projection = self.projection
+        half_sizes = projection.screen_radii(
+            targets.yaws, targets.pitches, targets.sizes / self.pixels_per_degree,
+            self.yaw, self.pitch
+        )
+        xs, ys, visible = projection.project(
+            targets.yaws, targets.pitches, self.yaw, self.pitch,
+            center_x, center_y, self.canvas_width, self.canvas_height,
+            margin=half_sizes + 10
+        )
+        for row in visible.nonzero()[0].tolist():
+            target = targets.at(row)
+            current_target_size = float(half_sizes[row])
+            target_screen_x = float(xs[row])
+            target_screen_y = float(ys[row])
+            
+            # Color changes from purple to blue over lifetime
+            fill_color = self.get_target_color(target)
+            outline_color = "#ffffff"
+            outline_width = 3
+            
+            # Draw SQUARE target
+            self.view.create_rectangle(
+                target_screen_x - current_target_size,
+                target_screen_y - current_target_size,
+                target_screen_x + current_target_size,
+                target_screen_y + current_target_size,
+                fill=fill_color,
+                outline=outline_color,
+                width=outline_width,
+                tags="target"
+            )
+            
+            # Draw target center dot
+            self.view.create_oval(
+                target_screen_x - 3,
+                target_screen_y - 3,
+                target_screen_x + 3,
+                target_screen_y + 3,
+                fill="#ffffff",
+                tags="target"
+            )
         
-        # Draw all targets
-        # Handle expiration and drawing for random mode
-        if self.game_mode == 'random':
-            targets_to_remove = []
+        # Spawn replacements for expired targets (only when focused)
+        if expired_ids:
+            self.spawn_targets(len(expired_ids))
+            # Reset path for next target
+            self.path_points = [(self.yaw, self.pitch)]
+            self.path_thinned = False
+    
+    def draw_markers(self, current_time, center_x, center_y):
+        """Draw the fading OVER/UNDER approach-analysis markers on top of targets"""
+        # Calculate marker opacity based on age
+        marker_age = current_time - self.debug_markers_timestamp
+        marker_opacity = max(0, 1 - (marker_age / self.debug_markers_fade_duration))
+        
+        # Skip drawing if fully faded
+        if marker_opacity > 0:
+            # Project every marker point in one batch, then split it back into
+            # (x, y, on_screen) lists: X/Y overshoot, X/Y undershoots, pauses
+            groups = [
+                [self.debug_x_overshoot_pos] if self.debug_x_overshoot_pos is not None else [],
+                [self.debug_y_overshoot_pos] if self.debug_y_overshoot_pos is not None else [],
+                list(self.debug_x_undershoot_points),
+                list(self.debug_y_undershoot_points),
+                list(self.debug_pause_points)
+            ]
+            xs, ys, visible = self.projection.project_points(
+                [point for group in groups for point in group], self.yaw, self.pitch,
+                center_x, center_y, self.canvas_width, self.canvas_height
+            )
+            projected = []
+            start = 0
+            for group in groups:
+                end = start + len(group)
+                projected.append(list(zip(xs[start:end].tolist(), ys[start:end].tolist(),
+                                          visible[start:end].tolist())))
+                start = end
+            x_over, y_over, x_under_positions, y_under_positions, pause_positions = projected
             
-            # Check for expired targets and draw all targets
-            for target in self.targets:
-                target_yaw = target['yaw']
-                target_pitch = target['pitch']
-                target_age = self.get_target_effective_age(target)
-                
-                # Only check expiration when focused (mouse_locked)
-                if self.mouse_locked and target_age >= self.target_lifetime:
-                    targets_to_remove.append(target)
-                    self.stats.record_miss()
-                    self.play_sound('miss')
-                    # Record completed streak to history before resetting
-                    if self.current_streak > 0:
-                        self.streak_history.append(self.current_streak)
-                        # Keep only last 3 streaks
-                        if len(self.streak_history) > 3:
-                            self.streak_history.pop(0)
-                    # Reset streak on target expiration
-                    self.current_streak = 0
-                    # Record miss for rolling metrics
-                    self.recent_misses.append(current_time)
-                    continue
-                
-                # Calculate current size
-                current_target_size = self.get_target_current_size(target)
-                
-                yaw_diff = target_yaw - self.yaw
-                pitch_diff = target_pitch - self.pitch
-                
-                while yaw_diff > 180:
-                    yaw_diff -= 360
-                while yaw_diff < -180:
-                    yaw_diff += 360
-                
-                target_screen_x = center_x + (yaw_diff * self.pixels_per_degree)
-                target_screen_y = center_y - (pitch_diff * self.pixels_per_degree)
-                
-                # Only DRAW if on screen (but target stays in list regardless)
-                margin = current_target_size + 10
-                if (-margin <= target_screen_x <= self.canvas_width + margin and 
-                    -margin <= target_screen_y <= self.canvas_height + margin):
-                    
-                    # Color changes from purple to blue over lifetime
-                    fill_color = self.get_target_color(target)
-                    outline_color = "#ffffff"
-                    outline_width = 3
-                    
-                    # Draw SQUARE target
-                    self.canvas.create_rectangle(
-                        target_screen_x - current_target_size,
-                        target_screen_y - current_target_size,
-                        target_screen_x + current_target_size,
-                        target_screen_y + current_target_size,
+            # Draw overshoot markers - combine into "XY" if positions are close
+            x_pos = x_over[0] if x_over else None
+            y_pos = y_over[0] if y_over else None
+            
+            # Helper function to apply opacity to hex color
+            def fade_color(hex_color, opacity):
+                # Parse hex color
+                r = int(hex_color[1:3], 16)
+                g = int(hex_color[3:5], 16)
+                b = int(hex_color[5:7], 16)
+                # Fade toward background (#2a2a2a)
+                bg_r, bg_g, bg_b = 42, 42, 42
+                r = int(bg_r + (r - bg_r) * opacity)
+                g = int(bg_g + (g - bg_g) * opacity)
+                b = int(bg_b + (b - bg_b) * opacity)
+                return f'#{r:02x}{g:02x}{b:02x}'
+            
+            # Check if markers are close enough to combine (within 25 pixels)
+            combine_threshold = 25
+            should_combine = False
+            if x_pos and y_pos:
+                dist = math.sqrt((x_pos[0] - y_pos[0])**2 + (x_pos[1] - y_pos[1])**2)
+                should_combine = dist < combine_threshold
+            
+            if should_combine:
+                # Draw combined XY marker (use X position, red color)
+                x, y, on_screen = x_pos
+                if on_screen:
+                    fill_color = fade_color("#ff0000", marker_opacity)
+                    outline_color = fade_color("#000000", marker_opacity)
+                    text_color = fade_color("#000000", marker_opacity)
+                    self.view.create_oval(
+                        x - 12, y - 12, x + 12, y + 12,
                         fill=fill_color,
                         outline=outline_color,
-                        width=outline_width,
-                        tags="target"
+                        width=2,
+                        tags="debug_marker"
                     )
-                    
-                    # Draw target center dot
-                    self.canvas.create_oval(
-                        target_screen_x - 3,
-                        target_screen_y - 3,
-                        target_screen_x + 3,
-                        target_screen_y + 3,
-                        fill="#ffffff",
-                        tags="target"
+                    self.view.create_text(
+                        x, y,
+                        text="XY",
+                        fill=text_color,
+                        font=("Arial", 10, "bold"),
+                        tags="debug_marker"
                     )
-            
-            # Remove expired targets and spawn replacements (only when focused)
-            for target in targets_to_remove:
-                self.targets.remove(target)
-                if self.mouse_locked:
-                    self.spawn_target_at_random_position()
-                # Reset path for next target
-                self.path_points = [(self.yaw, self.pitch)]
-        
-        # Draw OVER/UNDER markers on top of targets (with fade effect)
-        if self.game_mode == 'random':
-            # Calculate marker opacity based on age
-            marker_age = current_time - self.debug_markers_timestamp
-            marker_opacity = max(0, 1 - (marker_age / self.debug_markers_fade_duration))
-            
-            # Skip drawing if fully faded
-            if marker_opacity > 0:
-                # Draw overshoot markers - combine into "XY" if positions are close
-                x_pos = None
-                y_pos = None
-                
-                if self.debug_x_overshoot_pos is not None:
-                    yaw, pitch = self.debug_x_overshoot_pos
-                    yaw_diff = yaw - self.yaw
-                    while yaw_diff > 180:
-                        yaw_diff -= 360
-                    while yaw_diff < -180:
-                        yaw_diff += 360
-                    x_pos = (center_x + (yaw_diff * self.pixels_per_degree),
-                             center_y - ((pitch - self.pitch) * self.pixels_per_degree))
-                
-                if self.debug_y_overshoot_pos is not None:
-                    yaw, pitch = self.debug_y_overshoot_pos
-                    yaw_diff = yaw - self.yaw
-                    while yaw_diff > 180:
-                        yaw_diff -= 360
-                    while yaw_diff < -180:
-                        yaw_diff += 360
-                    y_pos = (center_x + (yaw_diff * self.pixels_per_degree),
-                             center_y - ((pitch - self.pitch) * self.pixels_per_degree))
-                
-                # Helper function to apply opacity to hex color
-                def fade_color(hex_color, opacity):
-                    # Parse hex color
-                    r = int(hex_color[1:3], 16)
-                    g = int(hex_color[3:5], 16)
-                    b = int(hex_color[5:7], 16)
-                    # Fade toward background (#2a2a2a)
-                    bg_r, bg_g, bg_b = 42, 42, 42
-                    r = int(bg_r + (r - bg_r) * opacity)
-                    g = int(bg_g + (g - bg_g) * opacity)
-                    b = int(bg_b + (b - bg_b) * opacity)
-                    return f'#{r:02x}{g:02x}{b:02x}'
-                
-                # Check if markers are close enough to combine (within 25 pixels)
-                combine_threshold = 25
-                should_combine = False
-                if x_pos and y_pos:
-                    dist = math.sqrt((x_pos[0] - y_pos[0])**2 + (x_pos[1] - y_pos[1])**2)
-                    should_combine = dist < combine_threshold
-                
-                if should_combine:
-                    # Draw combined XY marker (use X position, red color)
-                    x, y = x_pos
-                    if 0 <= x <= self.canvas_width and 0 <= y <= self.canvas_height:
-                        fill_color = fade_color("#ff0000", marker_opacity)
+            else:
+                # Draw X marker separately
+                if x_pos:
+                    x, y, on_screen = x_pos
+                    if on_screen:
+                        fill_color = fade_color("#ffff00", marker_opacity)
                         outline_color = fade_color("#000000", marker_opacity)
                         text_color = fade_color("#000000", marker_opacity)
-                        self.canvas.create_oval(
-                            x - 12, y - 12, x + 12, y + 12,
+                        self.view.create_oval(
+                            x - 10, y - 10, x + 10, y + 10,
                             fill=fill_color,
                             outline=outline_color,
                             width=2,
                             tags="debug_marker"
                         )
-                        self.canvas.create_text(
+                        self.view.create_text(
                             x, y,
-                            text="XY",
+                            text="X",
                             fill=text_color,
-                            font=("Arial", 10, "bold"),
+                            font=("Arial", 11, "bold"),
                             tags="debug_marker"
                         )
-                else:
-                    # Draw X marker separately
-                    if x_pos:
-                        x, y = x_pos
-                        if 0 <= x <= self.canvas_width and 0 <= y <= self.canvas_height:
-                            fill_color = fade_color("#ffff00", marker_opacity)
-                            outline_color = fade_color("#000000", marker_opacity)
-                            text_color = fade_color("#000000", marker_opacity)
-                            self.canvas.create_oval(
-                                x - 10, y - 10, x + 10, y + 10,
-                                fill=fill_color,
-                                outline=outline_color,
-                                width=2,
-                                tags="debug_marker"
-                            )
-                            self.canvas.create_text(
-                                x, y,
-                                text="X",
-                                fill=text_color,
-                                font=("Arial", 11, "bold"),
-                                tags="debug_marker"
-                            )
-                    
-                    # Draw Y marker separately
-                    if y_pos:
-                        x, y = y_pos
-                        if 0 <= x <= self.canvas_width and 0 <= y <= self.canvas_height:
-                            fill_color = fade_color("#ff8800", marker_opacity)
-                            outline_color = fade_color("#000000", marker_opacity)
-                            text_color = fade_color("#000000", marker_opacity)
-                            self.canvas.create_oval(
-                                x - 10, y - 10, x + 10, y + 10,
-                                fill=fill_color,
-                                outline=outline_color,
-                                width=2,
-                                tags="debug_marker"
-                            )
-                            self.canvas.create_text(
-                                x, y,
-                                text="Y",
-                                fill=text_color,
-                                font=("Arial", 11, "bold"),
-                                tags="debug_marker"
-                            )
-                
-                # Draw UNDER markers - X undershoots (cyan with "X") and Y undershoots (magenta with "Y")
-                # First, collect all undershoot positions
-                x_under_positions = []
-                for yaw, pitch in self.debug_x_undershoot_points:
-                    yaw_diff = yaw - self.yaw
-                    while yaw_diff > 180:
-                        yaw_diff -= 360
-                    while yaw_diff < -180:
-                        yaw_diff += 360
-                    x_under_positions.append((
-                        center_x + (yaw_diff * self.pixels_per_degree),
-                        center_y - ((pitch - self.pitch) * self.pixels_per_degree),
-                        'X'
-                    ))
                 
-                y_under_positions = []
-                for yaw, pitch in self.debug_y_undershoot_points:
-                    yaw_diff = yaw - self.yaw
-                    while yaw_diff > 180:
-                        yaw_diff -= 360
-                    while yaw_diff < -180:
-                        yaw_diff += 360
-                    y_under_positions.append((
-                        center_x + (yaw_diff * self.pixels_per_degree),
-                        center_y - ((pitch - self.pitch) * self.pixels_per_degree),
-                        'Y'
-                    ))
-                
-                # Check for overlapping X and Y undershoots and combine them
-                combine_threshold = 25
-                used_y_indices = set()
-                
-                for x_pos in x_under_positions:
-                    x, y, _ = x_pos
-                    if not (0 <= x <= self.canvas_width and 0 <= y <= self.canvas_height):
-                        continue
-                    
-                    # Check if there's a nearby Y undershoot to combine with
-                    combined = False
-                    for i, y_pos in enumerate(y_under_positions):
-                        if i in used_y_indices:
-                            continue
-                        yx, yy, _ = y_pos
-                        dist = math.sqrt((x - yx)**2 + (y - yy)**2)
-                        if dist < combine_threshold:
-                            # Draw combined XY undershoot (purple)
-                            fill_color = fade_color("#ff00ff", marker_opacity)
-                            outline_color = fade_color("#000000", marker_opacity)
-                            text_color = fade_color("#000000", marker_opacity)
-                            self.canvas.create_oval(
-                                x - 10, y - 10, x + 10, y + 10,
-                                fill=fill_color,
-                                outline=outline_color,
-                                width=2,
-                                tags="debug_marker"
-                            )
-                            self.canvas.create_text(
-                                x, y,
-                                text="XY",
-                                fill=text_color,
-                                font=("Arial", 9, "bold"),
-                                tags="debug_marker"
-                            )
-                            used_y_indices.add(i)
-                            combined = True
-                            break
-                    
-                    if not combined:
-                        # Draw X undershoot alone (cyan)
-                        fill_color = fade_color("#00ffff", marker_opacity)
+                # Draw Y marker separately
+                if y_pos:
+                    x, y, on_screen = y_pos
+                    if on_screen:
+                        fill_color = fade_color("#ff8800", marker_opacity)
                         outline_color = fade_color("#000000", marker_opacity)
                         text_color = fade_color("#000000", marker_opacity)
-                        self.canvas.create_oval(
-                            x - 8, y - 8, x + 8, y + 8,
+                        self.view.create_oval(
+                            x - 10, y - 10, x + 10, y + 10,
                             fill=fill_color,
                             outline=outline_color,
                             width=2,
                             tags="debug_marker"
                         )
-                        self.canvas.create_text(
+                        self.view.create_text(
                             x, y,
-                            text="X",
+                            text="Y",
                             fill=text_color,
-                            font=("Arial", 10, "bold"),
+                            font=("Arial", 11, "bold"),
                             tags="debug_marker"
                         )
+            
+            # Draw UNDER markers - X undershoots (cyan with "X") and Y undershoots (magenta with "Y")
+            # Check for overlapping X and Y undershoots and combine them
+            combine_threshold = 25
+            used_y_indices = set()
+            
+            for x_pos in x_under_positions:
+                x, y, on_screen = x_pos
+                if not on_screen:
+                    continue
                 
-                # Draw remaining Y undershoots that weren't combined
+                # Check if there's a nearby Y undershoot to combine with
+                combined = False
                 for i, y_pos in enumerate(y_under_positions):
                     if i in used_y_indices:
                         continue
-                    x, y, _ = y_pos
-                    if not (0 <= x <= self.canvas_width and 0 <= y <= self.canvas_height):
-                        continue
-                    
-                    # Draw Y undershoot alone (magenta/pink)
-                    fill_color = fade_color("#ff66ff", marker_opacity)
+                    yx, yy, _ = y_pos
+                    dist = math.sqrt((x - yx)**2 + (y - yy)**2)
+                    if dist < combine_threshold:
+                        # Draw combined XY undershoot (purple)
+                        fill_color = fade_color("#ff00ff", marker_opacity)
+                        outline_color = fade_color("#000000", marker_opacity)
+                        text_color = fade_color("#000000", marker_opacity)
+                        self.view.create_oval(
+                            x - 10, y - 10, x + 10, y + 10,
+                            fill=fill_color,
+                            outline=outline_color,
+                            width=2,
+                            tags="debug_marker"
+                        )
+                        self.view.create_text(
+                            x, y,
+                            text="XY",
+                            fill=text_color,
+                            font=("Arial", 9, "bold"),
+                            tags="debug_marker"
+                        )
+                        used_y_indices.add(i)
+                        combined = True
+                        break
+                
+                if not combined:
+                    # Draw X undershoot alone (cyan)
+                    fill_color = fade_color("#00ffff", marker_opacity)
                     outline_color = fade_color("#000000", marker_opacity)
                     text_color = fade_color("#000000", marker_opacity)
-                    self.canvas.create_oval(
+                    self.view.create_oval(
                         x - 8, y - 8, x + 8, y + 8,
                         fill=fill_color,
                         outline=outline_color,
                         width=2,
                         tags="debug_marker"
                     )
-                    self.canvas.create_text(
+                    self.view.create_text(
                         x, y,
-                        text="Y",
+                        text="X",
                         fill=text_color,
                         font=("Arial", 10, "bold"),
                         tags="debug_marker"
                     )
+            
+            # Draw remaining Y undershoots that weren't combined
+            for i, y_pos in enumerate(y_under_positions):
+                if i in used_y_indices:
+                    continue
+                x, y, on_screen = y_pos
+                if not on_screen:
+                    continue
                 
-                # Draw pause points (small red dots - where movement stopped)
-                for yaw, pitch in self.debug_pause_points:
-                    yaw_diff = yaw - self.yaw
-                    while yaw_diff > 180:
-                        yaw_diff -= 360
-                    while yaw_diff < -180:
-                        yaw_diff += 360
-                    x = center_x + (yaw_diff * self.pixels_per_degree)
-                    y = center_y - ((pitch - self.pitch) * self.pixels_per_degree)
-                    
-                    if 0 <= x <= self.canvas_width and 0 <= y <= self.canvas_height:
-                        fill_color = fade_color("#ff0000", marker_opacity)
-                        outline_color = fade_color("#ffffff", marker_opacity)
-                        self.canvas.create_oval(
-                            x - 4, y - 4, x + 4, y + 4,
-                            fill=fill_color,
-                            outline=outline_color,
-                            width=1,
-                            tags="debug_marker"
-                        )
-        
-        # Draw crosshair last (on top of everything)
-        self.draw_crosshair(center_x, center_y)
+                # Draw Y undershoot alone (magenta/pink)
+                fill_color = fade_color("#ff66ff", marker_opacity)
+                outline_color = fade_color("#000000", marker_opacity)
+                text_color = fade_color("#000000", marker_opacity)
+                self.view.create_oval(
+                    x - 8, y - 8, x + 8, y + 8,
+                    fill=fill_color,
+                    outline=outline_color,
+                    width=2,
+                    tags="debug_marker"
+                )
+                self.view.create_text(
+                    x, y,
+                    text="Y",
+                    fill=text_color,
+                    font=("Arial", 10, "bold"),
+                    tags="debug_marker"
+                )
             
+            # Draw pause points (small red dots - where movement stopped)
+            for x, y, on_screen in pause_positions:
+                if on_screen:
+                    fill_color = fade_color("#ff0000", marker_opacity)
+                    outline_color = fade_color("#ffffff", marker_opacity)
+                    self.view.create_oval(
+                        x - 4, y - 4, x + 4, y + 4,
+                        fill=fill_color,
+                        outline=outline_color,
+                        width=1,
+                        tags="debug_marker"
+                    )
+            
+    def publish_metrics(self, current_time, frame_start=0, frame_end=0):
+        """Hand the metrics server a fresh snapshot of the session"""
+        stats = self.stats
+        x_over, y_over = self.get_rolling_overshoot_percentages(current_time)
+        x_under, y_under = self.get_rolling_undershoot_percentages(current_time)
+        snapshot = {
+            'time': current_time,
+            'mode': self.game_mode,
+            'active': int(self.is_active),
+            'hits_total': stats.hits,
+            'misses_total': stats.misses,
+            'accuracy_percent': stats.get_accuracy(),
+            'reaction_time_seconds': stats.get_average_reaction_time(),
+            'score': self.score,
+            'streak': self.current_streak,
+            'best_streak': self.best_streak,
+            'session_seconds': self.session_timer,
+            'rolling_accuracy_percent': self.get_rolling_accuracy(current_time),
+            'rolling_reaction_time_seconds': self.get_rolling_avg_reaction_time(current_time),
+            'rolling_path_efficiency_percent': self.get_rolling_path_efficiency(current_time),
+            'rolling_precision_percent': self.get_rolling_precision(current_time),
+            'rolling_overshoot_x_percent': x_over,
+            'rolling_overshoot_y_percent': y_over,
+            'rolling_undershoot_x_percent': x_under,
+            'rolling_undershoot_y_percent': y_under,
+            'sens_x': self.current_x_sens,
+            'sens_y': self.current_y_sens,
+            'forecast_sens_x': self.forecast_x,
+            'forecast_sens_y': self.forecast_y
+        }
+        if frame_start:
+            snapshot['frame_seconds'] = (frame_end - frame_start) / 1e9
+            if self.last_metrics_frame_ns:
+                snapshot['frame_interval_seconds'] = (frame_start - self.last_metrics_frame_ns) / 1e9
+            self.last_metrics_frame_ns = frame_start
+        history = self.camera_history
+        if len(history) >= 2:
+            newest = (history.head - 1) % history.capacity
+            snapshot['input_interval_seconds'] = (
+                history.times[newest] - history.times[newest - 1]) / 1e9
+        if self.click_timer.delays:
+            snapshot['click_delay_seconds'] = self.click_timer.delays[-1] / 1000
+        self.metrics.publish(snapshot)
+    
+    def draw_profiler_overlay(self):
+        """Draw per-section rolling frame timings in the bottom-left corner"""
+        rows = self.profiler.summary()
+        lines = [f"{'section':<18}{'avg':>8}{'p95':>8}{'max':>8}  ms"]
+        for name, avg, p95, worst, _ in rows:
+            lines.append(f"{name:<18}{avg:>8.2f}{p95:>8.2f}{worst:>8.2f}")
+        lines.append("F3 hide | F4 export trace")
+        self.view.create_text(
+            20,
+            self.canvas_height - 20,
+            text="\n".join(lines),
+            anchor="sw",
+            font=("Courier", 11),
+            fill="#cccccc",
+            tags="profiler"
+        )
+    
+    def toggle_profiler_overlay(self):
+        """Show/hide the frame profiler overlay (profiling only runs while shown)"""
+        self.profiler.toggle_overlay()
+    
+    def export_profiler_trace(self):
+        """Write the collected frame timings as a Chrome trace-event JSON file"""
+        if not self.profiler.trace_events:
+            print("Profiler: nothing recorded yet - press F3 to start profiling")
+            return
+        path = time.strftime("aim_warmup_trace_%Y%m%d_%H%M%S.json")
+        self.profiler.export_chrome_trace(path)
+        print(f"Profiler: wrote {len(self.profiler.trace_events)} events to {path}")
+    
+    def draw_latency_overlay(self):
+        """Draw the photodiode sensor patch and the latency distribution summary.
+        
+        The patch in the top-left corner is white on frames that carry a new
+        input sample and black otherwise, so a photodiode taped over it sees
+        exactly the frames LatencyMonitor is waiting to hear about.
+        """
+        patch_color = "#ffffff" if self.latency.pending_input_ns else "#000000"
+        self.view.create_rectangle(
+            0, 0, 40, 40,
+            fill=patch_color,
+            outline="",
+            tags="latency"
+        )
+        self.view.create_text(
+            self.canvas_width - 20,
+            self.canvas_height - 20,
+            text="\n".join(self.get_latency_lines() + ["F5 stop latency mode"]),
+            anchor="se",
+            font=("Courier", 11),
+            fill="#cccccc",
+            tags="latency"
+        )
+    
+    def get_latency_lines(self):
+        """Input-to-draw/photon summary followed by every registered latency reporter"""
+        lines = self.latency.summary_lines()
+        for reporter in self.latency_reporters:
+            lines += reporter()
+        return lines
+    
+    def toggle_latency_mode(self):
+        """Start/stop latency measurement (prints the distributions when stopped)"""
+        if self.latency.enabled:
+            for line in self.get_latency_lines():
+                print(f"Latency: {line}")
+        self.latency.toggle()
+    
     def on_shoot(self, event):
         """Handle shooting (clicking)"""
+        handler_ns = time.perf_counter_ns()
+        # When the click listener saw the press, time the shot from then
+        click_ns = self.click_timer.take(handler_ns) or handler_ns
+        
         # If mouse was unlocked due to focus loss, re-lock it on click
         if self.is_active and not self.mouse_locked and self.mouse_was_locked:
             self.mouse_locked = True
@@ -2312,34 +2652,45 @@ class AimExercise:
             self.last_mouse_y = self.center_y
             return  # Don't process this click as a shot
         
-        if not self.is_active:
+        if not self.is_active or self.mode['kind'] != 'click':
             return
         
         # Play fire sound
-        self.play_sound('fire')
+        self.play_sound('fire', click_ns)
 
-        self.handle_random_mode_shot()
+        with self.profiler.section('shot.handle'):
+            self.handle_random_mode_shot(click_ns, handler_ns)
 
-    def handle_random_mode_shot(self):
+    def handle_random_mode_shot(self, click_ns=None, handler_ns=None):
         """Handle shooting in random targets mode - find closest target to crosshair"""
-        current_time = time.time()
+        current_time = self.clock()
+        
+        # Score the shot where the crosshair was at the click, interpolated from
+        # the camera history, not where it is by the time Tk runs this handler
+        shot_yaw, shot_pitch = self.yaw, self.pitch
+        click_delay_ms = None
+        if click_ns is not None:
+            pose = self.camera_history.pose_at(click_ns)
+            if pose is not None:
+                shot_yaw, shot_pitch = pose
+            if handler_ns is not None:
+                click_delay_ms = (handler_ns - click_ns) / 1e6
         
         # Find the closest target to crosshair position
-        closest_target, closest_index, closest_distance = self.find_closest_target()
+        closest_target, closest_index, closest_distance = self.find_closest_target(shot_yaw, shot_pitch)
         
         if not closest_target:
             return
         
-        target_yaw = closest_target['yaw']
-        target_pitch = closest_target['pitch']
-        spawn_time = closest_target['spawn_time']
+        target_yaw = closest_target.yaw
+        target_pitch = closest_target.pitch
         
         # Get current target size
         current_target_size = self.get_target_current_size(closest_target)
         
         # Check if we hit the closest target (SQUARE hitbox)
-        yaw_diff = target_yaw - self.yaw
-        pitch_diff = target_pitch - self.pitch
+        yaw_diff = target_yaw - shot_yaw
+        pitch_diff = target_pitch - shot_pitch
         
         while yaw_diff > 180:
             yaw_diff -= 360
@@ -2351,131 +2702,191 @@ class AimExercise:
         # Square hitbox: hit if BOTH X and Y are within target bounds
         hit = (abs(yaw_diff) <= target_angular_size and abs(pitch_diff) <= target_angular_size)
         
-        # Analyze approach for overshoots
+        # Hand the approach analysis to the background worker with its own copy
+        # of the path; only the hit/miss decision is made on this thread. A hit
+        # starts a fresh path list below, so the old one can be handed over as-is.
         if self.has_last_hit:
-            efficiency = self.calculate_path_efficiency(target_yaw, target_pitch)
-            if efficiency is not None:
-                self.path_efficiencies.append(efficiency)
-                self.recent_path_efficiencies.append((current_time, efficiency))
-            
-            # Calculate axis-specific efficiency
-            x_eff, y_eff = self.calculate_axis_efficiency(target_yaw, target_pitch)
-            if x_eff is not None:
-                self.x_efficiencies.append(x_eff)
-                self.recent_x_efficiencies.append((current_time, x_eff))
-            if y_eff is not None:
-                self.y_efficiencies.append(y_eff)
-                self.recent_y_efficiencies.append((current_time, y_eff))
-            
-            # Analyze for overshoots (captures debug markers too)
-            approach_data = self.analyze_final_approach(target_yaw, target_pitch, capture_debug=True)
-            if approach_data:
-                # Record 1 if overshoot occurred (max_overshoot > 0), 0 otherwise
-                x_over = 1 if approach_data['x_max_overshoot'] > 0 else 0
-                y_over = 1 if approach_data['y_max_overshoot'] > 0 else 0
-                self.x_overshoots.append(x_over)
-                self.y_overshoots.append(y_over)
-                self.recent_x_overshoots.append((current_time, x_over))
-                self.recent_y_overshoots.append((current_time, y_over))
-                self.last_shot_analysis = approach_data
-            
-            # Check for undershoots (shot position vs target edge)
-            x_under, y_under = self.check_undershoot(target_yaw, target_pitch, capture_debug=True)
-            x_under_val = 1 if x_under else 0
-            y_under_val = 1 if y_under else 0
-            self.x_micro_adjustments.append(x_under_val)
-            self.y_micro_adjustments.append(y_under_val)
-            self.recent_x_undershoots.append((current_time, x_under_val))
-            self.recent_y_undershoots.append((current_time, y_under_val))
-
-            # --- Auto-tuner samples: directional bias + per-axis accuracy ---
-            x_over_flag = 1 if (approach_data and approach_data.get('x_max_overshoot', 0) > 0) else 0
-            y_over_flag = 1 if (approach_data and approach_data.get('y_max_overshoot', 0) > 0) else 0
-            x_bias = x_over_flag - x_under_val   # +1 = too fast (overshoot), -1 = too slow
-            y_bias = y_over_flag - y_under_val
-            if target_angular_size > 0:
-                x_prec = max(0.0, 1.0 - abs(yaw_diff) / target_angular_size)
-                y_prec = max(0.0, 1.0 - abs(pitch_diff) / target_angular_size)
-            else:
-                x_prec = y_prec = 0.0
-            self.tune_x.append((current_time, x_bias, x_prec, self.current_x_sens))
-            self.tune_y.append((current_time, y_bias, y_prec, self.current_y_sens))
-
-            self.last_shot_was_hit = hit
-            self.last_shot_type = "HIT" if hit else "MISS"
+            self.analysis_worker.submit({
+                'generation': self.analysis_generation,
+                'time': current_time,
+                'hit': hit,
+                'path': self.path_points if hit else list(self.path_points),
+                'thinned': self.path_thinned,
+                'start_yaw': self.last_hit_yaw,
+                'start_pitch': self.last_hit_pitch,
+                'target_yaw': target_yaw,
+                'target_pitch': target_pitch,
+                'target_angular_size': target_angular_size,
+                'shot_yaw': shot_yaw,
+                'shot_pitch': shot_pitch,
+                'yaw_diff': yaw_diff,
+                'pitch_diff': pitch_diff,
+                'x_sens': self.current_x_sens,
+                'y_sens': self.current_y_sens,
+                'archive': self.archive_paths
+            })
         
         if hit:
             # HIT the target
             reaction_time = self.get_target_effective_age(closest_target)
-            self.stats.record_hit(reaction_time)
-            
-            # Record for rolling metrics
-            self.recent_hits.append((current_time, reaction_time))
-            
-            # Update streak
-            self.current_streak += 1
-            if self.current_streak > self.best_streak:
-                self.best_streak = self.current_streak
             
             # Calculate hit precision (100% = center, 0% = edge)
             x_ratio = abs(yaw_diff) / target_angular_size if target_angular_size > 0 else 0
             y_ratio = abs(pitch_diff) / target_angular_size if target_angular_size > 0 else 0
             max_ratio = max(x_ratio, y_ratio)
             precision = (1 - max_ratio) * 100
-            self.hit_precisions.append(precision)
-            self.recent_precisions.append((current_time, precision))
-            
-            # Play hit sound
-            self.play_sound('hit')
-            
+        else:
+            # MISS - clicked but didn't hit the closest target
+            reaction_time = None
+            precision = None
+        
+        # Stats, score, sound and heatmap are subscribers on the event bus
+        self.shot_events.publish(ShotEvent(
+            HIT if hit else MISS, current_time, closest_target.id, target_yaw, target_pitch,
+            shot_yaw, shot_pitch, target_angular_size, yaw_diff, pitch_diff,
+            reaction_time, precision, click_ns, click_delay_ms))
+        
+        if hit:
             # Record this hit position for next path measurement
             self.record_hit_position()
             
             # Remove hit target and spawn a new one
-            self.targets.remove(closest_target)
-            self.spawn_target_at_random_position()
-        else:
-            # MISS - clicked but didn't hit the closest target
-            self.stats.record_miss()
-            self.recent_misses.append(current_time)
+            self.targets.remove(closest_target.id)
+            self.spawn_targets(1)
+        # On a miss keep the path - don't reset until a hit
+        
+        self.update_stats_display()
+
+    def on_shot_stats(self, event):
+        """Shot subscriber: session stats, rolling metrics and streaks"""
+        if event.kind == HIT:
+            self.stats.record_hit(event.reaction_time)
+            self.recent_hits.append((event.time, event.reaction_time))
             
-            # Record completed streak to history before resetting
-            if self.current_streak > 0:
-                self.streak_history.append(self.current_streak)
-                # Keep only last 3 streaks
-                if len(self.streak_history) > 3:
-                    self.streak_history.pop(0)
-            # Reset streak on miss
-            self.current_streak = 0
+            # Update streak
+            self.current_streak += 1
+            if self.current_streak > self.best_streak:
+                self.best_streak = self.current_streak
             
-            # Keep path - don't reset until a hit
+            self.hit_precisions.append(event.precision)
+            self.recent_precisions.append((event.time, event.precision))
+            return
         
-        self.update_stats_display()
+        # Misses and expired targets both count as misses
+        self.stats.record_miss()
+        self.recent_misses.append(event.time)
+        
+        # Record completed streak to history before resetting
+        if self.current_streak > 0:
+            self.streak_history.append(self.current_streak)
+            # Keep only last 3 streaks
+            if len(self.streak_history) > 3:
+                self.streak_history.pop(0)
+        self.current_streak = 0
+    
+    def on_shot_score(self, event):
+        """Shot subscriber: mode score"""
+        scoring = self.mode['scoring']
+        if event.kind == HIT:
+            self.score += scoring.hit_points(event.precision, event.reaction_time)
+        elif event.kind == MISS:
+            self.score += scoring.miss
+        else:
+            self.score += scoring.expire
+    
+    def on_shot_sound(self, event):
+        """Shot subscriber: hit and expiry sounds"""
+        if event.kind == HIT:
+            self.play_sound('hit', event.click_ns)
+        elif event.kind == EXPIRE:
+            self.play_sound('miss')
+    
+    def on_shot_heatmap(self, event):
+        """Shot subscriber: shot position relative to the target centre, in target half-sizes"""
+        if event.kind != EXPIRE and event.target_angular_size > 0:
+            self.session_heatmap.add(-event.yaw_diff / event.target_angular_size,
+                                     -event.pitch_diff / event.target_angular_size)
+
+    def on_shot_experiment(self, event):
+        """Shot subscriber: A/B experiment update; switches the live setting between blocks"""
+        experiment = self.experiment
+        if experiment is None or not experiment.record(event.kind, event.precision, event.reaction_time):
+            return
+        if not experiment.decided:
+            self.apply_experiment_arm(experiment.current)
+            return
+        verdict = "Winner" if experiment.conclusive else "No clear winner; best guess"
+        print(f"Sensitivity experiment done after {experiment.total} shots. "
+              f"{verdict}: {experiment.winner.label}")
+        for line in experiment.summary_lines():
+            print(line)
+        self.apply_experiment_arm(experiment.winner)
 
     def on_focus_lost(self, event):
         """Handle window losing focus (tabbing out)"""
         if self.is_active:
-            # Record when focus was lost
-            self.focus_lost_time = time.time()
             # Temporarily unlock mouse when window loses focus
             self.mouse_locked = False
             self.mouse_was_locked = True  # Remember it was locked
             self.scoped_active = False  # Release scope when losing focus
+        self.suspend('unfocused')
             
     def on_focus_gained(self, event):
         """Handle window gaining focus (tabbing back in)"""
-        if self.is_active and self.focus_lost_time > 0:
-            # Calculate how long we were unfocused
-            unfocused_duration = time.time() - self.focus_lost_time
-            self.total_unfocused_time += unfocused_duration
-            
-            # Add the unfocused duration to each target's paused_duration
-            for target in self.targets:
-                if isinstance(target, dict):  # Random mode targets
-                    target['paused_duration'] = target.get('paused_duration', 0.0) + unfocused_duration
-            
-            self.focus_lost_time = 0
+        self.resume('unfocused')
         # Don't auto-relock, let user click to reactivate
+    
+    def cancel_frame(self):
+        """Cancel the pending frame timer, if any"""
+        if self.frame_after_id is not None:
+            self.root.after_cancel(self.frame_after_id)
+            self.frame_after_id = None
+    
+    def suspend(self, reason):
+        """Stop the frame loop until every suspend reason has been resumed.
+        
+        Used while the window is hidden or unfocused: no timers stay scheduled,
+        nothing is redrawn and the auto-tuner does no work.
+        """
+        already_suspended = bool(self.suspend_reasons)
+        self.suspend_reasons.add(reason)
+        if already_suspended or not self.is_active:
+            return
+        
+        self.suspended_at = self.clock()
+        self.cancel_frame()
+        self.scoped_active = False
+        if reason != 'hidden':
+            # Leave one up-to-date frame on screen (shows the reactivate hint)
+            self.draw_scene()
+    
+    def resume(self, reason):
+        """Drop a suspend reason; restart the frame loop once none remain"""
+        self.suspend_reasons.discard(reason)
+        if self.suspend_reasons or not self.suspended_at:
+            return
+        
+        now = self.clock()
+        paused = now - self.suspended_at
+        self.suspended_at = 0
+        self.total_unfocused_time += paused
+        
+        # Shift every clock the game reads so the pause is invisible to it
+        self.targets.pause_all(paused)
+        self.last_timer_update = now
+        self.debug_markers_timestamp += paused
+        self.last_tune_time += paused
+        self.last_motion_time = self.clock()
+        self.camera_history.clear()  # Don't interpolate across the pause
+        
+        # Re-baseline the mouse so movement made while away isn't applied
+        if self.mouse is not None:
+            pos = self.mouse.position
+            if pos is not None:
+                self.last_mouse_x, self.last_mouse_y = pos[0], pos[1]
+        
+        # Restart immediately rather than waiting for a timer
+        self.lock_mouse_loop()
             
     def update_stats_display(self):
         """Update the statistics display"""
@@ -2486,8 +2897,8 @@ class AimExercise:
         if avg_time > 0:
             stats_text += f" | Avg Time: {avg_time:.3f}s"
         
-        # Add streak info
-        stats_text += f" | Best Streak: {self.best_streak}"
+        # Add streak and score info
+        stats_text += f" | Best Streak: {self.best_streak} | Score: {self.score:.0f}"
         
         # Add efficiency breakdown
         avg_efficiency = self.get_average_path_efficiency()
@@ -2501,12 +2912,33 @@ class AimExercise:
         if avg_y_eff > 0:
             stats_text += f" | Y: {avg_y_eff:.1f}%"
         
+        # Tracking modes are scored on continuous error rather than clicks
+        if self.mode['kind'] == 'tracking':
+            stats_text = f"Score: {self.score:.0f} | {self.get_tracking_text()}"
+        
         # Only update label when not in active gameplay (stats drawn in draw_scene when active)
         if not self.is_active:
             self.stats_label.config(text=stats_text)
         
     def cleanup(self):
         """Cleanup resources"""
+        if self.is_active:
+            # Quitting mid-session (ESC / window close): keep what the session
+            # taught the tuner, and since this is an orderly exit rather than a
+            # crash, drop the checkpoint so the next launch doesn't offer RESUME
+            self.analysis_worker.flush()
+            self.process_analysis_results()
+            self.save_sens_model()
+            self.checkpoint_writer.discard()
         self.mouse_locked = False
         self.is_active = False
         self.scoped_active = False
+        self.analysis_worker.stop()
+        self.click_timer.stop()
+        self.shot_events.stop()
+        self.checkpoint_writer.stop()  # Drains queued writes while the service loop still runs
+        if self.metrics is not None:
+            self.metrics.stop()
+        self.renderer.close()
+        self.latency.stop()
+        self.services.stop()
@@ -0,0 +1,170 @@
+import json
+import os
+import threading
+
+from src.services import LATEST, Channel
+from src.stats_tracker import RunningMean
+from src.storage import write_atomic
+
+CHECKPOINT_VERSION = 1
+
+# Session-average accumulators (RunningMean) on AimExercise
+MEAN_FIELDS = (
+    'path_efficiencies', 'x_efficiencies', 'y_efficiencies', 'hit_precisions',
+    'x_overshoots', 'y_overshoots', 'x_micro_adjustments', 'y_micro_adjustments'
+)
+
+# Deques of entries whose first element (or the entry itself) is a clock
+# timestamp; on resume they are shifted so the windows continue from "now"
+TIMESTAMPED_FIELDS = (
+    'recent_hits', 'recent_misses', 'recent_path_efficiencies', 'recent_x_efficiencies',
+    'recent_y_efficiencies', 'recent_precisions', 'recent_x_overshoots', 'recent_y_overshoots',
+    'recent_x_undershoots', 'recent_y_undershoots', 'tune_x', 'tune_y'
+)
+
+
+def _mean_state(mean):
+    return [mean.count, mean.total, mean.positive]
+
+
+def _mean_from_state(state):
+    mean = RunningMean()
+    mean.count, mean.total, mean.positive = state
+    return mean
+
+
+def capture(exercise):
+    """Everything needed to resume the running session, as plain JSON-able data.
+
+    Called on the Tk thread; it only copies counters and the short rolling
+    windows, so it costs well under a millisecond.
+    """
+    stats = exercise.stats
+    return {
+        'version': CHECKPOINT_VERSION,
+        'saved_at': exercise.clock(),
+        'mode': exercise.game_mode,
+        'x_sens': exercise.current_x_sens,
+        'y_sens': exercise.current_y_sens,
+        'scoped_sens_percent': exercise.scoped_sens_percent,
+        'forecast': [exercise.forecast_x, exercise.forecast_y],
+        'session_timer': exercise.session_timer,
+        'total_unfocused_time': exercise.total_unfocused_time,
+        'score': exercise.score,
+        'current_streak': exercise.current_streak,
+        'best_streak': exercise.best_streak,
+        'streak_history': list(exercise.streak_history),
+        'stats': {
+            'hits': stats.hits,
+            'misses': stats.misses,
+            'reaction_times': _mean_state(stats.reaction_times)
+        },
+        'means': {name: _mean_state(getattr(exercise, name)) for name in MEAN_FIELDS},
+        'windows': {name: list(getattr(exercise, name)) for name in TIMESTAMPED_FIELDS},
+        'heatmap': exercise.session_heatmap.counts.ravel().tolist()
+    }
+
+
+def restore(exercise, state):
+    """Apply a captured state to a freshly started session"""
+    shift = exercise.clock() - state['saved_at']
+    stats = exercise.stats
+    stats.hits = state['stats']['hits']
+    stats.misses = state['stats']['misses']
+    stats.reaction_times = _mean_from_state(state['stats']['reaction_times'])
+    for name in MEAN_FIELDS:
+        setattr(exercise, name, _mean_from_state(state['means'][name]))
+    for name in TIMESTAMPED_FIELDS:
+        window = getattr(exercise, name)
+        window.clear()
+        for entry in state['windows'][name]:
+            if isinstance(entry, list):
+                window.append((entry[0] + shift, *entry[1:]))
+            else:
+                window.append(entry + shift)
+    exercise.forecast_x, exercise.forecast_y = state['forecast']
+    exercise.session_timer = state['session_timer']
+    exercise.total_unfocused_time = state['total_unfocused_time']
+    exercise.score = state['score']
+    exercise.current_streak = state['current_streak']
+    exercise.best_streak = state['best_streak']
+    exercise.streak_history = list(state['streak_history'])
+    heatmap = exercise.session_heatmap
+    heatmap.reset()
+    heatmap.add_counts(state['heatmap'])
+
+
+def load(path):
+    """Read a checkpoint file; None if there is none or it can't be used"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Could not read checkpoint {path}: {e}")
+        return None
+    if not isinstance(state, dict) or state.get('version') != CHECKPOINT_VERSION:
+        print(f"Ignoring checkpoint {path}: unsupported version")
+        return None
+    return state
+
+
+class CheckpointWriter:
+    """Writes checkpoints atomically as a task on the service loop.
+
+    submit() just offers the captured dict to a one-slot channel; if the
+    previous one hasn't been written yet it is replaced, since only the
+    newest state matters. Serialising and the fsync'd write happen on the
+    service loop's I/O pool, off the Tk thread.
+    """
+
+    def __init__(self, path, services):
+        self.path = path
+        self.services = services
+        self.channel = Channel(services, overflow=LATEST)
+        self.io_lock = threading.Lock()  # Orders writes against discard()
+        self.generation = 0  # Bumped by discard() so queued and in-flight states are dropped
+        self.task = None
+
+    def submit(self, state):
+        if self.task is None:
+            self.task = self.services.spawn(self._run(), "checkpoint-writer")
+        self.channel.offer((state, self.generation))
+
+    async def _run(self):
+        channel = self.channel
+        while True:
+            state, generation = await channel.get()
+            try:
+                await self.services.offload(self._write, state, generation)
+            finally:
+                channel.task_done()
+
+    def _write(self, state, generation):
+        if generation != self.generation:
+            return
+        data = json.dumps(state, separators=(',', ':')).encode('utf-8')
+        with self.io_lock:
+            if generation != self.generation:
+                return
+            try:
+                write_atomic(self.path, data)
+            except OSError as e:
+                print(f"Could not write checkpoint: {e}")
+
+    def discard(self):
+        """Drop any queued checkpoint and delete the file (the session ended normally)"""
+        with self.io_lock:
+            self.generation += 1
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Could not remove checkpoint: {e}")
+
+    def stop(self):
+        """Write whatever is queued before the service loop shuts down"""
+        if self.task is not None:
+            self.services.run(self.channel.join(), "checkpoint flush")
@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import deque
+
+
+class CameraHistory:
+    """Short ring buffer of timestamped camera poses for click-time lookups.
+
+    The frame loop appends (perf_counter_ns, yaw, pitch) after every input
+    sample; pose_at() interpolates linearly between the two samples around
+    a timestamp. Clicks are almost always within the last few samples, so
+    the search walks back from the newest one.
+    """
+
+    def __init__(self, capacity=128):
+        self.capacity = capacity
+        self.times = [0] * capacity
+        self.yaws = [0.0] * capacity
+        self.pitches = [0.0] * capacity
+        self.head = 0  # Next slot to write
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, timestamp_ns, yaw, pitch):
+        head = self.head
+        self.times[head] = timestamp_ns
+        self.yaws[head] = yaw
+        self.pitches[head] = pitch
+        self.head = (head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def pose_at(self, timestamp_ns):
+        """(yaw, pitch) at timestamp_ns, clamped to the oldest/newest sample; None if empty"""
+        if not self.count:
+            return None
+        capacity = self.capacity
+        times, yaws, pitches = self.times, self.yaws, self.pitches
+        newer = (self.head - 1) % capacity
+        if timestamp_ns >= times[newer]:
+            return yaws[newer], pitches[newer]
+        for _ in range(self.count - 1):
+            older = (newer - 1) % capacity
+            if times[older] <= timestamp_ns:
+                span = times[newer] - times[older]
+                t = (timestamp_ns - times[older]) / span if span > 0 else 1.0
+                return (yaws[older] + (yaws[newer] - yaws[older]) * t,
+                        pitches[older] + (pitches[newer] - pitches[older]) * t)
+            newer = older
+        return yaws[newer], pitches[newer]
+
+
+class ClickTimer:
+    """Timestamps left clicks when the OS reports them, ahead of Tk dispatch.
+
+    A pynput listener thread records perf_counter_ns() for every left-button
+    press; the Tk click handler then take()s the matching capture time, and
+    the gap between the two is the click-processing delay. Without pynput
+    (or if the listener is late) take() returns None and callers use the
+    handler time.
+    """
+
+    def __init__(self, max_age=0.25, window=500):
+        self.max_age_ns = int(max_age * 1e9)
+        self.stamps = deque()
+        self.delays = deque(maxlen=window)  # ms, capture -> handler
+        self.listener = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self.listener is not None:
+            return
+        from pynput.mouse import Button, Listener
+
+        def on_click(x, y, button, pressed):
+            if pressed and button == Button.left:
+                self.stamps.append(time.perf_counter_ns())
+
+        self.listener = Listener(on_click=on_click)
+        self.listener.daemon = True
+        self.listener.start()
+
+    def stop(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def take(self, handler_ns):
+        """Capture time of the click being handled at handler_ns, or None"""
+        stamps = self.stamps
+        with self._lock:
+            while stamps and handler_ns - stamps[0] > self.max_age_ns:
+                stamps.popleft()  # Clicks Tk never delivered to us (e.g. on other widgets)
+            if not stamps or stamps[0] > handler_ns:
+                return None
+            capture_ns = stamps.popleft()
+        self.delays.append((handler_ns - capture_ns) / 1e6)
+        return capture_ns
+
+    def clear(self):
+        with self._lock:
+            self.stamps.clear()
+        self.delays.clear()
+
+    def latency_lines(self):
+        """Human-readable click capture -> handler summary"""
+        if self.listener is None:
+            return ["click->handler: no click listener"]
+        if not self.delays:
+            return ["click->handler: no samples"]
+        ordered = sorted(self.delays)
+        count = len(ordered)
+        p50 = ordered[count // 2]
+        p95 = ordered[min(count - 1, int(count * 0.95))]
+        return [f"click->handler: p50 {p50:.1f} | p95 {p95:.1f} | max {ordered[-1]:.1f} ms (n={count})"]
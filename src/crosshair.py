@@ -0,0 +1,157 @@
+import json
+import os
+from collections import OrderedDict
+
+# Kinds a custom crosshair part may use (canvas item types)
+PART_KINDS = ('line', 'rectangle', 'oval')
+
+
+def _cross(size, thickness, color, outline, outline_color, outline_thickness):
+    parts = []
+    if outline:
+        # Outline first (slightly larger), so the cross draws over it
+        outline_size = size + outline_thickness
+        outline_width = thickness + (outline_thickness * 2)
+        parts.append(('line', (-outline_size, 0, outline_size, 0), {'fill': outline_color, 'width': outline_width}))
+        parts.append(('line', (0, -outline_size, 0, outline_size), {'fill': outline_color, 'width': outline_width}))
+    parts.append(('line', (-size, 0, size, 0), {'fill': color, 'width': thickness}))
+    parts.append(('line', (0, -size, 0, size), {'fill': color, 'width': thickness}))
+    return parts
+
+
+def _boxed(kind):
+    def build(size, thickness, color, outline, outline_color, outline_thickness):
+        parts = []
+        if outline:
+            outer = size + outline_thickness
+            parts.append((kind, (-outer, -outer, outer, outer),
+                          {'outline': outline_color, 'width': thickness + outline_thickness}))
+        parts.append((kind, (-size, -size, size, size), {'outline': color, 'width': thickness}))
+        return parts
+    return build
+
+
+BUILTIN_SHAPES = {
+    'cross': _cross,
+    'square': _boxed('rectangle'),
+    'circle': _boxed('oval')
+}
+
+
+def _custom(style, size, thickness, color, outline, outline_color, outline_thickness):
+    """Parts of a user-defined crosshair; coordinates are in units of `size`"""
+    parts = []
+    layers = [(outline_color, outline_thickness), (color, 0)] if outline else [(color, 0)]
+    for layer_color, grow in layers:
+        for kind, x1, y1, x2, y2, *flags in style['parts']:
+            coords = (x1 * size, y1 * size, x2 * size, y2 * size)
+            if kind == 'line':
+                parts.append((kind, coords, {'fill': layer_color, 'width': thickness + grow * 2}))
+                continue
+            if grow:
+                coords = (coords[0] - grow, coords[1] - grow, coords[2] + grow, coords[3] + grow)
+            if 'fill' in flags:
+                parts.append((kind, coords, {'fill': layer_color, 'outline': ""}))
+            else:
+                parts.append((kind, coords, {'outline': layer_color, 'width': thickness + grow}))
+    return parts
+
+
+def crosshair_parts(style, size, thickness, color, outline_color, outline_thickness):
+    """(kind, coords relative to the centre, options) for every item of a crosshair style"""
+    if style['type'] == 'custom':
+        return _custom(style, size, thickness, color, style['outline'], outline_color, outline_thickness)
+    return BUILTIN_SHAPES[style['type']](size, thickness, color, style['outline'],
+                                         outline_color, outline_thickness)
+
+
+def load_custom_crosshairs(path):
+    """Read user-defined crosshair styles from a JSON file (missing file = none).
+
+    The file holds a list of {"name": ..., "outline": bool, "parts": [...]}
+    where each part is [kind, x1, y1, x2, y2] with kind one of PART_KINDS,
+    coordinates in multiples of the crosshair size around the centre, and an
+    optional trailing "fill" to fill a rectangle/oval instead of stroking it.
+    """
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, encoding='utf-8') as f:
+            entries = json.load(f)
+        styles = []
+        for entry in entries:
+            parts = [list(part) for part in entry['parts']]
+            for part in parts:
+                if part[0] not in PART_KINDS or len(part) < 5:
+                    raise ValueError(f"bad part {part!r} in crosshair {entry['name']!r}")
+            styles.append({'name': str(entry['name']), 'type': 'custom',
+                           'outline': bool(entry.get('outline', False)), 'parts': parts})
+        return styles
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Could not load custom crosshairs from {path}: {e}")
+        return []
+
+
+def style_key(style):
+    """What a style draws, independent of its display name.
+
+    Custom styles may reuse a built-in's name (or each other's), so groups
+    are keyed on the shape itself.
+    """
+    parts = tuple(tuple(part) for part in style.get('parts', ()))
+    return (style['type'], style['outline'], parts)
+
+
+class CrosshairCache:
+    """Crosshair item groups that stay on the view instead of being redrawn.
+
+    Each (style, size, thickness, colours, centre) combination is built once
+    as a group of persistent items; switching style, scoping (which recolours
+    the crosshair) or changing settings just hides one group and shows
+    another. The few most recent groups are kept hidden for reuse, so
+    toggling back and forth never rebuilds anything.
+    """
+
+    def __init__(self, view, capacity=8):
+        self.view = view
+        self.capacity = capacity
+        self.groups = OrderedDict()  # key -> [item ids]
+        self.current = None
+
+    def show(self, style, center_x, center_y, size, thickness, color, outline_color, outline_thickness):
+        key = (style_key(style), center_x, center_y, size, thickness, color, outline_color, outline_thickness)
+        view = self.view
+        if key != self.current:
+            self.hide()
+            group = self.groups.get(key)
+            if group is None:
+                group = [
+                    getattr(view, 'create_' + kind)(
+                        coords[0] + center_x, coords[1] + center_y, coords[2] + center_x, coords[3] + center_y,
+                        tags=('crosshair', 'persistent'), **options)
+                    for kind, coords, options in crosshair_parts(style, size, thickness, color,
+                                                                 outline_color, outline_thickness)
+                ]
+                self.groups[key] = group
+                while len(self.groups) > self.capacity:
+                    _, evicted = self.groups.popitem(last=False)
+                    for item in evicted:
+                        view.delete(item)
+            else:
+                self.groups.move_to_end(key)
+                for item in group:
+                    view.itemconfigure(item, state='normal')
+            self.current = key
+        # Items drawn this frame were created above the group; keep it on top
+        view.tag_raise('crosshair')
+
+    def hide(self):
+        if self.current is not None:
+            for item in self.groups[self.current]:
+                self.view.itemconfigure(item, state='hidden')
+            self.current = None
+
+    def forget(self):
+        """Call after the view was fully cleared; groups are rebuilt on next use"""
+        self.groups.clear()
+        self.current = None
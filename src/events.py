@@ -0,0 +1,127 @@
+import json
+
+from src.services import Channel, ServiceLoop
+
+# Shot event kinds
+HIT = 'hit'
+MISS = 'miss'
+EXPIRE = 'expire'  # A target timed out without being shot
+
+
+class ShotEvent:
+    """One shot (or target expiry) as seen by every subscriber.
+
+    Angles are in degrees; yaw_diff/pitch_diff are target minus crosshair
+    at the moment of the shot. reaction_time and precision are only set for
+    hits; click_ns is the perf_counter_ns() of the click, if there was one,
+    and click_delay_ms how long the click took to reach the shot handler.
+    """
+    __slots__ = ('kind', 'time', 'target_id', 'target_yaw', 'target_pitch',
+                 'shot_yaw', 'shot_pitch', 'target_angular_size', 'yaw_diff',
+                 'pitch_diff', 'reaction_time', 'precision', 'click_ns', 'click_delay_ms')
+
+    def __init__(self, kind, time, target_id, target_yaw, target_pitch, shot_yaw, shot_pitch,
+                 target_angular_size, yaw_diff=0.0, pitch_diff=0.0, reaction_time=None,
+                 precision=None, click_ns=None, click_delay_ms=None):
+        self.kind = kind
+        self.time = time
+        self.target_id = target_id
+        self.target_yaw = target_yaw
+        self.target_pitch = target_pitch
+        self.shot_yaw = shot_yaw
+        self.shot_pitch = shot_pitch
+        self.target_angular_size = target_angular_size
+        self.yaw_diff = yaw_diff
+        self.pitch_diff = pitch_diff
+        self.reaction_time = reaction_time
+        self.precision = precision
+        self.click_ns = click_ns
+        self.click_delay_ms = click_delay_ms
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class EventBus:
+    """Fan shot events out to subscribers.
+
+    Synchronous subscribers run inline in publish(), in subscription order;
+    use them only for cheap, gameplay-critical state (stats, score, sound).
+    Asynchronous subscribers receive lists of events from a task on the
+    service loop, gathered for up to batch_interval seconds, and run on its
+    I/O pool, so slow work (logging, analytics, persistence) never runs
+    inside the click handler. If the bounded queue fills up, new events are
+    dropped for the async side and counted.
+    """
+
+    def __init__(self, services=None, batch_interval=0.25, max_batch=256, queue_limit=10000):
+        self.services = services
+        self.owns_services = False
+        self.batch_interval = batch_interval
+        self.max_batch = max_batch
+        self.queue_limit = queue_limit
+        self.sync_handlers = []
+        self.async_handlers = []
+        self.channel = None
+
+    @property
+    def dropped(self):
+        return self.channel.dropped if self.channel is not None else 0
+
+    def subscribe(self, handler):
+        """Call handler(event) inline for every event"""
+        self.sync_handlers.append(handler)
+
+    def subscribe_async(self, handler):
+        """Call handler(list of events) in batches off the publishing thread"""
+        self.async_handlers.append(handler)
+        if self.channel is None:
+            if self.services is None:
+                # Standalone bus: host the delivery task on a loop of its own
+                self.services = ServiceLoop(name="event-bus").start()
+                self.owns_services = True
+            self.channel = Channel(self.services, self.queue_limit)
+            self.services.spawn(self._deliver(), "event-bus")
+
+    def publish(self, event):
+        for handler in self.sync_handlers:
+            handler(event)
+        if self.channel is not None:
+            self.channel.offer(event)
+
+    async def _deliver(self):
+        channel = self.channel
+        while True:
+            events = await channel.get_batch(self.max_batch, self.batch_interval)
+            for handler in self.async_handlers:
+                try:
+                    await self.services.offload(handler, events)
+                except Exception as e:
+                    print(f"Event subscriber {handler!r} failed: {e}")
+            channel.task_done(len(events))
+
+    def flush(self):
+        """Block until every queued event has been delivered to async subscribers"""
+        if self.channel is not None:
+            self.services.run(self.channel.join(), "event-bus flush")
+
+    def stop(self):
+        """Deliver what is queued; a bus with its own loop then shuts it down"""
+        self.flush()
+        if self.owns_services:
+            self.services.stop()
+
+
+class JsonlShotLog:
+    """Async subscriber appending every event as one JSON line"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, events):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for event in events:
+                f.write(json.dumps(event.as_dict()) + '\n')
+
+    def __repr__(self):
+        return f"JsonlShotLog({self.path!r})"
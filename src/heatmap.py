@@ -0,0 +1,130 @@
+import io
+import os
+
+from src.storage import write_atomic
+
+# Colour ramp for the rendered plot: empty -> purple -> orange -> yellow
+_RAMP_STOPS = (0.0, 0.35, 0.7, 1.0)
+_RAMP_COLORS = (
+    (42, 42, 42),
+    (110, 40, 170),
+    (240, 110, 40),
+    (255, 240, 120)
+)
+
+
+class ShotHeatmap:
+    """Fixed-size 2D histogram of shot positions relative to the target.
+
+    Offsets are normalised by the target's angular half-size, so +-1 is the
+    target edge on either axis whatever the target size; the grid covers
+    +-extent of that. add() only appends to a pending list; the counts are
+    brought up to date with one np.bincount over the pending shots whenever
+    they are read, so recording a shot is O(1) and reading is O(new shots).
+    """
+
+    def __init__(self, bins=41, extent=2.5):
+        import numpy as np
+
+        self.bins = bins
+        self.extent = extent
+        self._counts = np.zeros(bins * bins, dtype=np.int64)
+        self._pending_x = []
+        self._pending_y = []
+        self.version = 0  # Bumped on every change, for render caches
+
+    def add(self, x, y):
+        """Record one shot at normalised offset (x right, y up)"""
+        self._pending_x.append(x)
+        self._pending_y.append(y)
+        self.version += 1
+        if len(self._pending_x) >= 4096:
+            self._flush()  # Keep the pending lists bounded in long sessions
+
+    def _flush(self):
+        import numpy as np
+
+        if not self._pending_x:
+            return
+        scale = self.bins / (2 * self.extent)
+        cols = np.floor((np.asarray(self._pending_x) + self.extent) * scale).astype(np.int64)
+        rows = np.floor((self.extent - np.asarray(self._pending_y)) * scale).astype(np.int64)  # Row 0 = top
+        np.clip(cols, 0, self.bins - 1, out=cols)
+        np.clip(rows, 0, self.bins - 1, out=rows)
+        self._counts += np.bincount(rows * self.bins + cols, minlength=self.bins * self.bins)
+        self._pending_x.clear()
+        self._pending_y.clear()
+
+    @property
+    def counts(self):
+        """bins x bins array of shot counts (row 0 is the top)"""
+        self._flush()
+        return self._counts.reshape(self.bins, self.bins)
+
+    def total(self):
+        return int(self._counts.sum()) + len(self._pending_x)
+
+    def merge(self, other):
+        """Add another heatmap's counts (same grid) into this one"""
+        if (other.bins, other.extent) != (self.bins, self.extent):
+            raise ValueError("Heatmaps use different grids")
+        self._flush()
+        self._counts += other.counts.ravel()
+        self.version += 1
+
+    def add_counts(self, counts):
+        """Add a bins x bins (or flattened) count array, e.g. from a checkpoint"""
+        import numpy as np
+
+        counts = np.asarray(counts, dtype=np.int64).ravel()
+        if counts.shape != self._counts.shape:
+            raise ValueError("Counts use a different grid")
+        self._counts += counts
+        self.version += 1
+
+    def reset(self):
+        self._counts[:] = 0
+        self._pending_x.clear()
+        self._pending_y.clear()
+        self.version += 1
+
+    def save(self, path):
+        """Persist as .npz (counts plus grid parameters)"""
+        import numpy as np
+
+        # Write to memory first so the file is replaced atomically
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, counts=self.counts, extent=self.extent)
+        write_atomic(path, buffer.getvalue())
+
+    @classmethod
+    def load(cls, path, bins=41, extent=2.5):
+        """Load a saved heatmap, or return an empty one if the file is missing or from another grid"""
+        import numpy as np
+
+        heatmap = cls(bins, extent)
+        if os.path.exists(path):
+            try:
+                with np.load(path) as data:
+                    counts = data['counts']
+                    if counts.shape == (bins, bins) and float(data['extent']) == extent:
+                        heatmap.add_counts(counts)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Could not load heatmap {path}: {e}")
+        return heatmap
+
+    def image_data(self):
+        """Tk PhotoImage.put() data: one '{#rrggbb ...}' group per row, log-scaled colours"""
+        import numpy as np
+
+        counts = self.counts
+        peak = counts.max()
+        if peak > 0:
+            levels = np.log1p(counts) / np.log1p(peak)
+        else:
+            levels = np.zeros(counts.shape)
+        rgb = np.stack([np.interp(levels, _RAMP_STOPS, [color[channel] for color in _RAMP_COLORS])
+                        for channel in range(3)], axis=-1).astype(np.int64)
+        packed = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+        return ' '.join('{' + ' '.join('#%06x' % value for value in row) + '}'
+                        for row in packed.tolist())
@@ -1,46 +1,171 @@
+import time
+from collections import deque
 from pynput import keyboard
-from pynput.keyboard import Key, KeyCode
+from pynput.keyboard import Key
+
+# Default hotkeys: action name -> list of key combinations (any one triggers it)
+DEFAULT_BINDINGS = {
+    'toggle_window': ['ctrl+shift+a']
+}
+
+# Normalised codes. Printable keys use the code point of their lower-case
+# character; modifiers fold left/right variants together; other named keys
+# and bare virtual-key codes get their own ranges.
+MODIFIER_CODES = {
+    'ctrl': -1,
+    'shift': -2,
+    'alt': -3,
+    'cmd': -4
+}
+SPECIAL_KEY_BASE = 0x110000  # Just past the last Unicode code point
+VK_BASE = 0x120000
+NO_CODE = None
+
+
+def _build_special_codes():
+    """Map every pynput Key member to its normalised code"""
+    codes = {}
+    for index, (name, member) in enumerate(Key.__members__.items()):
+        family = name.split('_', 1)[0]
+        if family in MODIFIER_CODES and name != 'alt_gr':
+            codes[member] = MODIFIER_CODES[family]
+        elif member not in codes:
+            codes[member] = SPECIAL_KEY_BASE + index
+    return codes
+
+
+SPECIAL_CODES = _build_special_codes()
+
+
+def parse_combo(combo):
+    """Turn a combination like 'ctrl+shift+a' or 'alt+f1' into a frozenset of codes"""
+    codes = set()
+    for token in combo.lower().split('+'):
+        token = token.strip()
+        if token in MODIFIER_CODES:
+            codes.add(MODIFIER_CODES[token])
+        elif len(token) == 1:
+            codes.add(ord(token))
+        elif token in Key.__members__:
+            codes.add(SPECIAL_CODES[Key[token]])
+        else:
+            raise ValueError(f"Unknown key '{token}' in hotkey '{combo}'")
+    return frozenset(codes)
+
+
+def index_bindings(bindings):
+    """Index action -> [combo] bindings by each of their keys: code -> [(combo codes, action)].
+
+    A combo bound twice to the same action (in any key order) is indexed
+    once, so one press never queues the action twice.
+    """
+    by_code = {}
+    for action, combos in bindings.items():
+        for combo in combos:
+            entry = (parse_combo(combo), action)
+            for code in entry[0]:
+                entries = by_code.setdefault(code, [])
+                if entry not in entries:
+                    entries.append(entry)
+    return by_code
+
 
 class HotkeyManager:
-    def __init__(self, toggle_callback):
-        self.toggle_callback = toggle_callback
-        self.current_keys = set()
-        
-        # Define the hotkey combination: Ctrl+Shift+A
-        self.HOTKEY_COMBINATION = {
-            Key.ctrl_l,
-            Key.shift,
-            KeyCode.from_char('a')
-        }
-        
-        # Start listener
+    """Global hotkeys matched on the pynput listener thread, run on the Tk thread.
+
+    Keys are normalised to integer codes without allocating (pynput's KeyCode
+    hashes via repr(), so it is never used as a dict key here). Each binding is
+    indexed under every key it contains, so a key press only compares the
+    pressed set against the few bindings that involve that key. Matches are
+    queued and only executed by dispatch_pending(), which the owner calls from
+    the Tk thread; the time from key press to action is recorded. `waker`, if
+    given, is called on the listener thread after each match so the owner can
+    schedule that dispatch without polling.
+    """
+
+    def __init__(self, actions, bindings=None, latency_window=200, waker=None):
+        self.actions = actions  # action name -> callback
+        self.waker = waker
+        self.pressed = set()
+        self.pending = deque()  # (action name, press perf_counter_ns), filled by the listener
+        self.latencies = deque(maxlen=latency_window)  # ms, key press -> action run
+
+        self.bindings_by_code = index_bindings(bindings or DEFAULT_BINDINGS)
+        self.listener = None
+
+    def start(self):
+        """Start the global keyboard listener"""
         self.listener = keyboard.Listener(
             on_press=self.on_press,
             on_release=self.on_release
         )
         self.listener.start()
-        
+        return self
+
+    @staticmethod
+    def normalise(key):
+        """Return the normalised code for a pynput key (NO_CODE if it has none)"""
+        if isinstance(key, Key):
+            return SPECIAL_CODES.get(key, NO_CODE)
+        char = key.char
+        if char is not None and len(char) == 1:
+            code = ord(char)
+            if code < 0x20:
+                return code + 0x60  # Ctrl+letter arrives as a control character
+            if 0x41 <= code <= 0x5a:
+                return code + 0x20  # Upper-case ASCII letter
+            if code > 0x7f:
+                return ord(char.lower())
+            return code
+        vk = key.vk
+        if vk is None:
+            return NO_CODE
+        if 0x41 <= vk <= 0x5a:
+            return vk + 0x20  # Letter virtual-key codes match their character
+        return VK_BASE + vk
+
     def on_press(self, key):
-        """Handle key press"""
-        # Normalize the key
-        if isinstance(key, KeyCode):
-            key = KeyCode.from_char(key.char.lower()) if key.char else key
-        
-        self.current_keys.add(key)
-        
-        # Check if hotkey combination is pressed (must match exactly)
-        if self.current_keys == self.HOTKEY_COMBINATION:
-            self.toggle_callback()
-            
+        """Handle key press (listener thread)"""
+        code = self.normalise(key)
+        if code is NO_CODE or code in self.pressed:
+            return  # Unknown key or auto-repeat
+        self.pressed.add(code)
+
+        # Exact match: the pressed keys must be precisely one of the bindings
+        candidates = self.bindings_by_code.get(code)
+        if candidates:
+            matched = False
+            for codes, action in candidates:
+                if codes == self.pressed:
+                    self.pending.append((action, time.perf_counter_ns()))
+                    matched = True
+            if matched and self.waker is not None:
+                self.waker()
+
     def on_release(self, key):
-        """Handle key release"""
-        # Normalize the key
-        if isinstance(key, KeyCode):
-            key = KeyCode.from_char(key.char.lower()) if key.char else key
-            
-        if key in self.current_keys:
-            self.current_keys.remove(key)
-            
+        """Handle key release (listener thread)"""
+        self.pressed.discard(self.normalise(key))
+
+    def dispatch_pending(self):
+        """Run queued hotkey actions; call from the Tk thread"""
+        pending = self.pending
+        while pending:
+            action, press_ns = pending.popleft()
+            callback = self.actions.get(action)
+            if callback is not None:
+                callback()
+                self.latencies.append((time.perf_counter_ns() - press_ns) / 1e6)
+
+    def latency_lines(self):
+        """Human-readable press-to-action latency summary"""
+        if not self.latencies:
+            return ["hotkey->action: no samples"]
+        ordered = sorted(self.latencies)
+        count = len(ordered)
+        return [f"hotkey->action: p50 {ordered[count // 2]:.1f} | "
+                f"max {ordered[-1]:.1f} ms (n={count})"]
+
     def stop(self):
         """Stop the listener"""
-        self.listener.stop()
+        if self.listener is not None:
+            self.listener.stop()
@@ -0,0 +1,163 @@
+import socket
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+def _percentiles(samples):
+    """Return (p50, p95, p99, max, count) of a sample collection, or None if empty"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    count = len(ordered)
+
+    def pick(q):
+        return ordered[min(count - 1, int(count * q))]
+
+    return pick(0.50), pick(0.95), pick(0.99), ordered[-1], count
+
+
+class LatencyMonitor:
+    """Input-to-draw (and optionally input-to-photon) latency measurement.
+
+    The frame loop calls input_sampled() with the perf_counter_ns() timestamp
+    of every mouse sample that moved the camera, and draw_scene calls
+    frame_submitted() once the frame has been handed to Tk. The first frame
+    drawn after a sample is tagged with the oldest undrawn sample, giving an
+    input-to-draw-submit latency per tagged frame.
+
+    To close the loop to the screen, something that sees the display (a
+    photodiode on the sensor patch, or a stand-in) reports when a tagged frame
+    was actually presented via report_presentation(), either directly or as a
+    UDP datagram (see listen_udp). All timestamps are perf_counter_ns(), which
+    is a system-wide monotonic clock on the supported platforms.
+    """
+
+    def __init__(self, window=2000, max_unpresented=240):
+        self.enabled = False
+        self.pending_input_ns = 0  # Oldest input sample not yet drawn (0 = none)
+        self.frame_id = 0
+        self.draw_latencies = deque(maxlen=window)  # ms, sample -> draw submit
+        self.present_latencies = deque(maxlen=window)  # ms, sample -> presentation
+        self.max_unpresented = max_unpresented
+        self._unpresented = OrderedDict()  # frame_id -> input timestamp (ns)
+        self._lock = threading.Lock()
+        self._udp_services = None
+        self._udp_transport = None
+
+    def toggle(self):
+        """Turn measurement on/off, starting from empty distributions"""
+        self.enabled = not self.enabled
+        self.reset()
+
+    def reset(self):
+        """Drop all measurements"""
+        with self._lock:
+            self.pending_input_ns = 0
+            self.draw_latencies.clear()
+            self.present_latencies.clear()
+            self._unpresented.clear()
+
+    def input_sampled(self, sample_ns):
+        """Note a camera-moving input sample (keeps the oldest undrawn one)"""
+        if self.enabled and not self.pending_input_ns:
+            self.pending_input_ns = sample_ns
+
+    def frame_submitted(self, submit_ns):
+        """Tag the frame just drawn with any pending sample; returns its frame id or 0"""
+        input_ns = self.pending_input_ns
+        if not input_ns:
+            return 0
+        self.pending_input_ns = 0
+        self.frame_id += 1
+        with self._lock:
+            self.draw_latencies.append((submit_ns - input_ns) / 1e6)
+            self._unpresented[self.frame_id] = input_ns
+            while len(self._unpresented) > self.max_unpresented:
+                self._unpresented.popitem(last=False)
+        return self.frame_id
+
+    def report_presentation(self, present_ns=None, frame_id=None):
+        """Report that a tagged frame reached the screen (thread-safe).
+
+        present_ns defaults to now; frame_id defaults to the oldest tagged
+        frame not yet reported, which is what a photodiode watching the
+        sensor patch observes.
+        """
+        if present_ns is None:
+            present_ns = time.perf_counter_ns()
+        with self._lock:
+            if frame_id is None:
+                if not self._unpresented:
+                    return None
+                frame_id, input_ns = self._unpresented.popitem(last=False)
+            else:
+                input_ns = self._unpresented.pop(frame_id, None)
+                if input_ns is None:
+                    return None
+            latency = (present_ns - input_ns) / 1e6
+            self.present_latencies.append(latency)
+        return latency
+
+    def listen_udp(self, port, services, host="127.0.0.1"):
+        """Accept presentation reports as UDP datagrams on the service loop.
+
+        An empty datagram means "presented now"; otherwise the payload is
+        "<present_ns>" or "<frame_id> <present_ns>" as ASCII integers.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind((host, port))  # Bound here so a taken port fails at start-up
+        sock.setblocking(False)
+        self._udp_services = services
+        self._udp_transport = services.run(self._open_udp(sock), "latency-udp")
+
+    async def _open_udp(self, sock):
+        import asyncio
+        monitor = self
+
+        class Protocol(asyncio.DatagramProtocol):
+            def datagram_received(self, payload, addr):
+                monitor.handle_datagram(payload, time.perf_counter_ns())
+
+        transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(Protocol, sock=sock)
+        return transport
+
+    def handle_datagram(self, payload, received_ns):
+        parts = payload.split()
+        try:
+            if not parts:
+                self.report_presentation(received_ns)
+            elif len(parts) == 1:
+                self.report_presentation(int(parts[0]))
+            else:
+                self.report_presentation(int(parts[1]), int(parts[0]))
+        except ValueError:
+            print(f"Latency: ignoring malformed report {payload!r}")
+
+    def stop(self):
+        """Close the UDP listener, if any"""
+        if self._udp_transport is not None:
+            self._udp_services.call_soon(self._udp_transport.close)
+            self._udp_transport = None
+
+    def summary(self):
+        """Return {'draw': stats, 'present': stats}; stats are (p50, p95, p99, max, n) or None"""
+        with self._lock:
+            return {
+                'draw': _percentiles(self.draw_latencies),
+                'present': _percentiles(self.present_latencies)
+            }
+
+    def summary_lines(self):
+        """Human-readable summary lines for the HUD and console"""
+        lines = []
+        summary = self.summary()
+        for label, stats in (("input->draw", summary['draw']),
+                             ("input->photon", summary['present'])):
+            if stats is None:
+                lines.append(f"{label}: no samples")
+            else:
+                p50, p95, p99, worst, count = stats
+                lines.append(f"{label}: p50 {p50:.1f} | p95 {p95:.1f} | "
+                             f"p99 {p99:.1f} | max {worst:.1f} ms (n={count})")
+        return lines
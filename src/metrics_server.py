@@ -0,0 +1,151 @@
+import json
+import time
+
+PREFIX = 'aim_warmup_'
+
+# Exported numeric fields of a snapshot: (key, Prometheus type, help text)
+METRICS = (
+    ('active', 'gauge', "1 while a session is running"),
+    ('hits_total', 'counter', "Targets hit this session"),
+    ('misses_total', 'counter', "Missed shots and expired targets this session"),
+    ('accuracy_percent', 'gauge', "Session accuracy"),
+    ('reaction_time_seconds', 'gauge', "Session average reaction time"),
+    ('score', 'gauge', "Mode score"),
+    ('streak', 'gauge', "Current hit streak"),
+    ('best_streak', 'gauge', "Best hit streak this session"),
+    ('session_seconds', 'gauge', "Focused session time"),
+    ('rolling_accuracy_percent', 'gauge', "Accuracy over the rolling window"),
+    ('rolling_reaction_time_seconds', 'gauge', "Average reaction time over the rolling window"),
+    ('rolling_path_efficiency_percent', 'gauge', "Path efficiency over the rolling window"),
+    ('rolling_precision_percent', 'gauge', "Hit precision over the rolling window"),
+    ('rolling_overshoot_x_percent', 'gauge', "Shots overshooting on X over the rolling window"),
+    ('rolling_overshoot_y_percent', 'gauge', "Shots overshooting on Y over the rolling window"),
+    ('rolling_undershoot_x_percent', 'gauge', "Shots undershooting on X over the rolling window"),
+    ('rolling_undershoot_y_percent', 'gauge', "Shots undershooting on Y over the rolling window"),
+    ('sens_x', 'gauge', "Live X sensitivity"),
+    ('sens_y', 'gauge', "Live Y sensitivity"),
+    ('forecast_sens_x', 'gauge', "Forecast perfect X sensitivity"),
+    ('forecast_sens_y', 'gauge', "Forecast perfect Y sensitivity"),
+    ('frame_seconds', 'gauge', "Work time of the last frame"),
+    ('frame_interval_seconds', 'gauge', "Time between the last two frames"),
+    ('input_interval_seconds', 'gauge', "Time between the last two mouse samples"),
+    ('click_delay_seconds', 'gauge', "Click capture to shot handler delay of the last click")
+)
+
+
+def prometheus_text(snapshot):
+    """Render a snapshot in the Prometheus text exposition format"""
+    lines = []
+    for key, kind, help_text in METRICS:
+        value = snapshot.get(key)
+        if value is None:
+            continue
+        name = PREFIX + key
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {float(value):.6g}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Opt-in localhost endpoint serving live session stats.
+
+    The game loop calls publish() with a fresh dict once per frame; it only
+    swaps a reference, and connections read whichever snapshot is current,
+    so a scrape never blocks or locks the game loop. Connections are
+    coroutines on the service loop; a slow /events client only waits on its
+    own drain(). Routes:
+
+        /metrics        Prometheus text format
+        /metrics.json   the latest snapshot as JSON
+        /events         Server-Sent Events, one JSON snapshot per change,
+                        at most every stream_interval seconds
+    """
+
+    def __init__(self, port, services, host='127.0.0.1', stream_interval=0.25):
+        self.host = host
+        self.port = port
+        self.services = services
+        self.stream_interval = stream_interval
+        self.snapshot = {}
+        self.version = 0
+        self.server = None
+
+    def publish(self, snapshot):
+        """Make `snapshot` current (called from the Tk thread; never mutate it afterwards)"""
+        self.snapshot = snapshot
+        self.version += 1
+
+    def start(self):
+        try:
+            self.server = self.services.run(self._listen(), "metrics-server")
+        except OSError as e:
+            print(f"Metrics server could not listen on {self.host}:{self.port}: {e}")
+            return False
+        if self.server is None:
+            return False
+        print(f"Metrics on http://{self.host}:{self.port}/metrics (also /metrics.json, /events)")
+        return True
+
+    async def _listen(self):
+        import asyncio
+        return await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def _handle(self, reader, writer):
+        try:
+            request = (await reader.readline()).decode('latin-1').split()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass  # Headers are not needed
+            path = request[1].split('?', 1)[0] if len(request) >= 2 else ''
+            if not request or request[0] != 'GET':
+                self._send(writer, "405 Method Not Allowed", "Method not allowed\n", 'text/plain')
+            elif path == '/metrics':
+                self._send(writer, "200 OK", prometheus_text(self.snapshot), 'text/plain; version=0.0.4')
+            elif path == '/metrics.json':
+                self._send(writer, "200 OK", json.dumps(self.snapshot), 'application/json')
+            elif path == '/events':
+                await self._stream(writer)
+            else:
+                self._send(writer, "404 Not Found", "Not found\n", 'text/plain')
+            await writer.drain()
+        except (ConnectionError, ValueError):
+            pass  # Client went away, or sent an oversized line
+        finally:
+            writer.close()
+
+    def _send(self, writer, status, body, content_type):
+        data = body.encode('utf-8')
+        writer.write((f"HTTP/1.1 {status}\r\n"
+                      f"Content-Type: {content_type}\r\n"
+                      f"Content-Length: {len(data)}\r\n"
+                      "Cache-Control: no-store\r\n"
+                      "Connection: close\r\n\r\n").encode('latin-1') + data)
+
+    async def _stream(self, writer):
+        import asyncio
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                     b"Cache-Control: no-store\r\nConnection: close\r\n\r\n")
+        sent_version = -1
+        last_write = 0.0
+        while self.server is not None:
+            now = time.monotonic()
+            if self.version != sent_version:
+                sent_version = self.version
+                writer.write(f"data: {json.dumps(self.snapshot)}\n\n".encode('utf-8'))
+                await writer.drain()
+                last_write = now
+            elif now - last_write > 15:
+                writer.write(b": keep-alive\n\n")  # Lets proxies and clients see we're alive
+                await writer.drain()
+                last_write = now
+            await asyncio.sleep(self.stream_interval)
+
+    def stop(self):
+        server = self.server
+        if server is not None:
+            self.server = None  # Ends the /events streams
+            self.services.run(self._close(server), "metrics-server stop")
+
+    async def _close(self, server):
+        server.close()
+        await server.wait_closed()
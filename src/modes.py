@@ -0,0 +1,205 @@
+import math
+
+from src.tracking import RandomWalkMotion, StrafeMotion
+
+
+class RandomSpawn:
+    """Uniformly random positions inside the spawn bounds"""
+
+    def spawn(self, count, existing_yaws, existing_pitches, max_yaw, max_pitch, rng):
+        return rng.uniform(-max_yaw, max_yaw, count), rng.uniform(-max_pitch, max_pitch, count)
+
+
+class GridSpawn:
+    """Gridshot layout: targets occupy cells of a fixed cols x rows grid.
+
+    New targets go into randomly chosen cells that no live target is
+    sitting in, never sharing one. If fewer cells are free than requested,
+    only that many are returned; the caller places the rest once targets
+    are cleared and their cells free up.
+    """
+
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+
+    def spawn(self, count, existing_yaws, existing_pitches, max_yaw, max_pitch, rng):
+        import numpy as np
+
+        cell_w = 2 * max_yaw / self.cols
+        cell_h = 2 * max_pitch / self.rows
+        centre_yaws = -max_yaw + cell_w * (np.arange(self.cols) + 0.5)
+        centre_pitches = -max_pitch + cell_h * (np.arange(self.rows) + 0.5)
+        cell_yaws, cell_pitches = (grid.ravel() for grid in np.meshgrid(centre_yaws, centre_pitches))
+
+        # A cell is taken if a live target is within half a cell of its centre
+        free = np.ones(len(cell_yaws), dtype=bool)
+        if len(existing_yaws):
+            near_x = np.abs(cell_yaws[:, None] - existing_yaws[None, :]) < cell_w / 2
+            near_y = np.abs(cell_pitches[:, None] - existing_pitches[None, :]) < cell_h / 2
+            free = ~(near_x & near_y).any(axis=1)
+        candidates = np.flatnonzero(free)
+        chosen = rng.choice(candidates, size=min(count, len(candidates)), replace=False)
+        return cell_yaws[chosen], cell_pitches[chosen]
+
+
+class ClusterSpawn:
+    """Targets packed around a shared centre that moves once the cluster is cleared"""
+
+    def __init__(self, spread):
+        self.spread = spread  # Standard deviation around the centre, in degrees
+        self.centre = None
+
+    def spawn(self, count, existing_yaws, existing_pitches, max_yaw, max_pitch, rng):
+        import numpy as np
+
+        if self.centre is None or not len(existing_yaws):
+            inner_yaw = max(max_yaw - 2 * self.spread, 0.0)
+            inner_pitch = max(max_pitch - 2 * self.spread, 0.0)
+            self.centre = (rng.uniform(-inner_yaw, inner_yaw), rng.uniform(-inner_pitch, inner_pitch))
+        yaws = np.clip(rng.normal(self.centre[0], self.spread, count), -max_yaw, max_yaw)
+        pitches = np.clip(rng.normal(self.centre[1], self.spread, count), -max_pitch, max_pitch)
+        return yaws, pitches
+
+
+class PoissonDiskSpawn:
+    """Spread-out targets with a minimum separation (dart throwing on a hash grid).
+
+    Live and newly placed targets are bucketed into cells of side
+    min_distance / sqrt(2), so each candidate is checked against a constant
+    number of neighbours no matter how many targets there are. When no
+    candidate fits within `attempts` tries (a crowded field), the one
+    furthest from its neighbours is used.
+    """
+
+    def __init__(self, min_distance, attempts=30):
+        self.min_distance = min_distance
+        self.attempts = attempts
+
+    def spawn(self, count, existing_yaws, existing_pitches, max_yaw, max_pitch, rng):
+        import numpy as np
+
+        radius = self.min_distance
+        cell = radius / math.sqrt(2)
+        grid = {}
+        for yaw, pitch in zip(existing_yaws.tolist(), existing_pitches.tolist()):
+            grid.setdefault((int(yaw // cell), int(pitch // cell)), []).append((yaw, pitch))
+
+        def clearance(yaw, pitch):
+            cx, cy = int(yaw // cell), int(pitch // cell)
+            nearest = math.inf
+            for gx in range(cx - 2, cx + 3):
+                for gy in range(cy - 2, cy + 3):
+                    for other_yaw, other_pitch in grid.get((gx, gy), ()):
+                        nearest = min(nearest, math.hypot(yaw - other_yaw, pitch - other_pitch))
+            return nearest
+
+        yaws = np.empty(count)
+        pitches = np.empty(count)
+        for i in range(count):
+            candidate_yaws = rng.uniform(-max_yaw, max_yaw, self.attempts).tolist()
+            candidate_pitches = rng.uniform(-max_pitch, max_pitch, self.attempts).tolist()
+            best, best_clearance = None, -1.0
+            for yaw, pitch in zip(candidate_yaws, candidate_pitches):
+                distance = clearance(yaw, pitch)
+                if distance >= radius:
+                    best = (yaw, pitch)
+                    break
+                if distance > best_clearance:
+                    best, best_clearance = (yaw, pitch), distance
+            yaws[i], pitches[i] = best
+            grid.setdefault((int(best[0] // cell), int(best[1] // cell)), []).append(best)
+        return yaws, pitches
+
+
+class Scoring:
+    """Per-mode points: a base per hit, optional precision/speed bonuses, penalties,
+    and for tracking modes a rate per second spent on target"""
+
+    def __init__(self, hit=100, miss=0, expire=0, precision_bonus=0, speed_bonus=0, speed_window=1.0,
+                 on_target=0):
+        self.hit = hit
+        self.miss = miss
+        self.expire = expire
+        self.precision_bonus = precision_bonus  # Extra points for a dead-centre hit
+        self.speed_bonus = speed_bonus  # Extra points for an instant hit, falling to 0 at speed_window
+        self.speed_window = speed_window
+        self.on_target = on_target  # Points per second with the crosshair on a target (tracking)
+
+    def hit_points(self, precision, reaction_time):
+        """Points for a hit with precision in percent and reaction time in seconds"""
+        points = self.hit + self.precision_bonus * max(0.0, precision) / 100
+        if self.speed_window > 0:
+            points += self.speed_bonus * max(0.0, 1 - reaction_time / self.speed_window)
+        return int(round(points))
+
+
+# Game modes. 'kind' selects the input handling ('click' = shoot static
+# targets, 'tracking' = keep the crosshair on targets moved by 'motion');
+# 'targets' live targets are kept on screen; a lifetime of None
+# means targets stay until they are shot (spawned FROZEN in the TargetStore);
+# 'spawn' builds a fresh spawn policy for each session.
+MODES = {
+    'random': {
+        'name': "Random",
+        'kind': 'click',
+        'title': "Random Targets Mode",
+        'targets': 2,
+        'size': 35,
+        'lifetime': 3.0,
+        'spawn': RandomSpawn,
+        'scoring': Scoring(hit=100, miss=-50, expire=-50, speed_bonus=50)
+    },
+    'gridshot': {
+        'name': "Gridshot",
+        'kind': 'click',
+        'title': "Gridshot Mode",
+        'targets': 3,
+        'size': 35,
+        'lifetime': None,
+        'spawn': lambda: GridSpawn(3, 3),
+        'scoring': Scoring(hit=100, miss=-50, speed_bonus=50)
+    },
+    'cluster': {
+        'name': "Cluster",
+        'kind': 'click',
+        'title': "Cluster Mode",
+        'targets': 6,
+        'size': 25,
+        'lifetime': None,
+        'spawn': lambda: ClusterSpawn(spread=3.0),
+        'scoring': Scoring(hit=100, miss=-25, precision_bonus=50)
+    },
+    'spread': {
+        'name': "Spread",
+        'kind': 'click',
+        'title': "Spread Mode (high density)",
+        'targets': 100,
+        'size': 10,
+        'lifetime': None,
+        'spawn': lambda: PoissonDiskSpawn(min_distance=2.0),
+        'scoring': Scoring(hit=50, miss=-10, precision_bonus=50)
+    },
+    'tracking': {
+        'name': "Tracking",
+        'kind': 'tracking',
+        'title': "Tracking Mode (random walk)",
+        'targets': 1,
+        'size': 30,
+        'lifetime': None,
+        'spawn': RandomSpawn,
+        'motion': lambda: RandomWalkMotion(speed=12.0, agility=1.5),
+        'scoring': Scoring(on_target=100)
+    },
+    'strafe': {
+        'name': "Strafe",
+        'kind': 'tracking',
+        'title': "Strafe Tracking Mode",
+        'targets': 1,
+        'size': 30,
+        'lifetime': None,
+        'spawn': lambda: GridSpawn(1, 1),
+        'motion': lambda: StrafeMotion(amplitude=8.0, period=2.0),
+        'scoring': Scoring(on_target=100)
+    }
+}
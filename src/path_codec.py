@@ -0,0 +1,280 @@
+import json
+import math
+import struct
+
+from src import shot_analysis
+from src.storage import write_atomic
+
+ARCHIVE_MAGIC = b'AWPA1'
+RAW_BYTES_PER_POINT = 16  # Two float64s, what an uncompressed path costs
+
+
+# --- Varint / zigzag primitives ---
+def _zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def _unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def _put_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_varint(data, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+# --- Point coding ---
+def encode(points, quantum=0.001):
+    """Quantise (yaw, pitch) points to `quantum` degrees and delta/zigzag/varint encode them"""
+    out = bytearray()
+    _put_varint(out, len(points))
+    _put_varint(out, int(round(quantum * 1e6)))  # Quantum in micro-degrees
+    prev_yaw = prev_pitch = 0
+    for yaw, pitch in points:
+        q_yaw = int(round(yaw / quantum))
+        q_pitch = int(round(pitch / quantum))
+        _put_varint(out, _zigzag(q_yaw - prev_yaw))
+        _put_varint(out, _zigzag(q_pitch - prev_pitch))
+        prev_yaw, prev_pitch = q_yaw, q_pitch
+    return bytes(out)
+
+
+def encode_lossless(points):
+    """Store (yaw, pitch) points as raw float64s, flagged by a zero quantum"""
+    out = bytearray()
+    _put_varint(out, len(points))
+    _put_varint(out, 0)
+    out += struct.pack(f'<{2 * len(points)}d', *(value for point in points for value in point))
+    return bytes(out)
+
+
+def decode(data):
+    """Inverse of encode() and encode_lossless(): returns a list of (yaw, pitch) tuples"""
+    count, pos = _get_varint(data, 0)
+    micro, pos = _get_varint(data, pos)
+    if micro == 0:
+        values = struct.unpack_from(f'<{2 * count}d', data, pos)
+        return list(zip(values[0::2], values[1::2]))
+    quantum = micro / 1e6
+    points = []
+    q_yaw = q_pitch = 0
+    for _ in range(count):
+        delta, pos = _get_varint(data, pos)
+        q_yaw += _unzigzag(delta)
+        delta, pos = _get_varint(data, pos)
+        q_pitch += _unzigzag(delta)
+        points.append((q_yaw * quantum, q_pitch * quantum))
+    return points
+
+
+# --- Simplification ---
+def turning_points(points, threshold=0.01):
+    """Indices where either axis changes direction (the extrema final_approach looks at)"""
+    keep = set()
+    for axis in (0, 1):
+        last_dir = 0
+        last_index = 0
+        for i in range(1, len(points)):
+            step = points[i][axis] - points[i - 1][axis]
+            if axis == 0:
+                step = shot_analysis.wrap_degrees(step)
+            direction = 1 if step > threshold else (-1 if step < -threshold else 0)
+            if direction == 0:
+                continue
+            if last_dir != 0 and direction != last_dir:
+                keep.add(last_index)
+                keep.add(i - 1)
+            last_dir = direction
+            last_index = i
+    return keep
+
+
+def simplify(points, epsilon, keep=()):
+    """Ramer-Douglas-Peucker simplification that never drops indices in `keep`.
+
+    The forced indices split the path into spans that are simplified
+    independently, so turning points and overshoot extremes survive exactly.
+    """
+    count = len(points)
+    if count < 3 or epsilon <= 0:
+        return list(points)
+    anchors = sorted({0, count - 1, *keep})
+    kept = [False] * count
+    for index in anchors:
+        kept[index] = True
+
+    stack = list(zip(anchors, anchors[1:]))
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        x1, y1 = points[first]
+        x2, y2 = points[last]
+        dx, dy = x2 - x1, y2 - y1
+        length = math.hypot(dx, dy)
+        worst, worst_index = -1.0, None
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if length > 0:
+                distance = abs(dy * (px - x1) - dx * (py - y1)) / length
+            else:
+                distance = math.hypot(px - x1, py - y1)
+            if distance > worst:
+                worst, worst_index = distance, i
+        if worst > epsilon:
+            kept[worst_index] = True
+            stack.append((first, worst_index))
+            stack.append((worst_index, last))
+    return [point for point, keep_point in zip(points, kept) if keep_point]
+
+
+def _same_approach(result, reference, tolerance):
+    """True if two final_approach() results agree on reversals and overshoots"""
+    if result is None or reference is None:
+        return result is reference
+    return (result['x_reversals'] == reference['x_reversals'] and
+            result['y_reversals'] == reference['y_reversals'] and
+            (result['x_max_overshoot'] > 0) == (reference['x_max_overshoot'] > 0) and
+            (result['y_max_overshoot'] > 0) == (reference['y_max_overshoot'] > 0) and
+            abs(result['x_max_overshoot'] - reference['x_max_overshoot']) <= tolerance and
+            abs(result['y_max_overshoot'] - reference['y_max_overshoot']) <= tolerance)
+
+
+def _same_undershoot(simplified, points, shot, target_yaw, target_pitch, radius):
+    """True if undershoot() gives the same verdict for both paths"""
+    if shot is None:
+        return True
+    return (shot_analysis.undershoot(simplified, *shot, target_yaw, target_pitch, radius) ==
+            shot_analysis.undershoot(points, *shot, target_yaw, target_pitch, radius))
+
+
+def compress_path(points, target_yaw, target_pitch, radius, shot=None, epsilon=0.02, quantum=0.001):
+    """Compress an approach path without changing its shot analysis.
+
+    Turning points are always kept, then RDP runs with `epsilon` degrees of
+    tolerance and the result is quantised. The compressed path is decoded
+    and re-analysed; if reversal counts or overshoots differ at all (or the
+    undershoot verdict for the (yaw, pitch) `shot`, when given), a tighter
+    epsilon is tried, then quantisation alone, then micro-degree
+    quantisation. If even that changes the analysis (steps sitting right at
+    the reversal dead-band), the raw float64 points are stored with
+    encode_lossless(), recorded as quantum 0. Returns a dict with the
+    encoded 'data', the 'epsilon'/'quantum' used and the point and byte
+    counts.
+    """
+    points = list(points)
+    reference = shot_analysis.final_approach(points, target_yaw, target_pitch, radius)
+    keep = turning_points(points)
+    if reference is not None:
+        for position in (reference['x_overshoot_pos'], reference['y_overshoot_pos']):
+            if position is not None:
+                keep.add(points.index(position))
+
+    attempts = [(epsilon, quantum), (epsilon / 4, quantum), (0.0, quantum), (0.0, 1e-6)]
+    for attempt_epsilon, attempt_quantum in attempts:
+        simplified = simplify(points, attempt_epsilon, keep)
+        data = encode(simplified, attempt_quantum)
+        decoded = decode(data)
+        result = shot_analysis.final_approach(decoded, target_yaw, target_pitch, radius)
+        if (_same_approach(result, reference, attempt_quantum) and
+                _same_undershoot(decoded, points, shot, target_yaw, target_pitch, radius)):
+            break
+    else:
+        simplified = points
+        data = encode_lossless(points)
+        attempt_epsilon, attempt_quantum = 0.0, 0.0
+    return {
+        'data': data,
+        'epsilon': attempt_epsilon,
+        'quantum': attempt_quantum,
+        'raw_points': len(points),
+        'points': len(simplified),
+        'raw_bytes': len(points) * RAW_BYTES_PER_POINT,
+        'bytes': len(data)
+    }
+
+
+class PathArchive:
+    """Compressed approach paths for a session, saved as one binary file.
+
+    Each record is a small JSON header (shot time, hit, target) followed by
+    the encoded path, both length-prefixed, so a file can be streamed back
+    with load() for re-analysis without keeping raw paths around.
+    """
+
+    def __init__(self):
+        self.records = []  # (meta dict, encoded bytes)
+        self.raw_bytes = 0
+        self.bytes = 0
+        self.fallbacks = 0  # Paths stored without RDP to keep the analysis identical
+        self.lossless = 0  # ...of which stored as raw float64s (see encode_lossless)
+
+    def __len__(self):
+        return len(self.records)
+
+    def add(self, meta, compressed):
+        self.records.append((meta, compressed['data']))
+        self.raw_bytes += compressed['raw_bytes']
+        self.bytes += compressed['bytes']
+        if compressed['epsilon'] == 0:
+            self.fallbacks += 1
+        if compressed['quantum'] == 0:
+            self.lossless += 1
+
+    def clear(self):
+        self.records = []
+        self.raw_bytes = 0
+        self.bytes = 0
+        self.fallbacks = 0
+        self.lossless = 0
+
+    def ratio(self):
+        """Raw float64 size divided by compressed size"""
+        return self.raw_bytes / self.bytes if self.bytes else 0.0
+
+    def save(self, path):
+        out = bytearray(ARCHIVE_MAGIC)
+        for meta, data in self.records:
+            header = json.dumps(meta, separators=(',', ':')).encode('utf-8')
+            _put_varint(out, len(header))
+            out += header
+            _put_varint(out, len(data))
+            out += data
+        write_atomic(path, bytes(out))
+        return path
+
+    @staticmethod
+    def load_raw(path):
+        """Yield (meta, encoded path) for every record, leaving decode() to the caller"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(ARCHIVE_MAGIC):
+            raise ValueError(f"{path} is not a path archive")
+        pos = len(ARCHIVE_MAGIC)
+        while pos < len(data):
+            length, pos = _get_varint(data, pos)
+            meta = json.loads(data[pos:pos + length].decode('utf-8'))
+            pos += length
+            length, pos = _get_varint(data, pos)
+            yield meta, data[pos:pos + length]
+            pos += length
+
+    @staticmethod
+    def load(path):
+        """Yield (meta, points) for every record in an archive file"""
+        for meta, data in PathArchive.load_raw(path):
+            yield meta, decode(data)
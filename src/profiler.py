@@ -0,0 +1,156 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class _Section:
+    """Reusable timing scope for one named section (see FrameProfiler.section)"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class _NullSection:
+    """Shared no-op scope returned while profiling is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """Lightweight per-section frame timing.
+
+    Wrap hot-path phases in `with profiler.section('name'):`. While disabled
+    this costs one attribute check and returns a shared no-op object; while
+    enabled each section keeps a rolling window of durations for the overlay
+    and appends a complete event for Chrome trace export (chrome://tracing,
+    Perfetto). Sections are reused per name, so the same name must not be
+    nested inside itself.
+    """
+
+    def __init__(self, window=240, trace_capacity=50000):
+        self.enabled = False
+        self.overlay_visible = False
+        self.window = window
+        self.samples = {}  # name -> deque of durations in ms
+        self.trace_events = deque(maxlen=trace_capacity)  # (name, start_ns, end_ns, thread_id)
+        self._sections = {}
+        self._origin_ns = time.perf_counter_ns()
+
+    def section(self, name):
+        """Return a context manager timing `name` (no-op while disabled)"""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def record(self, name, start_ns, end_ns):
+        """Record one timed span; usable directly for spans that aren't a single block"""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append((end_ns - start_ns) / 1e6)
+        self.trace_events.append((name, start_ns, end_ns, threading.get_ident()))
+
+    def toggle_overlay(self):
+        """Show/hide the overlay; profiling runs whenever the overlay is visible"""
+        self.overlay_visible = not self.overlay_visible
+        self.enabled = self.overlay_visible
+
+    def reset(self):
+        """Forget all collected samples and trace events"""
+        self.samples.clear()
+        self.trace_events.clear()
+
+    def summary(self):
+        """Return [(name, avg_ms, p95_ms, max_ms, count)] sorted by average cost"""
+        rows = []
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            count = len(ordered)
+            p95 = ordered[min(count - 1, int(count * 0.95))]
+            rows.append((name, sum(ordered) / count, p95, ordered[-1], count))
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows
+
+    def export_chrome_trace(self, path):
+        """Write collected spans as Chrome trace-event JSON and return the path"""
+        pid = os.getpid()
+        events = []
+        for name, start_ns, end_ns, tid in list(self.trace_events):
+            events.append({
+                'name': name,
+                'cat': name.split('.', 1)[0],
+                'ph': 'X',
+                'ts': (start_ns - self._origin_ns) / 1000.0,
+                'dur': (end_ns - start_ns) / 1000.0,
+                'pid': pid,
+                'tid': tid
+            })
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return path
+
+
+class StartupTimer:
+    """Wall-clock breakdown of application start-up, printed by --profile-startup"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.phases = []  # (label, start offset s, duration s)
+
+    @contextmanager
+    def phase(self, label):
+        """Time a start-up phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.phases.append((label, start - self.origin, end - start))
+
+    def elapsed(self):
+        """Seconds since the timer was created"""
+        return time.perf_counter() - self.origin
+
+    def report_lines(self, budget_ms=None):
+        """Format the breakdown, ending with the total against an optional budget"""
+        lines = ["Startup profile:"]
+        for label, offset, duration in self.phases:
+            lines.append(f"  {label:<32}{duration * 1000:>9.1f} ms  (at {offset * 1000:.1f} ms)")
+        total_ms = self.elapsed() * 1000
+        total = f"  {'total to first idle':<32}{total_ms:>9.1f} ms"
+        if budget_ms is not None:
+            verdict = "OK" if total_ms <= budget_ms else "OVER BUDGET"
+            total += f"  [budget {budget_ms:.0f} ms: {verdict}]"
+        lines.append(total)
+        return lines
+
+
+# Process-wide start-up timer; main.py creates phases around imports and setup
+startup_timer = StartupTimer()
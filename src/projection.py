@@ -0,0 +1,99 @@
+import math
+
+LINEAR = 'linear'
+RECTILINEAR = 'rectilinear'
+MODES = (LINEAR, RECTILINEAR)
+
+
+class Projection:
+    """World (yaw, pitch) to screen transform applied to whole batches of points.
+
+    LINEAR maps degrees straight to pixels (pixels_per_degree = width / fov),
+    which is what the game has always used; it is cheap but stretches the
+    edges of a wide FOV. RECTILINEAR is a pinhole camera like a game engine's:
+    points are rotated into camera space and divided by depth, so straight
+    lines stay straight and anything behind the camera is culled.
+
+    project() returns float arrays of screen x/y plus a boolean visibility
+    mask, so every draw layer can transform all of its points in one call.
+    """
+
+    def __init__(self, screen_width, fov, mode=LINEAR):
+        if mode not in MODES:
+            raise ValueError(f"Unknown projection '{mode}', expected one of {', '.join(MODES)}")
+        self.mode = mode
+        self.fov = fov
+        self.pixels_per_degree = screen_width / fov
+        # Focal length in pixels: the FOV edges land on the screen edges
+        self.focal = (screen_width / 2) / math.tan(math.radians(fov) / 2)
+
+    def project(self, yaws, pitches, cam_yaw, cam_pitch, center_x, center_y,
+                width, height, margin=0.0):
+        """Project points to screen space.
+
+        margin (scalar or per-point array, in pixels) widens the visible area
+        so large shapes are kept while partly on screen. Returns (xs, ys,
+        visible); points behind the camera have NaN coordinates.
+        """
+        import numpy as np
+
+        yaws = np.asarray(yaws, dtype=np.float64)
+        pitches = np.asarray(pitches, dtype=np.float64)
+        yaw_diff = (yaws - cam_yaw + 180.0) % 360.0 - 180.0
+
+        if self.mode == LINEAR:
+            xs = center_x + yaw_diff * self.pixels_per_degree
+            ys = center_y - (pitches - cam_pitch) * self.pixels_per_degree
+            in_front = True
+        else:
+            # Direction vectors relative to the camera's yaw, then pitched down
+            yaw_rad = np.radians(yaw_diff)
+            pitch_rad = np.radians(pitches)
+            cos_pitch = np.cos(pitch_rad)
+            x = cos_pitch * np.sin(yaw_rad)
+            y = np.sin(pitch_rad)
+            z = cos_pitch * np.cos(yaw_rad)
+            cam = math.radians(cam_pitch)
+            cos_cam, sin_cam = math.cos(cam), math.sin(cam)
+            y_cam = y * cos_cam - z * sin_cam
+            z_cam = y * sin_cam + z * cos_cam
+
+            in_front = z_cam > 1e-6
+            with np.errstate(divide='ignore', invalid='ignore'):
+                inv_depth = np.where(in_front, 1.0 / z_cam, np.nan)
+            xs = center_x + self.focal * x * inv_depth
+            ys = center_y - self.focal * y_cam * inv_depth
+
+        with np.errstate(invalid='ignore'):
+            visible = ((xs >= -margin) & (xs <= width + margin) &
+                       (ys >= -margin) & (ys <= height + margin) & in_front)
+        return xs, ys, visible
+
+    def screen_radii(self, yaws, pitches, angular_radii, cam_yaw, cam_pitch):
+        """Pixel half-size of shapes spanning angular_radii degrees around each point.
+
+        LINEAR gives angular_radii * pixels_per_degree everywhere; RECTILINEAR
+        measures the projected span, so shapes grow towards the screen edges
+        exactly as much as their (angular) hitboxes do.
+        """
+        import numpy as np
+
+        angular_radii = np.asarray(angular_radii, dtype=np.float64)
+        if self.mode == LINEAR:
+            return angular_radii * self.pixels_per_degree
+        yaws = np.asarray(yaws, dtype=np.float64)
+        left, _, _ = self.project(yaws - angular_radii, pitches, cam_yaw, cam_pitch, 0.0, 0.0, 0.0, 0.0)
+        right, _, _ = self.project(yaws + angular_radii, pitches, cam_yaw, cam_pitch, 0.0, 0.0, 0.0, 0.0)
+        return np.abs(right - left) / 2
+
+    def project_points(self, points, cam_yaw, cam_pitch, center_x, center_y,
+                       width, height, margin=0.0):
+        """project() for a sequence of (yaw, pitch) tuples"""
+        import numpy as np
+
+        if not points:
+            empty = np.empty(0)
+            return empty, empty, np.empty(0, dtype=bool)
+        yaws, pitches = zip(*points)
+        return self.project(yaws, pitches, cam_yaw, cam_pitch, center_x, center_y,
+                            width, height, margin)
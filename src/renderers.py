@@ -0,0 +1,325 @@
+import importlib.util
+import os
+import tkinter as tk
+from collections import OrderedDict
+
+TK = 'tk'
+PYGAME = 'pygame'
+BACKENDS = (TK, PYGAME)
+
+# Tk text anchors -> pygame.Rect attribute that the anchor point sets
+_ANCHORS = {
+    'nw': 'topleft', 'n': 'midtop', 'ne': 'topright',
+    'w': 'midleft', 'center': 'center', 'e': 'midright',
+    'sw': 'bottomleft', 's': 'midbottom', 'se': 'bottomright'
+}
+
+
+def _flatten(coords):
+    """Accept both create_line(x1, y1, x2, y2) and create_line([x1, y1, x2, y2])"""
+    if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+        return list(coords[0])
+    return list(coords)
+
+
+def _tag_set(tags):
+    if not tags:
+        return ()
+    if isinstance(tags, str):
+        return (tags,)
+    return tuple(tags)
+
+
+class TkRenderer:
+    """The original backend: the game view is the Tk canvas itself.
+
+    Every frame recreates the canvas items (the trail's persistent items
+    excepted) and Tk repaints on its own once the frame callback returns.
+    """
+    name = TK
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.host = canvas  # Widget packed while a session runs
+        self.view = canvas  # Canvas-API drawing surface for the frame
+
+    def attach(self, width, height):
+        pass
+
+    def begin_frame(self):
+        self.canvas.delete("!persistent")
+
+    def present(self):
+        pass  # Tk redraws at idle
+
+    def poll_input(self):
+        return ()  # Clicks arrive through the canvas bindings
+
+    def clear(self):
+        self.canvas.delete("all")
+
+    def close(self):
+        pass
+
+
+class _Item:
+    __slots__ = ('kind', 'coords', 'options', 'tags')
+
+    def __init__(self, kind, coords, options):
+        self.kind = kind
+        self.coords = coords
+        self.tags = _tag_set(options.pop('tags', None))
+        self.options = options
+
+
+class PygameView:
+    """Display list with the subset of the Tk canvas API the game view uses.
+
+    create_line/rectangle/oval/text, delete (including "all" and "!tag"),
+    coords, itemconfigure and tag_raise behave like their canvas
+    counterparts, so the drawing code is shared between backends;
+    PygameRenderer.present() turns the list into pixels.
+    """
+
+    def __init__(self):
+        self.items = {}  # id -> _Item, in stacking order (dicts keep insertion order)
+        self.next_id = 1
+
+    def _add(self, kind, coords, options):
+        item_id = self.next_id
+        self.next_id += 1
+        self.items[item_id] = _Item(kind, coords, options)
+        return item_id
+
+    def create_line(self, *coords, **options):
+        return self._add('line', _flatten(coords), options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._add('rectangle', _flatten(coords), options)
+
+    def create_oval(self, *coords, **options):
+        return self._add('oval', _flatten(coords), options)
+
+    def create_text(self, *coords, **options):
+        return self._add('text', _flatten(coords), options)
+
+    def _matching(self, tag):
+        if isinstance(tag, int):
+            return [tag] if tag in self.items else []
+        return [item_id for item_id, item in self.items.items() if tag in item.tags]
+
+    def delete(self, tag):
+        if tag == "all":
+            self.items.clear()
+        elif isinstance(tag, str) and tag.startswith("!"):
+            keep = tag[1:]
+            self.items = {item_id: item for item_id, item in self.items.items() if keep in item.tags}
+        else:
+            for item_id in self._matching(tag):
+                del self.items[item_id]
+
+    def coords(self, item_id, *coords):
+        self.items[item_id].coords = _flatten(coords)
+
+    def itemconfigure(self, item_id, **options):
+        self.items[item_id].options.update(options)
+
+    def tag_raise(self, tag):
+        for item_id in self._matching(tag):
+            self.items[item_id] = self.items.pop(item_id)
+
+
+class PygameRenderer:
+    """Software-rendered backend: SDL draws into a Tk frame.
+
+    Filled/outlined rectangles and ovals (targets, markers, square/circle
+    crosshairs) are rendered once per (shape, size, colours, width) into an
+    LRU of alpha sprites and blitted; text is cached the same way per
+    (text, font, colour). Only the rectangles touched this frame or last
+    frame are erased and pushed to the display, unless they cover most of
+    the screen anyway. SDL owns the embedded window's mouse input, so
+    clicks are read with poll_input() from the frame loop instead of Tk
+    bindings. With no master (benchmarks) SDL opens its own window.
+    """
+    name = PYGAME
+
+    def __init__(self, master=None, background="#2a2a2a", max_sprites=512, max_texts=256):
+        self.host = None
+        if master is not None:
+            self.host = tk.Frame(master, bg=background, cursor="none", highlightthickness=0)
+        self.view = PygameView()
+        self.background = background
+        self.max_sprites = max_sprites
+        self.max_texts = max_texts
+        self.screen = None
+        self.colors = {}
+        self.fonts = {}
+        self.sprites = OrderedDict()
+        self.texts = OrderedDict()
+        self.dirty = []  # Screen rects drawn last frame
+        self.sprite_misses = 0
+
+    def attach(self, width, height):
+        """Open (or re-show) the SDL surface; the host frame must already be packed"""
+        if self.screen is not None:
+            self.dirty = [self.screen.get_rect()]
+            return
+        import pygame
+        if self.host is not None:
+            self.host.update_idletasks()
+            os.environ['SDL_WINDOWID'] = str(self.host.winfo_id())
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode((width, height))
+        pygame.mouse.set_visible(False)
+        self.screen.fill(self._color(self.background))
+        pygame.display.flip()
+
+    def _color(self, name):
+        color = self.colors.get(name)
+        if color is None and name:
+            import pygame
+            color = self.colors[name] = pygame.Color(name)
+        return color
+
+    def _font(self, spec):
+        font = self.fonts.get(spec)
+        if font is None:
+            import pygame
+            family, size = spec[0], spec[1]
+            style = spec[2] if len(spec) > 2 else ""
+            # Tk sizes are points; SDL wants pixels (96 dpi)
+            font = pygame.font.SysFont(family, round(abs(size) * 4 / 3), bold='bold' in style,
+                                       italic='italic' in style)
+            self.fonts[spec] = font
+        return font
+
+    def _shape_sprite(self, kind, width, height, fill, outline, line_width):
+        key = (kind, width, height, fill, outline, line_width)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            return sprite
+        import pygame
+        self.sprite_misses += 1
+        sprite = pygame.Surface((width + 1, height + 1), pygame.SRCALPHA)
+        rect = pygame.Rect(0, 0, width + 1, height + 1)
+        draw = pygame.draw.rect if kind == 'rectangle' else pygame.draw.ellipse
+        fill_color = self._color(fill)
+        if fill_color is not None:
+            draw(sprite, fill_color, rect)
+        outline_color = self._color(outline)
+        if outline_color is not None and line_width > 0:
+            draw(sprite, outline_color, rect, line_width)
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def _text_sprite(self, text, font, fill):
+        key = (text, font, fill)
+        sprite = self.texts.get(key)
+        if sprite is not None:
+            self.texts.move_to_end(key)
+            return sprite
+        import pygame
+        renderer = self._font(font)
+        color = self._color(fill)
+        lines = [renderer.render(line, True, color) for line in text.split("\n")]
+        line_height = renderer.get_linesize()
+        sprite = pygame.Surface((max(line.get_width() for line in lines), line_height * len(lines)),
+                                pygame.SRCALPHA)
+        for row, line in enumerate(lines):
+            sprite.blit(line, (0, row * line_height))
+        self.texts[key] = sprite
+        if len(self.texts) > self.max_texts:
+            self.texts.popitem(last=False)
+        return sprite
+
+    def _draw(self, item):
+        """Draw one display-list item; returns the screen rect it touched or None"""
+        import pygame
+        options = item.options
+        if options.get('state') == 'hidden':
+            return None
+        coords = item.coords
+        kind = item.kind
+        if kind == 'line':
+            color = self._color(options.get('fill', 'black'))
+            if color is None or len(coords) < 4:
+                return None
+            width = max(1, round(options.get('width', 1)))
+            points = list(zip(coords[0::2], coords[1::2]))
+            if len(points) == 2:
+                return pygame.draw.line(self.screen, color, points[0], points[1], width)
+            return pygame.draw.lines(self.screen, color, False, points, width)
+        if kind == 'text':
+            sprite = self._text_sprite(str(options.get('text', "")), options.get('font', ("Arial", 10)),
+                                       options.get('fill', 'black'))
+            rect = sprite.get_rect()
+            setattr(rect, _ANCHORS[options.get('anchor', 'center')], (round(coords[0]), round(coords[1])))
+            return self.screen.blit(sprite, rect)
+        x1, y1, x2, y2 = (round(value) for value in coords[:4])
+        sprite = self._shape_sprite(kind, x2 - x1, y2 - y1, options.get('fill', ''),
+                                    options.get('outline', 'black'), round(options.get('width', 1)))
+        return self.screen.blit(sprite, (x1, y1))
+
+    def begin_frame(self):
+        self.view.delete("!persistent")
+
+    def present(self):
+        """Rasterise the display list and update only the changed parts of the display"""
+        screen = self.screen
+        if screen is None:
+            return
+        import pygame
+        background = self._color(self.background)
+        for rect in self.dirty:
+            screen.fill(background, rect)
+        drawn = []
+        for item in self.view.items.values():
+            rect = self._draw(item)
+            if rect is not None and rect.width and rect.height:
+                drawn.append(rect)
+        updated = self.dirty + drawn
+        self.dirty = drawn
+        screen_rect = screen.get_rect()
+        if sum(rect.width * rect.height for rect in updated) > screen_rect.width * screen_rect.height // 2:
+            pygame.display.flip()
+        else:
+            pygame.display.update(updated)
+
+    def poll_input(self):
+        """(button, pressed) for every mouse button event since the last call"""
+        if self.screen is None:
+            return ()
+        import pygame
+        buttons = []
+        for event in pygame.event.get():
+            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                buttons.append((event.button, event.type == pygame.MOUSEBUTTONDOWN))
+        return buttons
+
+    def clear(self):
+        self.view.delete("all")
+        if self.screen is not None:
+            import pygame
+            self.screen.fill(self._color(self.background))
+            pygame.display.flip()
+            self.dirty = []
+
+    def close(self):
+        if self.screen is not None:
+            import pygame
+            pygame.display.quit()
+            self.screen = None
+
+
+def create_renderer(name, canvas):
+    """Renderer for `name`, falling back to the Tk canvas if pygame is unavailable"""
+    if name == PYGAME:
+        if importlib.util.find_spec('pygame') is None:
+            print("pygame not found - using the Tk renderer. Install with: pip install pygame")
+        else:
+            return PygameRenderer(canvas.master, canvas['bg'])
+    return TkRenderer(canvas)
@@ -0,0 +1,402 @@
+import argparse
+import glob
+import html
+import json
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from src import shot_analysis
+from src.path_codec import PathArchive, decode
+from src.storage import data_dir, write_atomic
+
+CHUNK_SIZE = 128  # Archive records per pool task
+TREND_WINDOW = 20  # Shots in each point of the rolling over/undershoot trends
+DISTANCE_BINS = (0, 5, 10, 20, 40, 80, 180)  # Degrees from the path start to the target
+DIRECTIONS = ("→", "↗", "↑", "↖", "←", "↙", "↓", "↘")  # 45° sectors, counter-clockwise from right
+
+# Palette shared with the game HUD
+BACKGROUND = "#1a1a1a"
+PANEL = "#2a2a2a"
+TEXT = "#dddddd"
+MUTED = "#888888"
+X_COLOR = "#39ff14"
+Y_COLOR = "#66ccff"
+ACCENT = "#ffcc00"
+
+
+def shot_job(meta, points):
+    """analyze_shot() job for an archived record.
+
+    Archives written before the start/shot fields were recorded fall back to
+    the path's first and last points.
+    """
+    start_yaw, start_pitch = points[0]
+    end_yaw, end_pitch = points[-1]
+    shot_yaw = meta.get('shot_yaw', end_yaw)
+    shot_pitch = meta.get('shot_pitch', end_pitch)
+    return {
+        'path': points,
+        'start_yaw': meta.get('start_yaw', start_yaw),
+        'start_pitch': meta.get('start_pitch', start_pitch),
+        'target_yaw': meta['target_yaw'],
+        'target_pitch': meta['target_pitch'],
+        'target_angular_size': meta['radius'],
+        'shot_yaw': shot_yaw,
+        'shot_pitch': shot_pitch,
+        'yaw_diff': meta.get('yaw_diff', shot_analysis.wrap_degrees(shot_yaw - meta['target_yaw'])),
+        'pitch_diff': meta.get('pitch_diff', shot_pitch - meta['target_pitch']),
+        'thinned': meta.get('thinned', False)
+    }
+
+
+def analyze_chunk(records):
+    """Decode and analyse a list of (meta, encoded path) records; runs in pool workers"""
+    rows = []
+    for meta, data in records:
+        points = decode(data)
+        if not points:
+            continue
+        job = shot_job(meta, points)
+        result = shot_analysis.analyze_shot(job)
+        approach = result['approach']
+        dyaw = shot_analysis.wrap_degrees(job['target_yaw'] - job['start_yaw'])
+        dpitch = job['target_pitch'] - job['start_pitch']
+        rows.append({
+            'time': meta['time'],
+            'hit': meta['hit'],
+            'x_sens': meta.get('x_sens'),
+            'y_sens': meta.get('y_sens'),
+            'distance': math.hypot(dyaw, dpitch),
+            'direction': math.degrees(math.atan2(dpitch, dyaw)) % 360,
+            'efficiency': result['efficiency'],
+            'x_efficiency': result['x_efficiency'],
+            'y_efficiency': result['y_efficiency'],
+            'x_overshoot': bool(approach and approach['x_max_overshoot'] > 0),
+            'y_overshoot': bool(approach and approach['y_max_overshoot'] > 0),
+            'x_undershoot': result['x_undershoot'],
+            'y_undershoot': result['y_undershoot'],
+            'x_precision': result['x_precision'],
+            'y_precision': result['y_precision']
+        })
+    return rows
+
+
+def analyze_records(records, workers=None, chunk_size=CHUNK_SIZE):
+    """Analyse archive records across a process pool, keeping their order.
+
+    Records stay encoded until they reach a worker, so only the compact
+    varint paths are pickled. Input that fits in one chunk is analysed
+    in-process, since starting a pool would cost more than it saves.
+    """
+    chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+    if workers is None:
+        workers = max(1, min(len(chunks), (os.cpu_count() or 2) - 1))
+    if len(chunks) < 2 or workers < 2:
+        return [row for chunk in chunks for row in analyze_chunk(chunk)]
+    # spawn: never fork a process that is running Tk and input-listener threads
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            return [row for rows in pool.map(analyze_chunk, chunks) for row in rows]
+    except BrokenProcessPool as e:
+        print(f"Report worker pool failed ({e}); analysing in-process")
+        return [row for chunk in chunks for row in analyze_chunk(chunk)]
+
+
+def load_records(archive_paths):
+    records = []
+    for path in archive_paths:
+        records.extend(PathArchive.load_raw(path))
+    records.sort(key=lambda record: record[0]['time'])
+    return records
+
+
+def load_reaction_times(shots_path, start, end):
+    """Reaction times of hits logged in shots.jsonl (--log-shots) between start and end"""
+    if not shots_path or not os.path.exists(shots_path):
+        return []
+    times = []
+    try:
+        with open(shots_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue  # A line cut short by a crash
+                if (event.get('kind') == 'hit' and event.get('reaction_time') is not None
+                        and start <= event.get('time', 0) <= end):
+                    times.append(event['reaction_time'])
+    except OSError as e:
+        print(f"Could not read shot log {shots_path}: {e}")
+    return times
+
+
+def latest_archive():
+    """Newest saved path archive in the data directory, or None"""
+    paths = glob.glob(os.path.join(data_dir(), 'paths', 'paths_*.bin'))
+    return max(paths, key=os.path.getmtime) if paths else None
+
+
+# --- Aggregation ---
+def _mean(values):
+    values = [value for value in values if value is not None]
+    return sum(values) / len(values) if values else None
+
+
+def _rate(rows, key):
+    return sum(1 for row in rows if row[key]) / len(rows) * 100 if rows else None
+
+
+def rolling_rates(rows, key, window=TREND_WINDOW):
+    """(shot number, % of the last `window` shots with row[key] set)"""
+    points = []
+    count = 0
+    for i, row in enumerate(rows):
+        count += 1 if row[key] else 0
+        if i >= window:
+            count -= 1 if rows[i - window][key] else 0
+        if i >= window - 1:
+            points.append((i + 1, count / window * 100))
+    return points
+
+
+def distance_groups(rows):
+    labels = []
+    groups = []
+    for low, high in zip(DISTANCE_BINS, DISTANCE_BINS[1:]):
+        labels.append(f"{low}-{high}°")
+        groups.append([row for row in rows if low <= row['distance'] < high])
+    return labels, groups
+
+
+def direction_groups(rows):
+    groups = [[] for _ in DIRECTIONS]
+    for row in rows:
+        groups[int(round(row['direction'] / 45)) % len(DIRECTIONS)].append(row)
+    return list(DIRECTIONS), groups
+
+
+def histogram(values, bins=20):
+    """(bin edges, counts) over the 1st..99th percentile range"""
+    ordered = sorted(values)
+    low = ordered[int(len(ordered) * 0.01)]
+    high = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    if high <= low:
+        high = low + 0.001
+    width = (high - low) / bins
+    counts = [0] * bins
+    for value in ordered:
+        counts[max(0, min(bins - 1, int((value - low) / width)))] += 1
+    return [low + width * i for i in range(bins + 1)], counts
+
+
+# --- SVG charts ---
+def _fmt(value, digits=1):
+    return "–" if value is None else f"{value:.{digits}f}"
+
+
+def svg_lines(series, y_label, width=760, height=240, y_range=None):
+    """Line chart of [(name, colour, [(x, y), ...]), ...]"""
+    points = [point for _, _, data in series for point in data]
+    if not points:
+        return f'<p class="empty">No data for {html.escape(y_label)}</p>'
+    left, right, top, bottom = 50, 10, 10, 30
+    x_min = min(x for x, _ in points)
+    x_max = max(x for x, _ in points)
+    y_min, y_max = y_range or (min(y for _, y in points), max(y for _, y in points))
+    if x_max == x_min:
+        x_max = x_min + 1
+    if y_max == y_min:
+        y_max = y_min + 1
+
+    def sx(x):
+        return left + (x - x_min) / (x_max - x_min) * (width - left - right)
+
+    def sy(y):
+        return height - bottom - (y - y_min) / (y_max - y_min) * (height - top - bottom)
+
+    parts = [f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">']
+    for i in range(5):
+        y = y_min + (y_max - y_min) * i / 4
+        parts.append(f'<line x1="{left}" x2="{width - right}" y1="{sy(y):.1f}" y2="{sy(y):.1f}" '
+                     f'stroke="#444" stroke-width="1"/>')
+        parts.append(f'<text x="{left - 6}" y="{sy(y) + 4:.1f}" text-anchor="end">{y:.3g}</text>')
+    parts.append(f'<text x="{left}" y="{height - 8}">{x_min:.3g}</text>')
+    parts.append(f'<text x="{width - right}" y="{height - 8}" text-anchor="end">{x_max:.3g}</text>')
+    parts.append(f'<text x="{width / 2:.0f}" y="{height - 8}" text-anchor="middle">{html.escape(y_label)}</text>')
+    for name, color, data in series:
+        if not data:
+            continue
+        coords = " ".join(f"{sx(x):.1f},{sy(y):.1f}" for x, y in data)
+        parts.append(f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{coords}">'
+                     f'<title>{html.escape(name)}</title></polyline>')
+    parts.append('</svg>')
+    legend = " ".join(f'<span style="color:{color}">■ {html.escape(name)}</span>' for name, color, _ in series)
+    return "".join(parts) + f'<div class="legend">{legend}</div>'
+
+
+def svg_bars(labels, series, y_label, width=760, height=240, y_max=None):
+    """Grouped bar chart; series is [(name, colour, [value or None per label]), ...]"""
+    values = [value for _, _, data in series for value in data if value is not None]
+    if not values:
+        return f'<p class="empty">No data for {html.escape(y_label)}</p>'
+    left, right, top, bottom = 50, 10, 10, 40
+    y_max = y_max or max(values) or 1
+    group_width = (width - left - right) / len(labels)
+    bar_width = group_width * 0.8 / len(series)
+    plot_height = height - top - bottom
+    parts = [f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">']
+    for i in range(5):
+        value = y_max * i / 4
+        y = height - bottom - value / y_max * plot_height
+        parts.append(f'<line x1="{left}" x2="{width - right}" y1="{y:.1f}" y2="{y:.1f}" '
+                     f'stroke="#444" stroke-width="1"/>')
+        parts.append(f'<text x="{left - 6}" y="{y + 4:.1f}" text-anchor="end">{value:.3g}</text>')
+    for g, label in enumerate(labels):
+        group_x = left + g * group_width + group_width * 0.1
+        for s, (name, color, data) in enumerate(series):
+            value = data[g]
+            if value is None:
+                continue
+            bar_height = min(value, y_max) / y_max * plot_height
+            parts.append(f'<rect x="{group_x + s * bar_width:.1f}" y="{height - bottom - bar_height:.1f}" '
+                         f'width="{bar_width - 1:.1f}" height="{bar_height:.1f}" fill="{color}">'
+                         f'<title>{html.escape(name)} {html.escape(label)}: {value:.3g}</title></rect>')
+        parts.append(f'<text x="{left + (g + 0.5) * group_width:.1f}" y="{height - bottom + 16}" '
+                     f'text-anchor="middle">{html.escape(label)}</text>')
+    parts.append(f'<text x="{width / 2:.0f}" y="{height - 6}" text-anchor="middle">{html.escape(y_label)}</text>')
+    parts.append('</svg>')
+    if len(series) > 1:
+        legend = " ".join(f'<span style="color:{color}">■ {html.escape(name)}</span>' for name, color, _ in series)
+        parts.append(f'<div class="legend">{legend}</div>')
+    return "".join(parts)
+
+
+# --- Report ---
+def render_html(rows, reaction_times, sources, elapsed):
+    """The full report as one self-contained HTML page"""
+    hits = sum(1 for row in rows if row['hit'])
+    summary = [
+        ("Shots analysed", str(len(rows))),
+        ("Accuracy", f"{_fmt(hits / len(rows) * 100 if rows else None)}%"),
+        ("Path efficiency", f"{_fmt(_mean(row['efficiency'] for row in rows))}%"),
+        ("X / Y efficiency", f"{_fmt(_mean(row['x_efficiency'] for row in rows))}% / "
+                             f"{_fmt(_mean(row['y_efficiency'] for row in rows))}%"),
+        ("X overshoot / undershoot", f"{_fmt(_rate(rows, 'x_overshoot'))}% / {_fmt(_rate(rows, 'x_undershoot'))}%"),
+        ("Y overshoot / undershoot", f"{_fmt(_rate(rows, 'y_overshoot'))}% / {_fmt(_rate(rows, 'y_undershoot'))}%"),
+        ("Reaction time (median)", f"{_fmt(sorted(reaction_times)[len(reaction_times) // 2], 3)} s"
+                                   if reaction_times else "– (record with --log-shots)")
+    ]
+    sections = []
+
+    trends = [
+        ("X overshoot", X_COLOR, rolling_rates(rows, 'x_overshoot')),
+        ("Y overshoot", Y_COLOR, rolling_rates(rows, 'y_overshoot')),
+        ("X undershoot", "#1e8c0a", rolling_rates(rows, 'x_undershoot')),
+        ("Y undershoot", "#336699", rolling_rates(rows, 'y_undershoot'))
+    ]
+    sections.append((f"Overshoot / undershoot trend (rolling {TREND_WINDOW} shots, %)",
+                     svg_lines(trends, "shot", y_range=(0, 100))))
+
+    if reaction_times:
+        edges, counts = histogram(reaction_times)
+        labels = [f"{edge * 1000:.0f}" if i % 4 == 0 else "" for i, edge in enumerate(edges[:-1])]
+        chart = svg_bars(labels, [("Hits", ACCENT, counts)], "reaction time (ms, bin start)")
+    else:
+        chart = '<p class="empty">No reaction times: record sessions with --log-shots to include them</p>'
+    sections.append(("Reaction time distribution", chart))
+
+    for title, (labels, groups) in (("Efficiency by target distance", distance_groups(rows)),
+                                    ("Efficiency by direction of travel", direction_groups(rows))):
+        series = [
+            ("Path", ACCENT, [_mean(row['efficiency'] for row in group) for group in groups]),
+            ("X", X_COLOR, [_mean(row['x_efficiency'] for row in group) for group in groups]),
+            ("Y", Y_COLOR, [_mean(row['y_efficiency'] for row in group) for group in groups])
+        ]
+        counts = " · ".join(f"{html.escape(label)} n={len(group)}" for label, group in zip(labels, groups))
+        sections.append((title, svg_bars(labels, series, "mean efficiency (%)", y_max=100)
+                         + f'<div class="legend">{counts}</div>'))
+
+    if rows and rows[0]['x_sens'] is not None:
+        start = rows[0]['time']
+        history = [
+            ("X sens", X_COLOR, [((row['time'] - start) / 60, row['x_sens']) for row in rows]),
+            ("Y sens", Y_COLOR, [((row['time'] - start) / 60, row['y_sens']) for row in rows])
+        ]
+        chart = svg_lines(history, "minutes into the session")
+    else:
+        chart = '<p class="empty">This archive predates sensitivity recording</p>'
+    sections.append(("Sensitivity history", chart))
+
+    summary_rows = "".join(f"<tr><th>{html.escape(name)}</th><td>{html.escape(value)}</td></tr>"
+                           for name, value in summary)
+    body = "".join(f"<section><h2>{html.escape(title)}</h2>{content}</section>" for title, content in sections)
+    source_list = ", ".join(html.escape(os.path.basename(path)) for path in sources)
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Aim Warmup report</title>
+<style>
+body {{ background: {BACKGROUND}; color: {TEXT}; font-family: Arial, sans-serif; margin: 24px; }}
+section, table {{ background: {PANEL}; padding: 12px 16px; margin-bottom: 16px; border-radius: 4px; }}
+h1 {{ color: {X_COLOR}; }} h2 {{ font-size: 16px; margin: 0 0 8px; }}
+th {{ text-align: left; color: {MUTED}; padding-right: 24px; font-weight: normal; }}
+svg text {{ fill: {MUTED}; font-size: 11px; }}
+.legend, .empty, footer {{ color: {MUTED}; font-size: 12px; }}
+</style></head><body>
+<h1>Aim Warmup session report</h1>
+<table>{summary_rows}</table>
+{body}
+<footer>From {source_list}. Generated {time.strftime("%Y-%m-%d %H:%M")} in {elapsed:.2f} s.
+Efficiencies are computed from the archived (simplified) paths, which keep every
+turning point but can read slightly higher than the live figures.</footer>
+</body></html>
+"""
+
+
+def default_output(archive_paths):
+    stem = os.path.splitext(os.path.basename(archive_paths[-1]))[0].replace('paths_', 'report_')
+    return os.path.join(data_dir(), 'reports', f"{stem}.html")
+
+
+def build_report(archive_paths, shots_path=None, out_path=None, workers=None):
+    """Analyse path archives (plus the shot log, if any) and write an HTML report; returns its path"""
+    started = time.perf_counter()
+    records = load_records(archive_paths)
+    if not records:
+        raise ValueError("no archived shots to report on")
+    rows = analyze_records(records, workers)
+    reaction_times = load_reaction_times(shots_path, rows[0]['time'] - 5, rows[-1]['time'] + 5)
+    out_path = out_path or default_output(archive_paths)
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    page = render_html(rows, reaction_times, archive_paths, time.perf_counter() - started)
+    write_atomic(out_path, page.encode('utf-8'))
+    return out_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build an HTML report from saved approach paths")
+    parser.add_argument("archives", nargs="*",
+                        help="path archives (.bin from --archive-paths; default: the newest one)")
+    parser.add_argument("--shots", default=None,
+                        help="shot log for reaction times (default: shots.jsonl in the data directory)")
+    parser.add_argument("--out", default=None, help="output .html (default: data directory/reports)")
+    parser.add_argument("--workers", type=int, default=None, help="analysis processes (default: CPUs - 1)")
+    args = parser.parse_args()
+
+    archives = args.archives
+    if not archives:
+        latest = latest_archive()
+        if latest is None:
+            raise SystemExit("No path archives found; play with --archive-paths first")
+        archives = [latest]
+    shots_path = args.shots or os.path.join(data_dir(), 'shots.jsonl')
+    try:
+        print(f"Session report written to {build_report(archives, shots_path, args.out, args.workers)}")
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"Could not build session report: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import json
+import os
+import re
+
+from src.storage import data_dir, write_atomic
+
+MODEL_VERSION = 1
+AXES = ('x', 'y')
+
+
+def profile_path(name):
+    """Where a profile's tuner model lives (data_dir/profiles/<name>.json)"""
+    safe = re.sub(r'[^A-Za-z0-9_.-]', '_', name) or 'default'
+    return os.path.join(data_dir(), 'profiles', f"{safe}.json")
+
+
+class SensBandit:
+    """Persistent per-axis model of which sensitivity aims best, across sessions.
+
+    Sensitivities are discretised into bins of `step` between 1 and 20.
+    Every auto-tuner sample adds its per-axis precision (0..1) to the bin of
+    the sens it was taken at. A bin's reward posterior borrows strength from
+    its neighbours through a Gaussian kernel over sens (kernel_width), so a
+    few hundred shots around one setting say something about the settings
+    next to it:
+
+        mean  (K @ totals + prior_n * global mean) / (K @ counts + prior_n)
+        sd    pooled sd / sqrt(K @ counts + prior_n)
+
+    sample() is one Thompson-sampling draw (a random bin in proportion to
+    its chance of being best), restricted to bins whose kernel support is
+    at least support_fraction of the best-covered bin's, so a warm-up never
+    jumps to an untried extreme and the explored range widens gradually.
+    best() is the posterior mean optimum. begin_session() discounts old
+    evidence by `decay`, so the model follows slow changes in the player's
+    aim.
+    """
+
+    def __init__(self, step=0.25, kernel_width=0.5, prior_n=4.0, decay=0.9, support_fraction=0.25):
+        import numpy as np
+
+        self.step = step
+        self.kernel_width = kernel_width
+        self.prior_n = prior_n
+        self.decay = decay
+        self.support_fraction = support_fraction
+        self.grid = np.round(np.arange(1.0, 20.0 + step / 2, step), 2)
+        offsets = (self.grid[:, None] - self.grid[None, :]) / kernel_width
+        self.kernel = np.exp(-0.5 * offsets * offsets)
+        bins = len(self.grid)
+        self.counts = {axis: np.zeros(bins) for axis in AXES}
+        self.totals = {axis: np.zeros(bins) for axis in AXES}
+        self.squares = {axis: np.zeros(bins) for axis in AXES}
+        self.sessions = 0
+        self.rng = np.random.default_rng()
+
+    def bin_of(self, sens):
+        index = int(round((sens - self.grid[0]) / self.step))
+        return max(0, min(len(self.grid) - 1, index))
+
+    def observe(self, axis, sens, reward):
+        """Add one tuner sample (precision 0..1 at this sens) for an axis"""
+        index = self.bin_of(sens)
+        self.counts[axis][index] += 1
+        self.totals[axis][index] += reward
+        self.squares[axis][index] += reward * reward
+
+    def shots(self, axis):
+        return float(self.counts[axis].sum())
+
+    def posterior(self, axis):
+        """(mean, sd, support) arrays over the grid; None without any evidence"""
+        import numpy as np
+
+        counts = self.counts[axis]
+        n = counts.sum()
+        if n < 1:
+            return None
+        totals = self.totals[axis]
+        global_mean = totals.sum() / n
+        variance = max(self.squares[axis].sum() / n - global_mean * global_mean, 0.0025)
+        support = self.kernel @ counts
+        mean = (self.kernel @ totals + self.prior_n * global_mean) / (support + self.prior_n)
+        sd = np.sqrt(variance / (support + self.prior_n))
+        return mean, sd, support
+
+    def _candidates(self, support):
+        """Bins close enough to where the player has actually aimed.
+
+        Relative to the best-covered bin only, so decayed or sparse evidence
+        (support below one shot everywhere) still leaves candidates.
+        """
+        return support >= support.max() * self.support_fraction
+
+    def best(self, axis):
+        """Sens with the highest posterior mean reward, or None"""
+        import numpy as np
+
+        posterior = self.posterior(axis)
+        if posterior is None:
+            return None
+        mean, _, support = posterior
+        scores = np.where(self._candidates(support), mean, -np.inf)
+        return float(self.grid[int(np.argmax(scores))])
+
+    def sample(self, axis):
+        """Thompson draw: sens to aim at this session, or None"""
+        import numpy as np
+
+        posterior = self.posterior(axis)
+        if posterior is None:
+            return None
+        mean, sd, support = posterior
+        draws = np.where(self._candidates(support), self.rng.normal(mean, sd), -np.inf)
+        return float(self.grid[int(np.argmax(draws))])
+
+    def begin_session(self):
+        """Discount earlier sessions' evidence before a new one adds to it"""
+        if self.sessions:
+            for axis in AXES:
+                self.counts[axis] *= self.decay
+                self.totals[axis] *= self.decay
+                self.squares[axis] *= self.decay
+        self.sessions += 1
+
+    def to_dict(self):
+        return {
+            'version': MODEL_VERSION,
+            'step': self.step,
+            'sessions': self.sessions,
+            'axes': {axis: {
+                'counts': self.counts[axis].round(4).tolist(),
+                'totals': self.totals[axis].round(4).tolist(),
+                'squares': self.squares[axis].round(4).tolist()
+            } for axis in AXES}
+        }
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, json.dumps(self.to_dict(), separators=(',', ':')).encode('utf-8'))
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved model, or return an empty one if the file is missing or unusable"""
+        import numpy as np
+
+        model = cls()
+        if not os.path.exists(path):
+            return model
+        try:
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') != MODEL_VERSION or state.get('step') != model.step:
+                raise ValueError("unsupported model version")
+            bins = len(model.grid)
+            for axis in AXES:
+                arrays = [np.asarray(state['axes'][axis][key], dtype=np.float64)
+                          for key in ('counts', 'totals', 'squares')]
+                if any(array.shape != (bins,) for array in arrays):
+                    raise ValueError("model uses a different grid")
+                model.counts[axis], model.totals[axis], model.squares[axis] = arrays
+            model.sessions = int(state.get('sessions', 0))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"Could not load tuner profile {path}: {e}")
+            return cls()
+        return model
@@ -0,0 +1,197 @@
+import random
+
+from src.events import EXPIRE, HIT
+
+# What the experiment compares the candidate settings on
+ACCURACY = 'accuracy'    # hit rate; misses and expired targets count against it
+PRECISION = 'precision'  # how centred each shot landed, 0-100 (misses score 0)
+REACTION = 'reaction'    # reaction time of hits (lower is better)
+METRICS = (ACCURACY, PRECISION, REACTION)
+
+
+class Arm:
+    """One candidate setting and the running sufficient statistics of its samples"""
+
+    __slots__ = ('x_sens', 'y_sens', 'count', 'successes', 'mean', 'm2')
+
+    def __init__(self, x_sens, y_sens):
+        self.x_sens = x_sens
+        self.y_sens = y_sens
+        self.count = 0
+        self.successes = 0  # Accuracy: Beta posterior counts
+        self.mean = 0.0     # Continuous metrics: Welford running mean/variance
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        if value is True or value is False:
+            self.successes += value
+            return
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def label(self):
+        return f"X {self.x_sens:.1f} / Y {self.y_sens:.1f}"
+
+
+class SensExperiment:
+    """Sequential, interleaved A/B(/n) test of sensitivity settings.
+
+    Play cycles through the candidates in blocks of block_shots samples, in
+    a freshly shuffled order every round so warm-up and fatigue don't favour
+    one setting. The first settle_shots samples after each switch are thrown
+    away while the hand adapts. Every kept sample updates the arm's
+    posterior in O(1):
+
+        accuracy            Beta(1 + hits, 1 + misses)
+        precision/reaction  Normal(mean, var / n), variance floored by prior_sd
+
+    and, once every arm has min_shots samples, P(arm is best) is estimated
+    from `draws` joint posterior draws. The test stops as soon as one arm
+    reaches `confidence`, or gives its best guess (decided but not
+    conclusive) after max_shots kept samples.
+    """
+
+    def __init__(self, candidates, metric=ACCURACY, block_shots=8, settle_shots=2,
+                 min_shots=20, max_shots=400, confidence=0.95, draws=2000, seed=None):
+        import numpy as np
+
+        if len(candidates) < 2:
+            raise ValueError("a sensitivity experiment needs at least two candidates")
+        if metric not in METRICS:
+            raise ValueError(f"unknown experiment metric '{metric}'")
+        self.arms = [Arm(x, y) for x, y in candidates]
+        self.metric = metric
+        self.block_shots = block_shots
+        self.settle_shots = settle_shots
+        self.min_shots = min_shots
+        self.max_shots = max_shots
+        self.confidence = confidence
+        self.draws = draws
+        self.shuffler = random.Random(seed)
+        self.rng = np.random.default_rng(seed)
+        self.order = []
+        self.arm_index = 0
+        self.block_kept = 0
+        self.block_skipped = 0
+        self.total = 0
+        self.probabilities = [1.0 / len(self.arms)] * len(self.arms)
+        self.decided = False
+        self.conclusive = False
+        self.winner = None
+        self._next_block()
+
+    @property
+    def current(self):
+        return self.arms[self.arm_index]
+
+    def _next_block(self):
+        """Move to the next arm in this round's order (reshuffled each round)"""
+        if not self.order:
+            self.order = list(range(len(self.arms)))
+            self.shuffler.shuffle(self.order)
+            if len(self.arms) > 1 and self.order[0] == self.arm_index and self.total:
+                # Never play the same arm for two blocks in a row across rounds
+                self.order.append(self.order.pop(0))
+        self.arm_index = self.order.pop(0)
+        self.block_kept = 0
+        self.block_skipped = 0
+
+    def sample_value(self, kind, precision, reaction_time):
+        """Map a shot outcome onto this experiment's metric; None = not a sample"""
+        if self.metric == ACCURACY:
+            return kind == HIT
+        if self.metric == PRECISION:
+            if kind == EXPIRE:
+                return None  # No shot was taken
+            return float(precision) if kind == HIT else 0.0
+        if kind != HIT or reaction_time is None:
+            return None
+        return -float(reaction_time)  # Negated so higher is better for every metric
+
+    def record(self, kind, precision=None, reaction_time=None):
+        """Feed one shot outcome (an events.HIT/MISS/EXPIRE kind).
+
+        Returns True when the live setting has to change: the block ended
+        and another arm is up, or the test decided (apply self.winner).
+        """
+        if self.decided:
+            return False
+        value = self.sample_value(kind, precision, reaction_time)
+        if value is None:
+            return False
+        if self.block_skipped < self.settle_shots:
+            self.block_skipped += 1
+            return False
+        self.current.add(value)
+        self.total += 1
+        self.block_kept += 1
+        if self._update_decision():
+            return True
+        if self.block_kept >= self.block_shots:
+            self._next_block()
+            return True
+        return False
+
+    def _posterior_draws(self):
+        """(draws, arms) matrix of samples from each arm's posterior"""
+        import numpy as np
+
+        rng = self.rng
+        columns = []
+        for arm in self.arms:
+            if self.metric == ACCURACY:
+                columns.append(rng.beta(1 + arm.successes, 1 + arm.count - arm.successes, self.draws))
+                continue
+            prior_sd = 5.0 if self.metric == PRECISION else 0.05
+            var = arm.m2 / (arm.count - 1) if arm.count > 1 else prior_sd ** 2
+            sd = max(var, prior_sd ** 2) ** 0.5 / max(arm.count, 1) ** 0.5
+            columns.append(rng.normal(arm.mean, sd, self.draws))
+        return np.column_stack(columns)
+
+    def _update_decision(self):
+        import numpy as np
+
+        if min(arm.count for arm in self.arms) < self.min_shots:
+            return False
+        best = np.argmax(self._posterior_draws(), axis=1)
+        self.probabilities = (np.bincount(best, minlength=len(self.arms)) / self.draws).tolist()
+        leader = int(np.argmax(self.probabilities))
+        if self.probabilities[leader] >= self.confidence:
+            self.conclusive = True
+        elif self.total < self.max_shots:
+            return False
+        self.decided = True
+        self.winner = self.arms[leader]
+        return True
+
+    def estimate(self, arm):
+        """Posterior mean of an arm's metric in display units"""
+        if self.metric == ACCURACY:
+            return (1 + arm.successes) / (2 + arm.count) * 100
+        return -arm.mean if self.metric == REACTION else arm.mean
+
+    def summary_lines(self):
+        unit = {ACCURACY: "%", PRECISION: "%", REACTION: "s"}[self.metric]
+        lines = []
+        for arm, p in zip(self.arms, self.probabilities):
+            estimate = self.estimate(arm)
+            value = f"{estimate:.3f}{unit}" if self.metric == REACTION else f"{estimate:.1f}{unit}"
+            lines.append(f"  {arm.label}: {self.metric} {value}  P(best) {p * 100:.0f}%  (n={arm.count})")
+        return lines
+
+    def status_text(self):
+        """One HUD line describing the experiment's progress"""
+        import numpy as np
+
+        leader = int(np.argmax(self.probabilities))
+        if self.decided:
+            verdict = "winner" if self.conclusive else "no clear winner, best guess"
+            return (f"A/B {self.metric.upper()} [E]   {verdict}: {self.winner.label}   "
+                    f"P(best) {self.probabilities[leader] * 100:.0f}% after {self.total} shots")
+        return (f"A/B {self.metric.upper()} [E]   testing {self.current.label} "
+                f"({self.block_kept}/{self.block_shots})   "
+                f"leader {self.arms[leader].label} {self.probabilities[leader] * 100:.0f}%   "
+                f"{self.total}/{self.max_shots} shots")
@@ -0,0 +1,292 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+# What a full Channel does with an item offered by a producer that can't wait
+DROP_NEWEST = 'drop_newest'  # Keep what is queued; the new item is dropped
+DROP_OLDEST = 'drop_oldest'  # Make room by dropping the oldest queued item
+LATEST = 'latest'            # Only the newest item matters: a one-slot queue that is replaced
+
+
+def _resolve(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _wake_one(waiters):
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            return
+
+
+class Channel:
+    """Bounded queue feeding a consumer task on a ServiceLoop.
+
+    offer() is for producers that must never wait, above all the Tk thread:
+    it hands the item to the loop with one call_soon_threadsafe() and, when
+    the queue is full, applies the overflow policy and counts the drop.
+    Producers already running on the loop use `await put()`, which waits for
+    room instead, so a slow consumer pushes back on them. Everything except
+    offer() must be called on the loop.
+    """
+
+    def __init__(self, services, maxsize=1000, overflow=DROP_NEWEST):
+        self.services = services
+        self.maxsize = 1 if overflow == LATEST else maxsize
+        self.overflow = overflow
+        self.items = deque()
+        self.dropped = 0
+        self.unfinished = 0  # Items taken or queued but not yet task_done()
+        self._getters = deque()
+        self._putters = deque()
+        self._joiners = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def offer(self, item):
+        """Queue item from any thread without waiting; False if the service loop is gone"""
+        if self.services.call_soon(self._offer, item):
+            return True
+        self.dropped += 1
+        return False
+
+    def _offer(self, item):
+        if len(self.items) >= self.maxsize:
+            self.dropped += 1
+            if self.overflow == DROP_NEWEST:
+                return
+            self.items.popleft()
+            self.task_done()
+        self._push(item)
+
+    def _push(self, item):
+        self.items.append(item)
+        self.unfinished += 1
+        _wake_one(self._getters)
+
+    def _pop(self):
+        item = self.items.popleft()
+        _wake_one(self._putters)
+        return item
+
+    async def _wait(self, waiters, timeout=None):
+        loop = self.services.loop
+        waiter = loop.create_future()
+        waiters.append(waiter)
+        timer = loop.call_later(timeout, _resolve, waiter) if timeout is not None else None
+        try:
+            await waiter
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if waiter in waiters:
+                waiters.remove(waiter)
+
+    async def put(self, item):
+        """Queue item, waiting while the channel is full"""
+        while len(self.items) >= self.maxsize:
+            await self._wait(self._putters)
+        self._push(item)
+
+    async def get(self):
+        while not self.items:
+            await self._wait(self._getters)
+        return self._pop()
+
+    async def get_batch(self, max_items, interval):
+        """Wait for one item, then gather more for up to `interval` seconds"""
+        batch = [await self.get()]
+        deadline = self.services.loop.time() + interval
+        while len(batch) < max_items:
+            if not self.items:
+                remaining = deadline - self.services.loop.time()
+                if remaining <= 0:
+                    break
+                await self._wait(self._getters, remaining)
+                if not self.items:
+                    break
+            batch.append(self._pop())
+        return batch
+
+    def task_done(self, count=1):
+        self.unfinished -= count
+        if self.unfinished <= 0:
+            for joiner in self._joiners:
+                _resolve(joiner)
+            self._joiners.clear()
+
+    async def join(self):
+        """Wait until every queued item has been taken and marked done"""
+        if self.unfinished > 0:
+            joiner = self.services.loop.create_future()
+            self._joiners.append(joiner)
+            await joiner
+
+
+class ServiceLoop:
+    """asyncio event loop on a sidecar thread hosting the app's background services.
+
+    Services (shot log, checkpoints, metrics, UDP listeners, reports) run as
+    tasks on this loop and get their input through bounded Channels, so the
+    Tk thread never does more than a call_soon_threadsafe() for them.
+    Blocking work (file writes) goes to a small bounded thread pool through
+    offload(). Results meant for the UI come back through call_in_tk() and
+    are run by dispatch_tk() on the Tk thread, a bounded slice at a time.
+    There is no polling timer: the first queued callback calls `tk_waker`
+    (from the loop thread), which should get the Tk thread to call
+    dispatch_tk() once, e.g. by posting a virtual event.
+
+    start() returns immediately; asyncio is imported and the loop created on
+    the sidecar thread, so neither lands on the cold-start path. Calls made
+    before the loop is up are queued and replayed once it is.
+    """
+
+    def __init__(self, name='services', io_workers=2, tk_budget=0.002, tk_waker=None):
+        self.name = name
+        self.loop = None
+        self.thread = None
+        self.io = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix=f"{name}-io")
+        self.tk_budget = tk_budget  # Seconds of Tk callbacks per dispatch_tk()
+        self.tk_calls = deque()
+        self.tk_waker = tk_waker
+        self.tk_wake_pending = False  # A wake-up is on its way; don't post another
+        self.tasks = set()
+        self.stopped = False
+        self._early = []  # call_soon() calls made before the loop existed
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def start(self):
+        with self._lock:
+            if self.thread is None and not self.stopped:
+                self.thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self.thread.start()
+        return self
+
+    def _run(self):
+        import asyncio  # Here on the sidecar thread, off the Tk thread's start-up path
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(self.io)
+        with self._lock:
+            self.loop = loop
+            for fn, args in self._early:
+                loop.call_soon(fn, *args)
+            self._early = None
+        self._ready.set()
+        try:
+            loop.run_forever()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        finally:
+            loop.close()
+
+    def call_soon(self, fn, *args):
+        """Run fn(*args) on the loop; safe from any thread. False if the loop is gone"""
+        if self.stopped:
+            return False
+        if self.loop is None:
+            with self._lock:
+                if self.stopped:
+                    return False
+                if self.loop is None:
+                    self._early.append((fn, args))
+                    return True
+        try:
+            self.loop.call_soon_threadsafe(fn, *args)
+        except RuntimeError:
+            return False  # Loop closed during shutdown
+        return True
+
+    def spawn(self, coro, name, report_errors=True):
+        """Run a coroutine as a task on the loop; returns a concurrent Future for its result"""
+        self.start()
+        future = Future()
+        if not self.call_soon(self._start_task, coro, name, future, report_errors):
+            coro.close()
+            future.cancel()
+        return future
+
+    def _start_task(self, coro, name, future, report_errors):
+        task = self.loop.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(lambda done: self._task_done(done, name, future, report_errors))
+
+    def _task_done(self, task, name, future, report_errors):
+        self.tasks.discard(task)
+        if task.cancelled():
+            future.cancel()
+            return
+        error = task.exception()
+        if error is None:
+            future.set_result(task.result())
+            return
+        if report_errors:
+            print(f"Service {name} failed: {error!r}")
+        future.set_exception(error)
+
+    def run(self, coro, name, timeout=5.0):
+        """Run a coroutine on the loop and wait for its result (set-up and shutdown paths only)"""
+        try:
+            return self.spawn(coro, name, report_errors=False).result(timeout)
+        except FutureTimeout:
+            print(f"Service {name} did not finish within {timeout:g} s")
+            return None
+        except CancelledError:
+            return None  # The loop shut down first
+
+    def offload(self, fn, *args):
+        """Awaitable running blocking fn(*args) on the bounded I/O pool; call on the loop"""
+        return self.loop.run_in_executor(self.io, fn, *args)
+
+    def call_in_tk(self, fn, *args):
+        """Queue fn(*args) to run on the Tk thread, waking it if it isn't already due"""
+        self.tk_calls.append((fn, args))
+        self._wake_tk()
+
+    def _wake_tk(self):
+        if self.tk_wake_pending or self.tk_waker is None:
+            return
+        self.tk_wake_pending = True
+        try:
+            self.tk_waker()
+        except Exception as e:
+            self.tk_wake_pending = False
+            print(f"Could not wake the Tk thread: {e}")
+
+    def dispatch_tk(self):
+        """Run queued Tk-side callbacks, stopping after tk_budget seconds; call on the Tk thread"""
+        self.tk_wake_pending = False  # Calls queued from here on post a fresh wake-up
+        calls = self.tk_calls
+        deadline = time.perf_counter() + self.tk_budget
+        while calls and time.perf_counter() < deadline:
+            fn, args = calls.popleft()
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"Service callback {fn!r} failed: {e}")
+        if calls:
+            self._wake_tk()  # Out of budget; finish on a later pass
+
+    def stop(self, timeout=2.0):
+        """Cancel remaining tasks and stop the loop thread"""
+        with self._lock:
+            self.stopped = True
+            thread = self.thread
+        if thread is not None:
+            self._ready.wait(timeout)  # The loop may still be starting up
+        loop = self.loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(loop.stop)
+            except RuntimeError:
+                pass
+            self.thread.join(timeout)
+        self.io.shutdown(wait=False)
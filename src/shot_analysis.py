@@ -0,0 +1,304 @@
+import math
+import queue
+import threading
+
+
+def wrap_degrees(angle):
+    """Wrap an angular difference into the -180..180 range"""
+    while angle > 180:
+        angle -= 360
+    while angle < -180:
+        angle += 360
+    return angle
+
+
+def path_efficiency(path_points, start_yaw, start_pitch, target_yaw, target_pitch):
+    """Calculate how efficiently the cursor moved from the path start to the target"""
+    if len(path_points) < 2:
+        return None  # Not enough data
+
+    # Calculate direct distance from last hit to this target
+    yaw_diff = wrap_degrees(target_yaw - start_yaw)
+    direct_distance = math.sqrt(yaw_diff ** 2 + (target_pitch - start_pitch) ** 2)
+
+    if direct_distance < 0.1:  # Target was very close, skip
+        return None
+
+    # Calculate actual path length traveled
+    actual_distance = 0.0
+    for i in range(1, len(path_points)):
+        yaw1, pitch1 = path_points[i - 1]
+        yaw2, pitch2 = path_points[i]
+        seg_yaw_diff = wrap_degrees(yaw2 - yaw1)
+        actual_distance += math.sqrt(seg_yaw_diff ** 2 + (pitch2 - pitch1) ** 2)
+
+    # Efficiency = direct / actual * 100 (100% = perfect straight line)
+    if actual_distance > 0:
+        efficiency = (direct_distance / actual_distance) * 100
+        return min(efficiency, 100.0)  # Cap at 100%
+    return None
+
+
+def axis_efficiency(path_points, start_yaw, start_pitch, target_yaw, target_pitch):
+    """Calculate X and Y axis efficiency separately"""
+    if len(path_points) < 2:
+        return None, None  # Not enough data
+
+    direct_x = abs(wrap_degrees(target_yaw - start_yaw))
+    direct_y = abs(target_pitch - start_pitch)
+
+    # Skip if movement was too small on either axis
+    min_movement = 0.5  # Minimum degrees to consider
+
+    # Calculate actual X and Y distances traveled
+    actual_x = 0.0
+    actual_y = 0.0
+    for i in range(1, len(path_points)):
+        yaw1, pitch1 = path_points[i - 1]
+        yaw2, pitch2 = path_points[i]
+        actual_x += abs(wrap_degrees(yaw2 - yaw1))
+        actual_y += abs(pitch2 - pitch1)
+
+    x_efficiency = None
+    if direct_x >= min_movement and actual_x > 0:
+        x_efficiency = min((direct_x / actual_x) * 100, 100.0)
+
+    y_efficiency = None
+    if direct_y >= min_movement and actual_y > 0:
+        y_efficiency = min((direct_y / actual_y) * 100, 100.0)
+
+    return x_efficiency, y_efficiency
+
+
+def final_approach(path_points, target_yaw, target_pitch, target_angular_radius):
+    """
+    Analyze the approach to the target to detect overshoot patterns.
+
+    Returns None for paths shorter than 5 points, otherwise a dict with:
+    - x_reversals / y_reversals: direction changes per axis (overshoot indicator)
+    - x_max_overshoot / y_max_overshoot: maximum distance past the target's far edge
+    - x_overshoot_pos / y_overshoot_pos: where each max overshoot happened
+    - reversal_points: path positions where a reversal started
+    """
+    if len(path_points) < 5:
+        return None
+
+    x_reversals = 0
+    y_reversals = 0
+    x_max_overshoot = 0.0
+    y_max_overshoot = 0.0
+    x_max_overshoot_pos = None
+    y_max_overshoot_pos = None
+    reversal_points = []
+
+    last_x_dir = 0
+    last_y_dir = 0
+
+    # Calculate target direction from START of path
+    path_start_yaw, path_start_pitch = path_points[0]
+    target_x_dir = 1 if wrap_degrees(target_yaw - path_start_yaw) > 0 else -1
+    target_y_dir = 1 if target_pitch - path_start_pitch > 0 else -1
+
+    # Calculate target far edges (for overshoot detection)
+    target_x_far_edge = target_yaw + (target_x_dir * target_angular_radius)
+    target_y_far_edge = target_pitch + (target_y_dir * target_angular_radius)
+
+    # Scan path for overshoots and reversals
+    for i in range(1, len(path_points)):
+        prev_yaw, prev_pitch = path_points[i - 1]
+        curr_yaw, curr_pitch = path_points[i]
+
+        dx = wrap_degrees(curr_yaw - prev_yaw)
+        dy = curr_pitch - prev_pitch
+
+        # Check if cursor is outside target boundary on each axis
+        x_outside_target = abs(wrap_degrees(curr_yaw - target_yaw)) > target_angular_radius
+        y_outside_target = abs(curr_pitch - target_pitch) > target_angular_radius
+
+        # X overshoot: past far edge AND outside target X bounds
+        curr_x_diff = wrap_degrees(target_x_far_edge - curr_yaw)
+        curr_x_side = 1 if curr_x_diff > 0 else -1
+        if curr_x_side != target_x_dir and x_outside_target:
+            overshoot_dist = abs(curr_x_diff)
+            if overshoot_dist > x_max_overshoot:
+                x_max_overshoot = overshoot_dist
+                x_max_overshoot_pos = (curr_yaw, curr_pitch)
+
+        # Y overshoot: past far edge AND outside target Y bounds
+        curr_y_diff = target_y_far_edge - curr_pitch
+        curr_y_side = 1 if curr_y_diff > 0 else -1
+        if curr_y_side != target_y_dir and y_outside_target:
+            overshoot_dist = abs(curr_y_diff)
+            if overshoot_dist > y_max_overshoot:
+                y_max_overshoot = overshoot_dist
+                y_max_overshoot_pos = (curr_yaw, curr_pitch)
+
+        # Determine movement direction for reversal detection
+        curr_x_dir = 1 if dx > 0.01 else (-1 if dx < -0.01 else 0)
+        curr_y_dir = 1 if dy > 0.01 else (-1 if dy < -0.01 else 0)
+
+        if curr_x_dir != 0 and last_x_dir != 0 and curr_x_dir != last_x_dir:
+            x_reversals += 1
+            reversal_points.append((prev_yaw, prev_pitch))
+
+        if curr_y_dir != 0 and last_y_dir != 0 and curr_y_dir != last_y_dir:
+            y_reversals += 1
+            reversal_points.append((prev_yaw, prev_pitch))
+
+        if curr_x_dir != 0:
+            last_x_dir = curr_x_dir
+        if curr_y_dir != 0:
+            last_y_dir = curr_y_dir
+
+    return {
+        'x_reversals': x_reversals,
+        'y_reversals': y_reversals,
+        'x_max_overshoot': x_max_overshoot,
+        'y_max_overshoot': y_max_overshoot,
+        'x_overshoot_pos': x_max_overshoot_pos,
+        'y_overshoot_pos': y_max_overshoot_pos,
+        'reversal_points': reversal_points
+    }
+
+
+def undershoot(path_points, shot_yaw, shot_pitch, target_yaw, target_pitch, target_angular_radius):
+    """
+    Check if the shot position is short of the target's near edges.
+    Only counts as undershoot if the shot is outside the target boundary on that axis.
+    Returns (x_undershoot, y_undershoot) booleans.
+    """
+    if len(path_points) < 2:
+        return False, False
+
+    x_dist_from_center = wrap_degrees(shot_yaw - target_yaw)
+    y_dist_from_center = shot_pitch - target_pitch
+
+    x_outside_target = abs(x_dist_from_center) > target_angular_radius
+    y_outside_target = abs(y_dist_from_center) > target_angular_radius
+
+    if not x_outside_target and not y_outside_target:
+        # Click is inside target - no undershoot
+        return False, False
+
+    # Calculate approach direction from path start
+    path_start_yaw, path_start_pitch = path_points[0]
+    target_x_dir = 1 if wrap_degrees(target_yaw - path_start_yaw) > 0 else -1
+    target_y_dir = 1 if target_pitch - path_start_pitch > 0 else -1
+
+    # Target near edges (the side we approach from)
+    target_x_near_edge = target_yaw - (target_x_dir * target_angular_radius)
+    target_y_near_edge = target_pitch - (target_y_dir * target_angular_radius)
+
+    # Still on the same side as we started (haven't crossed near edge) = undershoot
+    curr_x_side = 1 if wrap_degrees(target_x_near_edge - shot_yaw) > 0 else -1
+    x_undershoot = (curr_x_side == target_x_dir) and x_outside_target
+
+    curr_y_side = 1 if target_y_near_edge - shot_pitch > 0 else -1
+    y_undershoot = (curr_y_side == target_y_dir) and y_outside_target
+
+    return x_undershoot, y_undershoot
+
+
+def analyze_shot(job):
+    """Run the full post-shot analysis for one job dict built by the click handler.
+
+    The job carries a private copy of the approach path plus everything the
+    analysis reads from game state at click time, so it can run on any thread.
+    """
+    path = job['path']
+    target_yaw = job['target_yaw']
+    target_pitch = job['target_pitch']
+    radius = job['target_angular_size']
+
+    if job.get('thinned'):
+        # Thinning dropped points and so shortened the measured path, which
+        # would read as a more efficient movement than it was
+        efficiency = x_eff = y_eff = None
+    else:
+        efficiency = path_efficiency(path, job['start_yaw'], job['start_pitch'],
+                                     target_yaw, target_pitch)
+        x_eff, y_eff = axis_efficiency(path, job['start_yaw'], job['start_pitch'],
+                                       target_yaw, target_pitch)
+    approach = final_approach(path, target_yaw, target_pitch, radius)
+    x_under, y_under = undershoot(path, job['shot_yaw'], job['shot_pitch'],
+                                  target_yaw, target_pitch, radius)
+
+    # --- Auto-tuner samples: directional bias + per-axis accuracy ---
+    x_over = 1 if (approach and approach['x_max_overshoot'] > 0) else 0
+    y_over = 1 if (approach and approach['y_max_overshoot'] > 0) else 0
+    x_under_val = 1 if x_under else 0
+    y_under_val = 1 if y_under else 0
+    if radius > 0:
+        x_prec = max(0.0, 1.0 - abs(job['yaw_diff']) / radius)
+        y_prec = max(0.0, 1.0 - abs(job['pitch_diff']) / radius)
+    else:
+        x_prec = y_prec = 0.0
+
+    # Optional archival copy of the path, compressed here off the Tk thread
+    compressed = None
+    if job.get('archive'):
+        from src.path_codec import compress_path
+        compressed = compress_path(path, target_yaw, target_pitch, radius,
+                                   shot=(job['shot_yaw'], job['shot_pitch']))
+
+    return {
+        'job': job,
+        'compressed_path': compressed,
+        'efficiency': efficiency,
+        'x_efficiency': x_eff,
+        'y_efficiency': y_eff,
+        'approach': approach,
+        'x_undershoot': x_under_val,
+        'y_undershoot': y_under_val,
+        'x_bias': x_over - x_under_val,  # +1 = too fast (overshoot), -1 = too slow
+        'y_bias': y_over - y_under_val,
+        'x_precision': x_prec,
+        'y_precision': y_prec
+    }
+
+
+class AnalysisWorker:
+    """Runs analyze_shot on a daemon thread so clicks never wait on it.
+
+    Jobs are processed strictly in submission order; finished results are
+    collected with drain() from the Tk thread.
+    """
+
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="shot-analysis", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            try:
+                if job is None:
+                    return
+                self.results.put(analyze_shot(job))
+            except Exception as e:
+                print(f"Shot analysis failed: {e}")
+            finally:
+                self.jobs.task_done()
+
+    def submit(self, job):
+        """Queue a shot for analysis"""
+        self.jobs.put(job)
+
+    def drain(self):
+        """Return all results finished so far (oldest first)"""
+        finished = []
+        while True:
+            try:
+                finished.append(self.results.get_nowait())
+            except queue.Empty:
+                return finished
+
+    def flush(self):
+        """Block until every submitted job has finished"""
+        self.jobs.join()
+
+    def stop(self):
+        """Let the worker thread exit once queued jobs are done"""
+        self.jobs.put(None)
@@ -0,0 +1,208 @@
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import wave
+from collections import deque
+
+from src.storage import cache_dir, write_atomic
+
+# Synthesis parameters for each sound effect. Each tone is
+# (start_hz, end_hz, amplitude); the frequency sweeps linearly over the
+# duration and the sum is shaped by exp(-t * decay) * gain.
+SOUND_SPECS = {
+    # Fire sound - short click/pop
+    'fire': {
+        'duration': 0.05,
+        'tones': [(800, 800, 1.0)],
+        'decay': 60,
+        'gain': 0.5,
+        'volume': 0.3
+    },
+    # Hit sound - soft thump (lower frequencies, no high harmonics)
+    'hit': {
+        'duration': 0.12,
+        'tones': [(250, 250, 1.0), (150, 150, 0.5)],
+        'decay': 35,
+        'gain': 0.4,
+        'volume': 0.4
+    },
+    # Miss/expire sound - descending tone from 400 to 200 Hz
+    'miss': {
+        'duration': 0.2,
+        'tones': [(400, 200, 1.0)],
+        'decay': 10,
+        'gain': 0.3,
+        'volume': 0.3
+    }
+}
+
+# Dedicated mixer channels per event type. Retriggering a sound restarts the
+# oldest channel of its own pool, so rapid fire never steals a hit/miss
+# channel and nothing is ever queued behind a busy channel.
+CHANNEL_POOLS = {
+    'fire': 3,
+    'hit': 2,
+    'miss': 2
+}
+
+
+def cache_key(spec, sample_rate):
+    """Stable hash of everything that affects the rendered samples"""
+    synthesis = {key: value for key, value in spec.items() if key != 'volume'}
+    payload = json.dumps([synthesis, sample_rate, 'pcm_s16le_mono'], sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def synthesize(spec, sample_rate):
+    """Render one sound spec as mono 16-bit PCM bytes"""
+    import numpy as np
+
+    duration = spec['duration']
+    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    wave_data = np.zeros_like(t)
+    for start_hz, end_hz, amplitude in spec['tones']:
+        freq = start_hz + (end_hz - start_hz) * t / duration
+        wave_data += amplitude * np.sin(2 * np.pi * freq * t)
+    wave_data = wave_data * np.exp(-t * spec['decay']) * spec['gain']
+
+    # Normalize and convert to 16-bit signed integers
+    return (wave_data * 32767).astype(np.int16).tobytes()
+
+
+def encode_wav(pcm, sample_rate):
+    """Wrap mono 16-bit PCM in a WAV container"""
+    out = io.BytesIO()
+    with wave.open(out, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return out.getvalue()
+
+
+def decode_wav(data, sample_rate):
+    """Return the PCM frames of a cached WAV, or None if it doesn't match the mixer format"""
+    with wave.open(io.BytesIO(data), 'rb') as wav:
+        if (wav.getnchannels(), wav.getsampwidth(), wav.getframerate()) != (1, 2, sample_rate):
+            return None
+        return wav.readframes(wav.getnframes())
+
+
+class SoundBank:
+    """Sound effects loaded on a background thread so they never delay the UI.
+
+    pygame (and NumPy, if a sound has to be synthesised) are only imported on
+    the loader thread. Rendered sounds are cached on disk as WAV files keyed by
+    a hash of their synthesis parameters, so after the first run no synthesis
+    happens at all and editing a spec invalidates only that sound. Each event
+    type plays on its own reserved channels. play() is a silent no-op until
+    loading has finished or if sound is unavailable.
+    """
+
+    def __init__(self, sample_rate=22050, buffer=512, latency_window=500):
+        self.sample_rate = sample_rate
+        self.buffer = buffer  # Mixer buffer in samples (smaller = lower latency, more underrun risk)
+        self.sounds = {}
+        self.channels = {}  # name -> [pygame Channel]
+        self.next_channel = {}  # name -> index of the channel to retrigger next
+        self.enabled = True
+        self.ready = threading.Event()
+        self.load_seconds = None  # How long the background load took
+        self.cache_hits = 0
+        self.dispatch_latencies = deque(maxlen=latency_window)  # ms, click -> Channel.play returned
+
+    def load_async(self):
+        """Start loading sounds on a daemon thread"""
+        threading.Thread(target=self._load, name="sound-loader", daemon=True).start()
+
+    def _load(self):
+        start = time.perf_counter()
+        try:
+            try:
+                import pygame
+            except ImportError:
+                self.enabled = False
+                print("pygame not found - sounds disabled. Install with: pip install pygame")
+                return
+            try:
+                pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=1, buffer=self.buffer)
+                total_channels = sum(CHANNEL_POOLS.values())
+                pygame.mixer.set_num_channels(max(total_channels, pygame.mixer.get_num_channels()))
+                pygame.mixer.set_reserved(total_channels)
+
+                sounds = {}
+                channels = {}
+                first_channel = 0
+                for name, spec in SOUND_SPECS.items():
+                    sound = pygame.mixer.Sound(buffer=self._load_pcm(name, spec))
+                    sound.set_volume(spec['volume'])
+                    sounds[name] = sound
+                    pool_size = CHANNEL_POOLS.get(name, 1)
+                    channels[name] = [pygame.mixer.Channel(first_channel + i) for i in range(pool_size)]
+                    first_channel += pool_size
+                # play() checks self.channels first, so publish it last
+                self.sounds = sounds
+                self.next_channel = {name: 0 for name in channels}
+                self.channels = channels
+            except Exception as e:
+                self.enabled = False
+                print(f"Sound generation failed: {e} - sounds disabled")
+        finally:
+            self.load_seconds = time.perf_counter() - start
+            self.ready.set()
+
+    def _load_pcm(self, name, spec):
+        """Read pre-rendered PCM from the WAV cache, synthesising (and caching) on a miss"""
+        path = os.path.join(cache_dir('sounds'), f"{name}-{cache_key(spec, self.sample_rate)}.wav")
+        try:
+            with open(path, 'rb') as f:
+                pcm = decode_wav(f.read(), self.sample_rate)
+            if pcm:
+                self.cache_hits += 1
+                return pcm
+        except (OSError, EOFError, wave.Error):
+            pass
+
+        pcm = synthesize(spec, self.sample_rate)
+        try:
+            write_atomic(path, encode_wav(pcm, self.sample_rate))
+        except OSError as e:
+            print(f"Could not cache sound '{name}': {e}")
+        return pcm
+
+    def play(self, name, event_ns=None):
+        """Play a sound effect on its own channel pool.
+
+        event_ns is the perf_counter_ns() timestamp of the input that caused
+        the sound (e.g. the click); when given, the click-to-dispatch latency
+        is recorded.
+        """
+        channels = self.channels.get(name)
+        if not channels:
+            return
+        index = self.next_channel[name]
+        self.next_channel[name] = (index + 1) % len(channels)
+        channels[index].play(self.sounds[name])
+        if event_ns is not None:
+            self.dispatch_latencies.append((time.perf_counter_ns() - event_ns) / 1e6)
+
+    def buffer_latency_ms(self):
+        """Duration of one mixer buffer, the minimum time before new audio can be heard"""
+        return self.buffer / self.sample_rate * 1000
+
+    def latency_lines(self):
+        """Human-readable click-to-audio latency summary"""
+        if not self.enabled:
+            return ["click->audio: sound disabled"]
+        buffer_ms = self.buffer_latency_ms()
+        if not self.dispatch_latencies:
+            return [f"click->audio: no samples (buffer {self.buffer} = {buffer_ms:.1f} ms)"]
+        ordered = sorted(self.dispatch_latencies)
+        count = len(ordered)
+        p50 = ordered[count // 2]
+        p95 = ordered[min(count - 1, int(count * 0.95))]
+        return [f"click->audio: dispatch p50 {p50:.2f} | p95 {p95:.2f} ms + buffer "
+                f"{buffer_ms:.1f} ms ~ {p50 + buffer_ms:.1f} ms (n={count})"]
@@ -1,8 +1,34 @@
+class RunningMean:
+    """Count, sum and number of positive values of a stream, in O(1) memory.
+    
+    Stands in for the per-session lists that were only ever averaged or
+    counted, so week-long sessions don't grow without bound.
+    """
+    __slots__ = ('count', 'total', 'positive')
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.positive = 0
+        
+    def append(self, value):
+        self.count += 1
+        self.total += value
+        if value > 0:
+            self.positive += 1
+        
+    def __len__(self):
+        return self.count
+        
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
 class StatsTracker:
     def __init__(self):
         self.hits = 0
         self.misses = 0
-        self.reaction_times = []
+        self.reaction_times = RunningMean()
         
     def record_hit(self, reaction_time):
         """Record a successful hit"""
@@ -22,12 +48,10 @@ class StatsTracker:
         
     def get_average_reaction_time(self):
         """Calculate average reaction time"""
-        if not self.reaction_times:
-            return 0.0
-        return sum(self.reaction_times) / len(self.reaction_times)
+        return self.reaction_times.mean()
         
     def reset(self):
         """Reset all statistics"""
         self.hits = 0
         self.misses = 0
-        self.reaction_times = []
+        self.reaction_times = RunningMean()
@@ -0,0 +1,25 @@
+import os
+
+
+def data_dir():
+    """Root directory for everything the trainer persists (override with AIM_WARMUP_HOME)"""
+    path = os.environ.get('AIM_WARMUP_HOME') or os.path.join(os.path.expanduser('~'), '.aim-warmup')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cache_dir(*parts):
+    """Directory for regenerable data such as pre-rendered sounds"""
+    path = os.path.join(data_dir(), 'cache', *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def write_atomic(path, data):
+    """Write bytes so readers only ever see the old or the complete new file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
@@ -0,0 +1,289 @@
+# Target states
+ALIVE = 1
+FROZEN = 2  # Alive but excluded from expiry (used by modes that manage lifetime themselves)
+
+
+class Target:
+    """Lightweight view of one target in a TargetStore.
+
+    Holds only the store and the target's stable id, so creating one is cheap
+    and it stays valid when other targets are removed (rows move, ids don't).
+    """
+    __slots__ = ('store', 'id')
+
+    def __init__(self, store, target_id):
+        self.store = store
+        self.id = target_id
+
+    def __eq__(self, other):
+        return isinstance(other, Target) and other.store is self.store and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f"Target(id={self.id}, yaw={self.yaw:.2f}, pitch={self.pitch:.2f})"
+
+    @property
+    def row(self):
+        return self.store.row(self.id)
+
+    @property
+    def alive(self):
+        return self.id in self.store.index
+
+    @property
+    def yaw(self):
+        return float(self.store.yaw[self.row])
+
+    @yaw.setter
+    def yaw(self, value):
+        self.store.yaw[self.row] = value
+
+    @property
+    def pitch(self):
+        return float(self.store.pitch[self.row])
+
+    @pitch.setter
+    def pitch(self, value):
+        self.store.pitch[self.row] = value
+
+    @property
+    def spawn_time(self):
+        return float(self.store.spawn_time[self.row])
+
+    @property
+    def paused_duration(self):
+        return float(self.store.paused[self.row])
+
+    @paused_duration.setter
+    def paused_duration(self, value):
+        self.store.paused[self.row] = value
+
+    @property
+    def size(self):
+        return float(self.store.size[self.row])
+
+    @property
+    def state(self):
+        return int(self.store.state[self.row])
+
+
+class TargetStore:
+    """Struct-of-arrays target storage.
+
+    Every attribute (including velocity, in degrees per second, for moving
+    targets) lives in its own contiguous NumPy array; rows [0, count)
+    are the live targets in no particular order. Targets are identified by
+    stable integer ids, removal is an O(1) swap with the last row, and the
+    column views (yaws, pitches, ...) let per-frame work such as expiry,
+    nearest-target search and projection run vectorized over all targets.
+    """
+
+    def __init__(self, capacity=16):
+        self.count = 0
+        self.next_id = 1
+        self.index = {}  # id -> row
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        import numpy as np
+
+        def grow(old, dtype):
+            new = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            return new
+
+        self.ids = grow(getattr(self, 'ids', None), np.int64)
+        self.yaw = grow(getattr(self, 'yaw', None), np.float64)
+        self.pitch = grow(getattr(self, 'pitch', None), np.float64)
+        self.spawn_time = grow(getattr(self, 'spawn_time', None), np.float64)
+        self.paused = grow(getattr(self, 'paused', None), np.float64)
+        self.size = grow(getattr(self, 'size', None), np.float64)
+        self.vyaw = grow(getattr(self, 'vyaw', None), np.float64)
+        self.vpitch = grow(getattr(self, 'vpitch', None), np.float64)
+        self.state = grow(getattr(self, 'state', None), np.int8)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __iter__(self):
+        """Iterate views of the live targets (take a list() before removing while iterating)"""
+        for row in range(self.count):
+            yield Target(self, int(self.ids[row]))
+
+    # --- Column views over the live rows ---
+    @property
+    def live_ids(self):
+        return self.ids[:self.count]
+
+    @property
+    def yaws(self):
+        return self.yaw[:self.count]
+
+    @property
+    def pitches(self):
+        return self.pitch[:self.count]
+
+    @property
+    def spawn_times(self):
+        return self.spawn_time[:self.count]
+
+    @property
+    def paused_durations(self):
+        return self.paused[:self.count]
+
+    @property
+    def sizes(self):
+        return self.size[:self.count]
+
+    @property
+    def states(self):
+        return self.state[:self.count]
+
+    @property
+    def vyaws(self):
+        return self.vyaw[:self.count]
+
+    @property
+    def vpitches(self):
+        return self.vpitch[:self.count]
+
+    # --- Mutation ---
+    def add(self, yaw, pitch, spawn_time, size, state=ALIVE):
+        """Add one target and return its view"""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        row = self.count
+        target_id = self.next_id
+        self.next_id += 1
+        self.ids[row] = target_id
+        self.yaw[row] = yaw
+        self.pitch[row] = pitch
+        self.spawn_time[row] = spawn_time
+        self.paused[row] = 0.0
+        self.size[row] = size
+        self.state[row] = state
+        self.vyaw[row] = 0.0
+        self.vpitch[row] = 0.0
+        self.index[target_id] = row
+        self.count += 1
+        return Target(self, target_id)
+
+    def add_many(self, yaws, pitches, spawn_time, size, state=ALIVE):
+        """Add a batch of targets in one go; returns their ids"""
+        import numpy as np
+
+        yaws = np.asarray(yaws, dtype=np.float64)
+        n = len(yaws)
+        needed = self.count + n
+        if needed > self.capacity:
+            capacity = self.capacity
+            while capacity < needed:
+                capacity *= 2
+            self._allocate(capacity)
+        rows = slice(self.count, needed)
+        ids = np.arange(self.next_id, self.next_id + n, dtype=np.int64)
+        self.next_id += n
+        self.ids[rows] = ids
+        self.yaw[rows] = yaws
+        self.pitch[rows] = pitches
+        self.spawn_time[rows] = spawn_time
+        self.paused[rows] = 0.0
+        self.size[rows] = size
+        self.state[rows] = state
+        self.vyaw[rows] = 0.0
+        self.vpitch[rows] = 0.0
+        for offset, target_id in enumerate(ids.tolist()):
+            self.index[target_id] = self.count + offset
+        self.count = needed
+        return ids
+
+    def remove(self, target_id):
+        """Remove a target by id in O(1) by moving the last row into its slot"""
+        row = self.index.pop(int(target_id))
+        last = self.count - 1
+        if row != last:
+            moved_id = int(self.ids[last])
+            self.ids[row] = moved_id
+            self.yaw[row] = self.yaw[last]
+            self.pitch[row] = self.pitch[last]
+            self.spawn_time[row] = self.spawn_time[last]
+            self.paused[row] = self.paused[last]
+            self.size[row] = self.size[last]
+            self.state[row] = self.state[last]
+            self.vyaw[row] = self.vyaw[last]
+            self.vpitch[row] = self.vpitch[last]
+            self.index[moved_id] = row
+        self.count = last
+
+    def remove_many(self, target_ids):
+        """Remove several targets by id"""
+        for target_id in target_ids:
+            self.remove(target_id)
+
+    def clear(self):
+        """Remove every target (ids keep counting up)"""
+        self.count = 0
+        self.index.clear()
+
+    # --- Lookup ---
+    def row(self, target_id):
+        return self.index[target_id]
+
+    def at(self, row):
+        """Return a view of the target currently stored in row"""
+        return Target(self, int(self.ids[row]))
+
+    def get(self, target_id):
+        """Return a view of the target, or None if it no longer exists"""
+        if target_id in self.index:
+            return Target(self, target_id)
+        return None
+
+    # --- Vectorized queries ---
+    def ages(self, now):
+        """Effective age of every live target (wall time minus paused time)"""
+        return now - self.spawn_times - self.paused_durations
+
+    def expired_ids(self, now, lifetime):
+        """Ids of ALIVE targets whose effective age has reached lifetime"""
+        mask = (self.ages(now) >= lifetime) & (self.states == ALIVE)
+        return self.live_ids[mask].tolist()
+
+    def pause_all(self, duration):
+        """Add duration to every live target's paused time"""
+        self.paused[:self.count] += duration
+
+    def integrate(self, dt, max_yaw, max_pitch):
+        """Move every target by its velocity, bouncing off the world bounds"""
+        import numpy as np
+
+        for position, velocity, bound in ((self.yaws, self.vyaws, max_yaw),
+                                          (self.pitches, self.vpitches, max_pitch)):
+            position += velocity * dt
+            outside = np.abs(position) > bound
+            if outside.any():
+                np.clip(position, -bound, bound, out=position)
+                velocity[outside] *= -1
+
+    def yaw_offsets(self, yaw):
+        """Wrapped yaw difference (target - yaw) in -180..180 for every target"""
+        return (self.yaws - yaw + 180.0) % 360.0 - 180.0
+
+    def nearest(self, yaw, pitch):
+        """Return (view, row, angular distance) of the target closest to (yaw, pitch)"""
+        import numpy as np
+
+        if self.count == 0:
+            return None, None, float('inf')
+        dyaw = self.yaw_offsets(yaw)
+        dpitch = self.pitches - pitch
+        dist_sq = dyaw * dyaw + dpitch * dpitch
+        row = int(np.argmin(dist_sq))
+        return Target(self, int(self.ids[row])), row, float(np.sqrt(dist_sq[row]))
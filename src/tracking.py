@@ -0,0 +1,148 @@
+import math
+
+GOLDEN_RATIO = 0.6180339887498949
+
+
+class RandomWalkMotion:
+    """Smooth random-walk motion for every target at once.
+
+    Each velocity component follows an Ornstein-Uhlenbeck process: it is
+    pulled back toward zero at `agility` per second and kicked by Gaussian
+    noise, so targets drift, curve and change direction unpredictably while
+    their typical speed stays around `speed` degrees per second.
+    """
+
+    def __init__(self, speed=12.0, agility=1.5):
+        self.speed = speed
+        self.agility = agility
+
+    def update(self, store, dt, rng):
+        count = len(store)
+        if not count:
+            return
+        sigma = self.speed * math.sqrt(2 * self.agility)
+        noise = rng.standard_normal((2, count)) * (sigma * math.sqrt(dt))
+        decay = self.agility * dt
+        vyaws = store.vyaws
+        vpitches = store.vpitches
+        vyaws -= vyaws * decay
+        vyaws += noise[0]
+        vpitches -= vpitches * decay
+        vpitches += noise[1]
+
+
+class StrafeMotion:
+    """Parametric side-to-side strafing with a small vertical figure-eight.
+
+    Velocities are the derivative of yaw = A sin(wt + phase) and
+    pitch = A * vertical_ratio * sin(2wt + phase); each target's phase is
+    derived from its id, so several targets never move in lockstep.
+    """
+
+    def __init__(self, amplitude=8.0, period=2.0, vertical_ratio=0.25):
+        self.amplitude = amplitude
+        self.omega = 2 * math.pi / period
+        self.vertical_ratio = vertical_ratio
+        self.elapsed = 0.0
+
+    def update(self, store, dt, rng):
+        import numpy as np
+
+        self.elapsed += dt
+        if not len(store):
+            return
+        phase = (store.live_ids * GOLDEN_RATIO % 1.0) * (2 * math.pi)
+        angle = self.omega * self.elapsed + phase
+        store.vyaws[:] = self.amplitude * self.omega * np.cos(angle)
+        store.vpitches[:] = (self.amplitude * self.vertical_ratio * 2 * self.omega *
+                             np.cos(2 * angle))
+
+
+class _Accumulator:
+    """Time-weighted running sums of tracking error (see TrackingMetrics)"""
+    __slots__ = ('time', 'on_target', 'on_x', 'on_y', 'sq_x', 'sq_y',
+                 'ev_x', 'ev_y', 'vv_x', 'vv_y')
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0.0)
+
+    def add(self, dt, error_x, error_y, vel_x, vel_y, in_x, in_y):
+        self.time += dt
+        if in_x and in_y:
+            self.on_target += dt
+        if in_x:
+            self.on_x += dt
+        if in_y:
+            self.on_y += dt
+        self.sq_x += error_x * error_x * dt
+        self.sq_y += error_y * error_y * dt
+        self.ev_x += error_x * vel_x * dt
+        self.ev_y += error_y * vel_y * dt
+        self.vv_x += vel_x * vel_x * dt
+        self.vv_y += vel_y * vel_y * dt
+
+    def rms(self):
+        """Per-axis RMS error in degrees"""
+        if self.time <= 0:
+            return 0.0, 0.0
+        return math.sqrt(self.sq_x / self.time), math.sqrt(self.sq_y / self.time)
+
+    def lag(self):
+        """Per-axis lag in seconds (positive = behind the target, negative = ahead).
+
+        Least-squares fit of error = -lag * target_velocity, i.e. how far in
+        time the crosshair trails (or leads) the target along each axis.
+        """
+        lag_x = -self.ev_x / self.vv_x if self.vv_x > 1e-9 else 0.0
+        lag_y = -self.ev_y / self.vv_y if self.vv_y > 1e-9 else 0.0
+        return lag_x, lag_y
+
+    def on_target_fraction(self):
+        return self.on_target / self.time if self.time > 0 else 0.0
+
+
+class TrackingMetrics:
+    """Incremental crosshair-on-target error for tracking modes.
+
+    add() is called once per input sample with the error and target
+    velocity; everything is kept as running time-weighted sums, so the cost
+    per sample is constant and nothing is stored per sample. Every `segment`
+    seconds the current segment is handed back to become one auto-tuner
+    sample: lagging behind the target reads as "too slow" (-1 bias), leading
+    it as "too fast" (+1), matching the overshoot/undershoot bias of shots.
+    """
+
+    def __init__(self, segment=1.0, lag_deadband=0.03):
+        self.segment_seconds = segment
+        self.lag_deadband = lag_deadband  # seconds of lag/lead treated as on time
+        self.reset()
+
+    def reset(self):
+        self.session = _Accumulator()
+        self.segment = _Accumulator()
+
+    def add(self, dt, error_x, error_y, vel_x, vel_y, radius):
+        """Accumulate one sample; returns (on_target, finished segment or None)"""
+        in_x = abs(error_x) <= radius
+        in_y = abs(error_y) <= radius
+        self.session.add(dt, error_x, error_y, vel_x, vel_y, in_x, in_y)
+        segment = self.segment
+        segment.add(dt, error_x, error_y, vel_x, vel_y, in_x, in_y)
+        finished = None
+        if segment.time >= self.segment_seconds:
+            finished = segment
+            self.segment = _Accumulator()
+        return in_x and in_y, finished
+
+    def tune_sample(self, segment):
+        """(x_bias, y_bias, x_precision, y_precision) for the auto-tuner"""
+        biases = []
+        for lag in segment.lag():
+            if lag > self.lag_deadband:
+                biases.append(-1)  # Trailing the target: sens too slow
+            elif lag < -self.lag_deadband:
+                biases.append(1)  # Running ahead: sens too fast
+            else:
+                biases.append(0)
+        return biases[0], biases[1], segment.on_x / segment.time, segment.on_y / segment.time
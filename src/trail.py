@@ -0,0 +1,113 @@
+class TrailBuffer:
+    """Fixed-capacity ring buffer of timestamped (yaw, pitch) crosshair samples"""
+
+    def __init__(self, capacity=256):
+        import numpy as np
+
+        self.capacity = capacity
+        self.yaw = np.zeros(capacity)
+        self.pitch = np.zeros(capacity)
+        self.time = np.zeros(capacity)
+        self.head = 0  # Next slot to write
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, yaw, pitch, timestamp):
+        head = self.head
+        self.yaw[head] = yaw
+        self.pitch[head] = pitch
+        self.time[head] = timestamp
+        self.head = (head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def since(self, cutoff):
+        """(yaws, pitches, times) of samples newer than cutoff, oldest first"""
+        import numpy as np
+
+        order = (np.arange(self.head - self.count, self.head)) % self.capacity
+        times = self.time[order]
+        keep = order[times >= cutoff]
+        return self.yaw[keep], self.pitch[keep], self.time[keep]
+
+
+class TrailRenderer:
+    """Draws a fading trail with a fixed handful of canvas line items.
+
+    The trail is split by age into `bands`; each band is one persistent
+    line whose coordinates are replaced every frame, drawn in a colour (and
+    width) that fades toward the background. Neighbouring bands share their
+    boundary point so the trail stays continuous. Items carry the
+    'persistent' tag so per-frame canvas clears leave them alone.
+    """
+
+    def __init__(self, canvas, color=(0, 255, 136), background=(42, 42, 42), bands=4, width=3):
+        self.canvas = canvas
+        self.bands = bands
+        self.items = None
+        self.shown = [False] * bands  # Last state set on each band, to skip redundant configures
+        self.colors = []
+        self.widths = []
+        for band in range(bands):
+            # Band 0 is the oldest (faintest), the last band the newest
+            strength = (band + 1) / bands
+            rgb = [int(bg + (fg - bg) * strength) for fg, bg in zip(color, background)]
+            self.colors.append('#%02x%02x%02x' % tuple(rgb))
+            self.widths.append(max(1, round(width * strength)))
+
+    def _create(self):
+        self.items = [
+            self.canvas.create_line(0, 0, 0, 0, fill=color, width=width, state='hidden',
+                                    capstyle='round', joinstyle='round',
+                                    tags=('trail', 'persistent'))
+            for color, width in zip(self.colors, self.widths)
+        ]
+
+    def _show(self, band, shown):
+        if self.shown[band] != shown:
+            self.canvas.itemconfigure(self.items[band], state='normal' if shown else 'hidden')
+            self.shown[band] = shown
+
+    def forget(self):
+        """Call after the canvas was fully cleared; items are recreated on next use"""
+        self.items = None
+        self.shown = [False] * self.bands
+
+    def hide(self):
+        if self.items is not None:
+            for band in range(self.bands):
+                self._show(band, False)
+
+    def update(self, xs, ys, ages, fade_time):
+        """Point the band lines at the given screen points (ordered oldest first)"""
+        import numpy as np
+
+        if self.items is None:
+            self._create()
+        if len(xs) < 2:
+            self.hide()
+            return
+
+        # Band index for every point; ages fall monotonically, so bands are contiguous runs
+        band_of = np.clip(((1 - ages / fade_time) * self.bands).astype(int), 0, self.bands - 1)
+        starts = np.searchsorted(band_of, np.arange(self.bands), side='left')
+        ends = np.searchsorted(band_of, np.arange(self.bands), side='right')
+        coords = np.column_stack((xs, ys)).ravel().tolist()
+
+        canvas = self.canvas
+        for band, item in enumerate(self.items):
+            start, end = int(starts[band]), int(ends[band])
+            # Extend one point into the next (newer) band so the segments join up
+            end = min(end + 1, len(xs))
+            if end - start >= 2:
+                canvas.coords(item, coords[start * 2:end * 2])
+                self._show(band, True)
+            else:
+                self._show(band, False)
+        canvas.tag_raise('trail')
@@ -0,0 +1,65 @@
+import json
+from collections import deque
+from types import SimpleNamespace
+
+from src import checkpoint
+from src.heatmap import ShotHeatmap
+from src.stats_tracker import RunningMean, StatsTracker
+
+
+def new_session(now):
+    """The slice of AimExercise state that capture() and restore() touch"""
+    session = SimpleNamespace(
+        clock=lambda: now, game_mode='random', current_x_sens=6.5, current_y_sens=7.0,
+        scoped_sens_percent=80, forecast_x=6.5, forecast_y=7.0, session_timer=0.0,
+        total_unfocused_time=0.0, score=0, current_streak=0, best_streak=0, streak_history=[],
+        stats=StatsTracker(), session_heatmap=ShotHeatmap()
+    )
+    for name in checkpoint.MEAN_FIELDS:
+        setattr(session, name, RunningMean())
+    for name in checkpoint.TIMESTAMPED_FIELDS:
+        setattr(session, name, deque())
+    return session
+
+
+def test_capture_restore_round_trip_shifts_windows_to_now():
+    session = new_session(1000.0)
+    session.stats.record_hit(0.42)
+    session.stats.record_hit(0.38)
+    session.stats.record_miss()
+    session.path_efficiencies.append(85.0)
+    session.x_overshoots.append(1)
+    session.recent_hits.extend([(990.0, 0.42), (995.0, 0.38)])
+    session.recent_misses.append(997.5)
+    session.tune_x.append((995.0, 1, 0.8, 6.5))
+    session.session_timer = 125.5
+    session.score, session.current_streak, session.best_streak = 340, 2, 5
+    session.streak_history = [5, 3]
+    session.session_heatmap.add(0.2, -0.1)
+
+    # Through JSON, as the checkpoint writer stores it
+    state = json.loads(json.dumps(checkpoint.capture(session)))
+
+    resumed = new_session(5000.0)
+    checkpoint.restore(resumed, state)
+
+    assert (resumed.stats.hits, resumed.stats.misses) == (2, 1)
+    assert resumed.stats.get_average_reaction_time() == session.stats.get_average_reaction_time()
+    assert resumed.path_efficiencies.mean() == 85.0
+    assert resumed.x_overshoots.positive == 1
+    assert resumed.session_timer == 125.5
+    assert (resumed.score, resumed.current_streak, resumed.best_streak) == (340, 2, 5)
+    assert resumed.streak_history == [5, 3]
+    assert resumed.session_heatmap.total() == 1
+
+    # Rolling windows keep their age relative to the clock
+    assert list(resumed.recent_hits) == [(4990.0, 0.42), (4995.0, 0.38)]
+    assert list(resumed.recent_misses) == [4997.5]
+    assert list(resumed.tune_x) == [(4995.0, 1, 0.8, 6.5)]
+
+
+def test_load_ignores_other_versions(tmp_path):
+    path = tmp_path / 'checkpoint.json'
+    path.write_text(json.dumps({'version': checkpoint.CHECKPOINT_VERSION + 1}))
+    assert checkpoint.load(str(path)) is None
+    assert checkpoint.load(str(tmp_path / 'missing.json')) is None
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+# pynput's dummy backend: the key types without a display or keyboard hook
+os.environ.setdefault('PYNPUT_BACKEND', 'dummy')
+
+from pynput.keyboard import Key, KeyCode  # noqa: E402
+
+from src.hotkey_manager import (  # noqa: E402
+    MODIFIER_CODES, NO_CODE, SPECIAL_CODES, VK_BASE, HotkeyManager, index_bindings, parse_combo
+)
+
+
+# The dummy backend's Key members all alias one value; folding left/right
+# modifiers can only be checked against a real one
+real_keys = pytest.mark.skipif(Key.ctrl_l is Key.alt, reason="pynput dummy backend has no distinct Keys")
+
+
+def press(manager, *keys):
+    for key in keys:
+        manager.on_press(key)
+
+
+def test_parse_combo_modifiers_and_letters():
+    codes = parse_combo('ctrl+shift+a')
+    assert codes == frozenset({MODIFIER_CODES['ctrl'], MODIFIER_CODES['shift'], ord('a')})
+    assert parse_combo(' Shift + CTRL + A ') == codes
+    assert parse_combo('alt+f1') == frozenset({MODIFIER_CODES['alt'], SPECIAL_CODES[Key.f1]})
+
+
+def test_parse_combo_rejects_unknown_keys():
+    with pytest.raises(ValueError, match="Unknown key 'hyper'"):
+        parse_combo('ctrl+hyper')
+    with pytest.raises(ValueError):
+        parse_combo('ctrl++a')
+
+
+def test_normalise_folds_case_sides_and_control_characters():
+    normalise = HotkeyManager.normalise
+    assert normalise(KeyCode.from_char('A')) == ord('a')
+    assert normalise(KeyCode.from_char('\x01')) == ord('a')  # Ctrl+A as a control character
+    assert normalise(KeyCode.from_vk(0x41)) == ord('a')
+    assert normalise(KeyCode.from_vk(0x70)) == VK_BASE + 0x70
+    assert normalise(KeyCode()) is NO_CODE
+
+
+@real_keys
+def test_normalise_folds_left_and_right_modifiers():
+    normalise = HotkeyManager.normalise
+    assert normalise(Key.ctrl_l) == normalise(Key.ctrl_r) == MODIFIER_CODES['ctrl']
+    assert normalise(Key.shift_r) == MODIFIER_CODES['shift']
+    assert normalise(Key.f1) != normalise(Key.f2)
+
+
+def test_duplicate_bindings_are_indexed_once():
+    by_code = index_bindings({'toggle_window': ['ctrl+shift+a', 'shift+ctrl+a']})
+    assert all(len(entries) == 1 for entries in by_code.values())
+
+
+def test_exact_combo_queues_action_once_and_ignores_repeats():
+    woken = []
+    manager = HotkeyManager({'toggle_window': lambda: None},
+                            {'toggle_window': ['x+z', 'Z+X']},
+                            waker=lambda: woken.append(True))
+    x, z = KeyCode.from_char('x'), KeyCode.from_char('Z')
+    press(manager, x, z)
+    press(manager, z)  # Auto-repeat
+    assert [action for action, _ in manager.pending] == ['toggle_window']
+    assert woken == [True]
+
+    # A superset of the combo is not a match
+    manager.on_release(x)
+    manager.on_release(z)
+    press(manager, KeyCode.from_char('q'), x, z)
+    assert len(manager.pending) == 1
+
+    manager.dispatch_pending()
+    assert not manager.pending and len(manager.latencies) == 1
@@ -0,0 +1,21 @@
+import numpy as np
+
+from src.modes import GridSpawn
+
+
+def test_grid_spawn_never_shares_or_reuses_cells():
+    rng = np.random.default_rng(35)
+    grid = GridSpawn(3, 3)
+    yaws, pitches = grid.spawn(7, np.empty(0), np.empty(0), 30.0, 30.0, rng)
+    assert len(set(zip(yaws.tolist(), pitches.tolist()))) == 7
+
+    # Only the two remaining free cells are handed out, never occupied ones
+    more_yaws, more_pitches = grid.spawn(5, yaws, pitches, 30.0, 30.0, rng)
+    assert len(more_yaws) == 2
+    cells = set(zip(yaws.tolist(), pitches.tolist())) | set(zip(more_yaws.tolist(), more_pitches.tolist()))
+    assert len(cells) == 9
+
+    # A full grid spawns nothing
+    all_yaws = np.concatenate([yaws, more_yaws])
+    all_pitches = np.concatenate([pitches, more_pitches])
+    assert len(grid.spawn(1, all_yaws, all_pitches, 30.0, 30.0, rng)[0]) == 0
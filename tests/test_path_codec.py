@@ -0,0 +1,56 @@
+import random
+
+from src import shot_analysis
+from src.path_codec import compress_path, decode, encode_lossless
+
+DEAD_BAND = 0.01  # final_approach() ignores per-sample steps this small
+
+
+def dead_band_path(rng, length=60):
+    """Path that zig-zags in steps just either side of the reversal dead-band"""
+    yaw = rng.uniform(-5, 5)
+    pitch = rng.uniform(-5, 5)
+    points = [(yaw, pitch)]
+    for i in range(length):
+        sign = 1 if (i // rng.randint(1, 3)) % 2 else -1
+        yaw += sign * (DEAD_BAND + rng.choice((-4e-7, 4e-7, 1e-4, -1e-4)))
+        pitch += rng.choice((-1, 1)) * (DEAD_BAND + rng.uniform(-5e-4, 5e-4))
+        points.append((yaw, pitch))
+    return points
+
+
+def check_round_trip(points, target_yaw, target_pitch, radius):
+    shot = points[-1]
+    compressed = compress_path(points, target_yaw, target_pitch, radius, shot=shot)
+    decoded = decode(compressed['data'])
+    original = shot_analysis.final_approach(points, target_yaw, target_pitch, radius)
+    restored = shot_analysis.final_approach(decoded, target_yaw, target_pitch, radius)
+    for key in ('x_reversals', 'y_reversals'):
+        assert restored[key] == original[key]
+    for key in ('x_max_overshoot', 'y_max_overshoot'):
+        assert (restored[key] > 0) == (original[key] > 0)
+        assert abs(restored[key] - original[key]) <= max(compressed['quantum'], 1e-12)
+    assert (shot_analysis.undershoot(decoded, *shot, target_yaw, target_pitch, radius) ==
+            shot_analysis.undershoot(points, *shot, target_yaw, target_pitch, radius))
+    return compressed
+
+
+def test_dead_band_paths_keep_their_analysis():
+    rng = random.Random(38)
+    for _ in range(300):
+        points = dead_band_path(rng)
+        target_yaw = points[0][0] + rng.uniform(-1, 1)
+        target_pitch = points[0][1] + rng.uniform(-1, 1)
+        check_round_trip(points, target_yaw, target_pitch, rng.uniform(0.05, 0.5))
+
+
+def test_alternating_steps_fall_back_to_lossless():
+    points = [(0.0100004 * (i % 2), 0.0) for i in range(9)]
+    compressed = check_round_trip(points, 1.0, 0.0, 0.1)
+    assert compressed['quantum'] == 0
+    assert shot_analysis.final_approach(decode(compressed['data']), 1.0, 0.0, 0.1)['x_reversals'] == 7
+
+
+def test_lossless_encoding_is_exact():
+    points = [(0.1 * i + 1e-9, -0.3 * i) for i in range(20)]
+    assert decode(encode_lossless(points)) == points
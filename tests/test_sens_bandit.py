@@ -0,0 +1,20 @@
+from src.sens_bandit import SensBandit
+
+
+def test_decayed_sparse_evidence_stays_near_observed_sens():
+    model = SensBandit()
+    model.observe('x', 5.0, 0.6)
+    model.observe('x', 15.0, 0.8)
+    for _ in range(3):
+        model.begin_session()
+    assert model.posterior('x')[2].max() < 1
+    assert model.best('x') in (5.0, 15.0)
+    for _ in range(50):
+        sens = model.sample('x')
+        assert 4.0 <= sens <= 6.0 or 14.0 <= sens <= 16.0
+
+
+def test_no_evidence_gives_no_suggestion():
+    model = SensBandit()
+    assert model.best('y') is None
+    assert model.sample('y') is None
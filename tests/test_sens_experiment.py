@@ -0,0 +1,74 @@
+import random
+
+from src.events import EXPIRE, HIT, MISS
+from src.sens_experiment import PRECISION, SensExperiment
+
+CANDIDATES = [(5.0, 5.0), (6.0, 6.0), (7.0, 7.0)]
+
+
+def play(experiment, hit_rates, rng, limit=10000):
+    """Shoot until the experiment decides; returns the sequence of arms played per block"""
+    blocks = [experiment.arm_index]
+    for _ in range(limit):
+        if experiment.decided:
+            break
+        hit = rng.random() < hit_rates[experiment.arm_index]
+        if experiment.record(HIT if hit else MISS) and not experiment.decided:
+            blocks.append(experiment.arm_index)
+    return blocks
+
+
+def test_settle_shots_are_dropped_after_each_switch():
+    experiment = SensExperiment(CANDIDATES, block_shots=4, settle_shots=2, seed=1)
+    first = experiment.current
+    assert not experiment.record(HIT)
+    assert not experiment.record(HIT)
+    assert first.count == 0 and experiment.total == 0
+    for _ in range(3):
+        assert not experiment.record(HIT)
+    assert experiment.record(HIT)  # Fourth kept sample ends the block
+    assert first.count == 4 and experiment.total == 4
+
+    second = experiment.current
+    assert second is not first
+    experiment.record(MISS)
+    experiment.record(MISS)
+    assert second.count == 0
+    experiment.record(MISS)
+    assert second.count == 1
+
+
+def test_expired_targets_are_not_precision_samples():
+    experiment = SensExperiment(CANDIDATES, metric=PRECISION, settle_shots=0, seed=2)
+    assert not experiment.record(EXPIRE)
+    experiment.record(MISS)
+    experiment.record(HIT, precision=80.0)
+    assert experiment.current.count == 2 and experiment.current.mean == 40.0
+
+
+def test_same_arm_never_plays_two_blocks_in_a_row():
+    for seed in range(20):
+        # min_shots out of reach: never decides, so it cycles for the whole run
+        experiment = SensExperiment(CANDIDATES[:2] if seed % 2 else CANDIDATES,
+                                    block_shots=3, settle_shots=1, min_shots=10000, seed=seed)
+        blocks = play(experiment, [0.5, 0.5, 0.5], random.Random(seed), limit=400)
+        assert len(blocks) == 101  # 400 shots / (1 settle + 3 kept) block switches, plus the first
+        assert all(a != b for a, b in zip(blocks, blocks[1:]))
+
+
+def test_clear_winner_is_called_at_the_confidence_level():
+    experiment = SensExperiment(CANDIDATES, confidence=0.95, max_shots=2000, seed=3)
+    play(experiment, [0.3, 0.9, 0.3], random.Random(3))
+    assert experiment.decided and experiment.conclusive
+    assert experiment.winner is experiment.arms[1]
+    assert max(experiment.probabilities) >= 0.95
+    assert experiment.total < experiment.max_shots
+
+
+def test_gives_a_best_guess_at_max_shots_without_a_winner():
+    experiment = SensExperiment(CANDIDATES[:2], min_shots=20, max_shots=120, seed=4)
+    play(experiment, [0.5, 0.5], random.Random(4))
+    assert experiment.decided and not experiment.conclusive
+    assert experiment.total == experiment.max_shots
+    assert experiment.winner in experiment.arms
+    assert not experiment.record(HIT)  # Nothing more is recorded once decided
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from src.services import DROP_NEWEST, DROP_OLDEST, LATEST, Channel, ServiceLoop
+
+
+@pytest.fixture
+def services():
+    services = ServiceLoop(name='test-services').start()
+    yield services
+    services.stop()
+
+
+async def snapshot(channel):
+    return list(channel.items), channel.dropped, channel.unfinished
+
+
+def fill(services, overflow, count=5, maxsize=3):
+    channel = Channel(services, maxsize=maxsize, overflow=overflow)
+    for item in range(count):
+        assert channel.offer(item)
+    return services.run(snapshot(channel), "snapshot")  # Runs after the queued offers
+
+
+def test_drop_newest_keeps_what_is_queued(services):
+    assert fill(services, DROP_NEWEST) == ([0, 1, 2], 2, 3)
+
+
+def test_drop_oldest_makes_room_for_new_items(services):
+    assert fill(services, DROP_OLDEST) == ([2, 3, 4], 2, 3)
+
+
+def test_latest_keeps_only_the_newest_item(services):
+    assert fill(services, LATEST, maxsize=100) == ([4], 4, 1)
+
+
+def test_put_waits_for_room_instead_of_dropping(services):
+    async def scenario():
+        channel = Channel(services, maxsize=2)
+        await channel.put(0)
+        await channel.put(1)
+        blocked = asyncio.ensure_future(channel.put(2))
+        await asyncio.sleep(0.05)
+        assert not blocked.done() and list(channel.items) == [0, 1]
+        assert await channel.get() == 0
+        await asyncio.wait_for(blocked, 1.0)
+        return list(channel.items), channel.dropped
+
+    assert services.run(scenario(), "backpressure") == ([1, 2], 0)
+
+
+def test_join_waits_for_task_done(services):
+    async def scenario():
+        channel = Channel(services, maxsize=4)
+        await channel.put('a')
+        await channel.put('b')
+        joined = asyncio.ensure_future(channel.join())
+        batch = await channel.get_batch(10, 0.01)
+        await asyncio.sleep(0.01)
+        assert batch == ['a', 'b'] and not joined.done()
+        channel.task_done(len(batch))
+        await asyncio.wait_for(joined, 1.0)
+        return True
+
+    assert services.run(scenario(), "join")
+
+
+def test_offer_after_stop_is_counted_as_dropped():
+    services = ServiceLoop(name='test-stopped').start()
+    channel = Channel(services)
+    services.stop()
+    assert not channel.offer('late')
+    assert channel.dropped == 1
+
+
+def test_tk_callbacks_wake_the_tk_thread_once_per_batch(services):
+    wakes = []
+    services.tk_waker = lambda: wakes.append(True)
+    ran = []
+
+    async def queue_two():
+        services.call_in_tk(ran.append, 1)
+        services.call_in_tk(ran.append, 2)
+
+    services.run(queue_two(), "queue")
+    assert wakes == [True] and ran == []
+    services.dispatch_tk()
+    assert ran == [1, 2]
+    services.run(queue_two(), "queue again")
+    assert len(wakes) == 2